@@ -0,0 +1,106 @@
+"""
+Times dabextract against the PyQuery extraction it replaced, on sample
+pages rebuilt from the fixture behind dabserver's /fake/ route.
+
+    python bench_extract.py [iterations]
+"""
+import sys
+import time
+from pyquery import PyQuery as pq
+
+import dabextract
+from dabserver import fake_dabs
+from fakewiki import article_html, dab_page_html
+
+
+def sample_pages():
+    "Returns (articles, dab_pages) as lists of HTML strings."
+    articles, dab_pages = [], {}
+    for dab in fake_dabs()['dabs']:
+        articles.append(article_html(dab))
+        dab_pages[dab['title']] = dab_page_html(dab['options'])
+    return articles, dab_pages.values()
+
+
+# The PyQuery extraction, as it was in dabnabbit
+
+def pq_get_context(dab_a):
+    d = dab_a(dab_a.parents()[0])
+    d(dab_a).addClass('dab-link')
+    link_parents = dab_a.parents()
+    cand_contexts = [ p for p in link_parents
+                      if p.text_content() and len(p.text_content().split()) > 30 ]
+    chosen_context = cand_contexts[-1]
+    d(chosen_context).addClass('dab-context')
+    return d(chosen_context)
+
+def pq_extract_dab_links(text):
+    ret = []
+    d = pq(text)
+    images_found = [img.attrib['src']
+                    for img in d('img.thumbimage')
+                    if img.attrib.get('src')][:3]
+    dab_link_markers = d('span:contains("disambiguation needed")')
+    for i, dlm in enumerate(dab_link_markers):
+        try:
+            dab_link = d(dlm).parents("sup")[0].getprevious()
+            dab_link = d(dab_link)
+        except Exception as e:
+            continue
+        if dab_link.is_('a'):
+            context = pq_get_context(dab_link)
+            ret.append(dabextract.DabLink(dab_link.attr('title'),
+                                          context.outerHtml(),
+                                          i))
+    return images_found, ret
+
+def pq_extract_dab_choices(text):
+    d = pq(text)
+    if not d('table#disambigbox'):
+        return None
+    d('table#toc').remove()
+    ret = []
+    liasons = set([ d(a).parents('li')[-1] for a in d('li a') ])
+    for lia in liasons:
+        title = d(lia).find('a:first').attr('title')
+        text = lia.text_content().strip()
+        if title and text:
+            ret.append((title, text))
+    return ret
+
+
+def run(name, extract_links, extract_choices, articles, dab_pages, iterations):
+    start = time.time()
+    for i in range(iterations):
+        links = [ extract_links(a) for a in articles ]
+        choices = [ extract_choices(p) for p in dab_pages ]
+    dur = time.time() - start
+    page_count = (len(articles) + len(dab_pages)) * iterations
+    print '%-10s %8.3f s  %8.3f ms/page' % (name, dur, 1000 * dur / page_count)
+    return dur, links, choices
+
+
+def main(iterations=20):
+    articles, dab_pages = sample_pages()
+    print len(articles), 'articles,', len(dab_pages), 'dab pages,',
+    print iterations, 'iterations'
+
+    pq_dur, pq_links, pq_choices = run('pyquery', pq_extract_dab_links,
+                                       pq_extract_dab_choices,
+                                       articles, dab_pages, iterations)
+    lx_dur, lx_links, lx_choices = run('dabextract', dabextract.extract_dab_links,
+                                       dabextract.extract_dab_choices,
+                                       articles, dab_pages, iterations)
+    print 'speedup: %.1fx' % (pq_dur / lx_dur)
+
+    for (pq_imgs, pq_dls), (lx_imgs, lx_dls) in zip(pq_links, lx_links):
+        assert pq_imgs == lx_imgs
+        assert [ (dl.title, dl.source_order) for dl in pq_dls ] == \
+               [ (dl.title, dl.source_order) for dl in lx_dls ]
+    for pq_c, lx_c in zip(pq_choices, lx_choices):
+        assert sorted(pq_c) == sorted(lx_c)
+    print 'results match'
+
+
+if __name__ == '__main__':
+    main(*[ int(a) for a in sys.argv[1:] ])
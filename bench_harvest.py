@@ -0,0 +1,79 @@
+"""
+Harvests a fakewiki end to end and times drawing dabblets from the
+result, so harvester and serving changes can be compared run to run.
+Draws are from the stored pool (dabase.get_random_dabblets and
+get_random_payloads), not dabnabbit.get_random_dabblets, which
+fetches live pages and would only time the fake wiki.
+Runs in a scratch directory, so every run starts with empty databases.
+
+    python bench_harvest.py [copies] [latency_ms] [error_rate] [draws] [parse_procs]
+"""
+import dabnabbit # first, it monkey patches
+
+import os
+import sys
+import time
+import random
+import shutil
+import resource
+import tempfile
+
+import dabase
+import dabmetrics
+from fakewiki import FakeWiki
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def bench_harvest(wiki, parse_procs=0):
+    dabmetrics.reset()
+    start = time.time()
+    stats = dabnabbit.save_a_bunch(wiki.article_count, db_name='bench',
+                                   parse_procs=parse_procs)
+    dur = time.time() - start
+
+    print
+    print '%d pages in %.2f s: %.1f pages/s, %.1f dabblets/s' % \
+        (stats['pages'], dur, stats['pages'] / dur, stats['dabblets'] / dur)
+    print 'API requests:', sum(wiki.requests.values()), wiki.requests
+    print 'peak RSS: %.1f MB' % peak_rss_mb()
+    print 'stage time (s):',
+    stages = dabmetrics.snapshot()['histograms'].get('harvest_stage', {})
+    print ', '.join([ '%s %.3f' % (k.split('=')[1], h['total'])
+                      for k, h in sorted(stages.items()) ])
+    return stats, dur
+
+
+def bench_draws(draws):
+    for name, func in [('get_random_dabblets', dabase.get_random_dabblets),
+                       ('get_random_payloads', dabase.get_random_payloads)]:
+        start = time.time()
+        for i in range(draws):
+            func(5)
+        dur = time.time() - start
+        print '%-20s %8.3f ms/draw of 5' % (name, 1000 * dur / draws)
+
+
+def main(copies=20, latency_ms=20, error_rate=0, draws=1000, parse_procs=0):
+    random.seed(0)
+    wiki = FakeWiki(copies=int(copies), latency=float(latency_ms) / 1000,
+                    jitter=float(latency_ms) / 2000, error_rate=float(error_rate))
+    dabnabbit.API_URL = wiki.serve()
+    print wiki.article_count, 'articles,', latency_ms, 'ms latency,', \
+        error_rate, 'error rate,', parse_procs, 'parse processes'
+
+    old_cwd, tmp_dir = os.getcwd(), tempfile.mkdtemp(prefix='bench_harvest')
+    os.chdir(tmp_dir)
+    try:
+        bench_harvest(wiki, int(parse_procs))
+        bench_draws(int(draws))
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(tmp_dir)
+        wiki.server.stop()
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
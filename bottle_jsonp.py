@@ -7,6 +7,11 @@ from bottle import request, response, route
 from bottle import install, uninstall
 
 from json import dumps as json_dumps
+from hashlib import md5
+
+
+class RawJSON(str):
+    "A response that's already serialized; it's sent as is."
 
 
 class JSONAPIPlugin(object):
@@ -24,7 +29,10 @@ class JSONAPIPlugin(object):
             r = callback(*a, **ka)
 
             # Attempt to serialize, raises exception on failure
-            json_response = dumps(r)
+            if isinstance(r, RawJSON):
+                json_response = r
+            else:
+                json_response = dumps(r)
 
             # Set content type only if serialization succesful
             response.content_type = 'application/json'
@@ -34,6 +42,16 @@ class JSONAPIPlugin(object):
             if callback_function:
                 json_response = ''.join([callback_function, '(', json_response, ')'])
 
+            # Let clients revalidate instead of downloading it again
+            if request.method in ('GET', 'HEAD'):
+                etag = '"%s"' % md5(json_response.encode('utf-8')).hexdigest()
+                response.set_header('ETag', etag)
+                if_none_match = request.headers.get('If-None-Match', '')
+                if etag in [t.strip() for t in if_none_match.split(',')] \
+                   or if_none_match.strip() == '*':
+                    response.status = 304
+                    return ''
+
             return json_response
         return wrapper
 
@@ -1,13 +1,118 @@
+import json
+import random
 import peewee as pw
 from datetime import datetime
+from collections import OrderedDict
 
 dab_db = pw.SqliteDatabase(None) #deferred initialization
 
-def init(db_name, **kwargs):
+PAYLOAD_CACHE_SIZE = 20000 # serialized dabblets kept in memory
+SQLITE_MAX_VARS = 500 # ids per IN (...), well under SQLite's 999 bound variables
+CONSENSUS_VOTES = 3 # votes for one choice that settle a dabblet
+
+def init(db_name, journal_mode='WAL', synchronous='NORMAL', cache_size=None, **kwargs):
+    """
+    journal_mode, synchronous and cache_size are passed straight to
+    the SQLite PRAGMAs of the same names. None leaves SQLite's default.
+    """
     dab_db.init(str(db_name)+'.db', **kwargs)
     dab_db.connect()
+    if journal_mode:
+        dab_db.execute('PRAGMA journal_mode=%s;' % journal_mode)
+    if synchronous:
+        dab_db.execute('PRAGMA synchronous=%s;' % synchronous)
+    if cache_size:
+        dab_db.execute('PRAGMA cache_size=%d;' % cache_size)
+    DabPage.create_table(fail_silently=True)
     Dabblet.create_table(fail_silently=True)
     DabChoice.create_table(fail_silently=True)
+    CrawlCategory.create_table(fail_silently=True)
+    CrawlMember.create_table(fail_silently=True)
+    DabStat.create_table(fail_silently=True)
+    DabbletSolution.create_table(fail_silently=True)
+    SolutionTally.create_table(fail_silently=True)
+    migrated = _migrate()
+    for index_sql in INDEXES:
+        dab_db.execute(index_sql)
+    for name in STATS:
+        dab_db.execute('INSERT OR IGNORE INTO dabstat (name, value) VALUES (?, 0);', (name,))
+    if migrated:
+        rebuild_stats()
+
+
+# columns added since their tables were first made: (table, column, definition)
+ADDED_COLUMNS = [('dabblet',     'dab_page_id', 'INTEGER REFERENCES dabpage (id)'),
+                 ('dabblet',     'is_solved',   'SMALLINT NOT NULL DEFAULT 0'),
+                 ('dabblet',     'is_stale',    'SMALLINT NOT NULL DEFAULT 0'),
+                 ('dabblet',     'is_written',  'SMALLINT NOT NULL DEFAULT 0'),
+                 ('crawlmember', 'harvested',   'SMALLINT NOT NULL DEFAULT 0')]
+
+def _columns(table):
+    return [ row[1] for row in dab_db.execute('PRAGMA table_info(%s);' % table) ]
+
+@dab_db.commit_on_success
+def _migrate():
+    "Brings tables made by older versions up to the current models. True if any were."
+    migrated = False
+    for table, column, definition in ADDED_COLUMNS:
+        if column not in _columns(table):
+            dab_db.execute('ALTER TABLE %s ADD COLUMN %s %s;' % (table, column, definition))
+            migrated = True
+    if 'dabblet_id' in _columns('dabchoice'):
+        _migrate_choices()
+        migrated = True
+    return migrated
+
+def _migrate_choices():
+    """
+    Rekeys old per-dabblet choices to a DabPage per dabblet, at revid 0
+    so it's refetched when next needed. Choice ids are kept.
+    """
+    dab_db.execute('ALTER TABLE dabchoice RENAME TO dabchoice_old;')
+    DabChoice.create_table()
+    now = datetime.now()
+    for dabblet_id, title in dab_db.execute('SELECT DISTINCT c.dabblet_id, d.title FROM dabchoice_old c '
+                                            'JOIN dabblet d ON d.id = c.dabblet_id;').fetchall():
+        dab_page_id = dab_db.execute('INSERT INTO dabpage (title, pageid, revid, fetch_date) '
+                                     'VALUES (?, 0, 0, ?);', (title, now)).lastrowid
+        dab_db.execute('UPDATE dabblet SET dab_page_id = ? WHERE id = ?;', (dab_page_id, dabblet_id))
+        dab_db.execute('INSERT INTO dabchoice (id, dab_page_id, title, text) '
+                       'SELECT id, ?, title, text FROM dabchoice_old WHERE dabblet_id = ?;',
+                       (dab_page_id, dabblet_id))
+    dab_db.execute('DROP TABLE dabchoice_old;')
+
+
+# beyond the single column ones peewee makes for db_index and foreign keys
+INDEXES = ['DROP INDEX IF EXISTS dabblet_unsolved;', # superseded by dabblet_pool
+           'CREATE INDEX IF NOT EXISTS dabblet_pool ON dabblet (is_solved, is_stale, id);',
+           'CREATE INDEX IF NOT EXISTS dabblet_source ON dabblet (source_pageid, source_order);',
+           'CREATE INDEX IF NOT EXISTS dabblet_title ON dabblet (title);',
+           'CREATE INDEX IF NOT EXISTS dabpage_title_rev ON dabpage (title, revid);',
+           'CREATE UNIQUE INDEX IF NOT EXISTS crawlcategory_title ON crawlcategory (title);',
+           'CREATE UNIQUE INDEX IF NOT EXISTS crawlmember_page ON crawlmember (category_id, pageid);',
+           'CREATE INDEX IF NOT EXISTS crawlmember_pageid ON crawlmember (pageid);',
+           'CREATE INDEX IF NOT EXISTS crawlmember_unharvested ON crawlmember (category_id, harvested, ns);',
+           'CREATE UNIQUE INDEX IF NOT EXISTS dabstat_name ON dabstat (name);',
+           'CREATE UNIQUE INDEX IF NOT EXISTS solutiontally_choice ON solutiontally (dabblet_id, choice_id);',
+           'CREATE INDEX IF NOT EXISTS solutiontally_votes ON solutiontally (dabblet_id, votes);']
+
+STATS = ['dabblets',
+         'dabblets_solved',
+         'dabblets_served',
+         'dabblets_stale',
+         'solutions',
+         'dab_pages',
+         'choices',
+         'dabblet_choices', # choices summed over dabblets
+         'source_pages',    # articles with dabblets
+         'difficulty_total',
+         'difficulty_count',
+         'solved_difficulty_total',
+         'solved_difficulty_count']
+
+
+def is_ready():
+    return not dab_db.deferred
 
 
 class DabModel(pw.Model):
@@ -15,6 +120,28 @@ class DabModel(pw.Model):
         database = dab_db
 
 
+class DabPage(DabModel):
+    """
+    A disambiguation page as it stood at one revision. Its choices are
+    parsed once and shared by every Dabblet linking to that title.
+    """
+    title      = pw.CharField() # as linked, before redirects
+    pageid     = pw.IntegerField()
+    revid      = pw.IntegerField()
+    fetch_date = pw.DateTimeField()
+
+    @classmethod
+    def from_page(cls, dab_page, choices):
+        "choices are (title, text) pairs, saved along with the DabPage"
+        ret = cls(title = dab_page.req_title,
+                  pageid = dab_page.pageid,
+                  revid = dab_page.revisionid,
+                  fetch_date = datetime.now())
+        ret.new_choices = [ DabChoice(dab_page=ret, title=title, text=text)
+                            for title, text in choices ]
+        return ret
+
+
 class Dabblet(DabModel):
     title   = pw.CharField()
     context = pw.TextField()
@@ -29,6 +156,11 @@ class Dabblet(DabModel):
 
     difficulty    = pw.IntegerField()
     viability     = pw.IntegerField()
+
+    dab_page      = pw.ForeignKeyField(DabPage, null=True, related_name='dabblets')
+    is_solved     = pw.BooleanField(default=False)
+    is_stale      = pw.BooleanField(default=False) # source edited since harvest
+    is_written    = pw.BooleanField(default=False) # solution written back, or nothing left to fix
     
     @classmethod
     def from_page(cls, title, context, source_page, source_order, 
@@ -46,8 +178,19 @@ class Dabblet(DabModel):
         ret.source_page = source_page
         return ret
 
+    @property
+    def options(self):
+        if self.dab_page_id:
+            dab_page = self.dab_page
+            if hasattr(dab_page, 'prefetched_choices'):
+                return dab_page.prefetched_choices
+            return dab_page.choices
+        # not saved yet, but the choices may have been fetched
+        return getattr(_assigned(self, 'dab_page'), 'new_choices', [])
+
     def _asdict(self):
-        return {'title': self.title,
+        return {'id': self.id,
+                'title': self.title,
                 'source_title': self.source_title,
                 'context': self.context,
                 'images': self.source_images,
@@ -56,14 +199,15 @@ class Dabblet(DabModel):
 
 
 class DabChoice(DabModel):
-    dabblet = pw.ForeignKeyField(Dabblet, related_name='choices')
-    title   = pw.CharField()
-    text    = pw.TextField()
+    dab_page = pw.ForeignKeyField(DabPage, related_name='choices')
+    title    = pw.CharField()
+    text     = pw.TextField()
 
     def _asdict(self):
-        return { 'title':     self.title,
+        return { 'id':        self.id,
+                 'title':     self.title,
                  'text':      self.text,
-                 'dab_title': self.dabblet.title }
+                 'dab_title': self.dab_page.title }
 
 
 class DabbletSolution(DabModel):
@@ -74,20 +218,559 @@ class DabbletSolution(DabModel):
     date_solved = pw.DateTimeField(db_index=True)
 
 
+class SolutionTally(DabModel):
+    """
+    Votes for one choice of one dabblet, bumped by save_solutions(),
+    so a dabblet's leading choice is an index seek, not a count.
+    """
+    dabblet = pw.ForeignKeyField(Dabblet, related_name='tallies')
+    choice  = pw.ForeignKeyField(DabChoice, related_name='tallies')
+    votes   = pw.IntegerField()
+
+
+class CrawlCategory(DabModel):
+    """
+    Where the last crawl of a category got to: watermark is the newest
+    member timestamp seen, cmstart and cmcontinue are only set mid-crawl.
+    """
+    title        = pw.CharField()
+    watermark    = pw.CharField(null=True)
+    cmstart      = pw.CharField(null=True) # '' for a full crawl
+    cmcontinue   = pw.CharField(null=True)
+    generation   = pw.IntegerField() # bumped by every full crawl
+    member_count = pw.IntegerField()
+    last_crawl   = pw.DateTimeField(null=True)
+
+
+class CrawlMember(DabModel):
+    category   = pw.ForeignKeyField(CrawlCategory, related_name='members')
+    pageid     = pw.IntegerField()
+    ns         = pw.IntegerField()
+    title      = pw.CharField()
+    timestamp  = pw.CharField() # when it was added to the category
+    generation = pw.IntegerField()
+    harvested  = pw.BooleanField(default=False) # fetched and searched for dabblets
+
+
+class DabStat(DabModel):
+    """
+    A running total behind get_stats(), bumped in the same transaction
+    as the rows it counts.
+    """
+    name  = pw.CharField()
+    value = pw.IntegerField()
+
+
+def get_crawl_category(title):
+    try:
+        return CrawlCategory.get(title=title)
+    except CrawlCategory.DoesNotExist:
+        return CrawlCategory.create(title=title, generation=0, member_count=0)
+
+
+@dab_db.commit_on_success
+def save_crawl_members(cat, members):
+    """
+    Stores a page of CategoryMembers and the crawl's progress on cat,
+    keeping pages already harvested marked harvested.
+    """
+    rows = [ (cat.id, m.pageid, m.ns, m.title, m.timestamp, cat.generation, m.pageid)
+             for m in members ]
+    dab_db.get_cursor().executemany(
+        'INSERT OR REPLACE INTO crawlmember '
+        '(category_id, pageid, ns, title, timestamp, generation, harvested) '
+        'VALUES (?, ?, ?, ?, ?, ?, '
+        'COALESCE((SELECT MAX(harvested) FROM crawlmember WHERE pageid = ?), 0));', rows)
+    for m in members:
+        if cat.watermark is None or m.timestamp > cat.watermark:
+            cat.watermark = m.timestamp
+    cat.save()
+
+
+@dab_db.commit_on_success
+def finish_crawl(cat, full=False):
+    "Drops members a full crawl didn't see, and clears the cursor."
+    if full:
+        CrawlMember.delete().where(category=cat.id,
+                                   generation__lt=cat.generation).execute()
+    cat.cmstart = cat.cmcontinue = None
+    cat.member_count = CrawlMember.select().where(category=cat.id).count()
+    cat.last_crawl = datetime.now()
+    cat.save()
+
+
+def get_subcategories(cat):
+    return [ m.title for m in
+             CrawlMember.select(['title']).where(category=cat.id, ns=14) ]
+
+
+def get_category_pageids(title, count=None, unharvested=False):
+    """
+    Page ids stored for a category and its subcategories, only the
+    unharvested ones with unharvested.
+    """
+    cat_ids, seen, level = [], set([title]), [title]
+    while level:
+        cats = list(CrawlCategory.select().where(title__in=level))
+        cat_ids.extend([ c.id for c in cats ])
+        level = []
+        for c in cats:
+            for sub in get_subcategories(c):
+                if sub not in seen:
+                    seen.add(sub)
+                    level.append(sub)
+    if not cat_ids:
+        return []
+    query = CrawlMember.select(['pageid']).where(category__in=cat_ids,
+                                                 ns__ne=14).distinct()
+    if unharvested:
+        query = query.where(harvested=False)
+    if count is not None:
+        query = query.limit(count)
+    return [ m.pageid for m in query ]
+
+
+def _chunks(ids):
+    "ids in lists short enough to bind in one query."
+    ids = list(ids)
+    return [ ids[i:i+SQLITE_MAX_VARS] for i in range(0, len(ids), SQLITE_MAX_VARS) ]
+
+def _placeholders(chunk):
+    return ', '.join(['?'] * len(chunk))
+
+
+def _mark_harvested(page_ids):
+    for chunk in _chunks(page_ids):
+        dab_db.execute('UPDATE crawlmember SET harvested = 1 WHERE pageid IN (%s);'
+                       % _placeholders(chunk), chunk)
+
+@dab_db.commit_on_success
+def mark_harvested(page_ids):
+    "Records pages as harvested, for pages that turned up no dabblets."
+    _mark_harvested(page_ids)
+
+
+def _assigned(obj, fk_name):
+    "The object assigned to a foreign key, without querying for it."
+    return getattr(obj, '_cache_' + fk_name, None)
+
+def _insert_sql(model):
+    fields = [ f for f in model._meta.get_fields()
+               if f.name != model._meta.pk_name ]
+    sql = 'INSERT INTO %s (%s) VALUES (%s);' % (
+        dab_db.quote_name(model._meta.db_table),
+        ', '.join([ dab_db.quote_name(f.db_column) for f in fields ]),
+        ', '.join([ '?' for f in fields ]))
+    return sql, fields
+
+def _insert_row(obj, fields):
+    field_dict = obj.get_field_dict()
+    return [ f.db_value(field_dict[f.name]) for f in fields ]
+
+@dab_db.commit_on_success
+def save_dabblets(dabblets):
+    """
+    Inserts a batch of Dabblets, with any new DabPages and DabChoices
+    they point at, in one transaction, and marks their sources harvested.
+    """
+    cursor = dab_db.get_cursor()
+    new_pages, seen = [], set()
+    for d in dabblets:
+        dp = _assigned(d, 'dab_page')
+        if dp is not None and dp.id is None and id(dp) not in seen:
+            new_pages.append(dp)
+            seen.add(id(dp))
+
+    sql, fields = _insert_sql(DabPage)
+    for dp in new_pages:
+        cursor.execute(sql, _insert_row(dp, fields))
+        dp.id = cursor.lastrowid
+
+    sql, fields = _insert_sql(DabChoice)
+    rows, choice_counts = [], {}
+    for dp in new_pages:
+        for c in dp.new_choices:
+            c.dab_page_id = dp.id
+            rows.append(_insert_row(c, fields))
+        choice_counts[dp.id] = len(dp.new_choices)
+        dp.new_choices = []
+    cursor.executemany(sql, rows)
+
+    source_ids = set([ d.source_pageid for d in dabblets ])
+    new_sources = filter_new_sources(source_ids)
+    _mark_harvested(source_ids)
+
+    sql, fields = _insert_sql(Dabblet)
+    for d in dabblets:
+        dp = _assigned(d, 'dab_page')
+        if dp is not None:
+            d.dab_page_id = dp.id
+        cursor.execute(sql, _insert_row(d, fields))
+        d.id = cursor.lastrowid
+
+    choice_counts.update(_count_choices([ d.dab_page_id for d in dabblets
+                                          if d.dab_page_id not in choice_counts ]))
+    # peewee stores an unset difficulty as 0, so 0 counts as unrated
+    difficulties = [ d.difficulty for d in dabblets if d.difficulty ]
+    _bump_stats({'dabblets':         len(dabblets),
+                 'dab_pages':        len(new_pages),
+                 'choices':          len(rows),
+                 'dabblet_choices':  sum([ choice_counts.get(d.dab_page_id, 0)
+                                           for d in dabblets ]),
+                 'source_pages':     len(new_sources),
+                 'difficulty_total': sum(difficulties),
+                 'difficulty_count': len(difficulties)})
+    return len(rows)
+
+
+def _count_choices(dab_page_ids):
+    dab_page_ids = list(set([ i for i in dab_page_ids if i ]))
+    if not dab_page_ids:
+        return {}
+    return dict(dab_db.execute('SELECT dab_page_id, COUNT(*) FROM dabchoice '
+                               'WHERE dab_page_id IN (%s) GROUP BY dab_page_id;'
+                               % ', '.join(['?'] * len(dab_page_ids)),
+                               dab_page_ids).fetchall())
+
+
+_unflushed = {'dabblets_served': 0} # too frequent to write one at a time
+
+def _bump_stats(counts):
+    dab_db.get_cursor().executemany(
+        'UPDATE dabstat SET value = value + ? WHERE name = ?;',
+        [ (n, name) for name, n in counts.items() if n ])
+
+
+def record_served(count):
+    _unflushed['dabblets_served'] += count
+
+
+@dab_db.commit_on_success
+def flush_stats():
+    counts = dict(_unflushed)
+    for name in _unflushed:
+        _unflushed[name] = 0
+    _bump_stats(counts)
+
+
+def _ratio(num, denom):
+    return float(num) / denom if denom else None
+
+
+def get_stats():
+    "The counters and the averages that follow from them."
+    ret = dict([ (st.name, st.value) for st in DabStat.select() ])
+    for name, n in _unflushed.items():
+        ret[name] += n
+    ret['avg_choices_per_dabblet'] = _ratio(ret['dabblet_choices'], ret['dabblets'])
+    ret['avg_dabblets_per_page'] = _ratio(ret['dabblets'], ret['source_pages'])
+    ret['avg_difficulty'] = _ratio(ret['difficulty_total'], ret['difficulty_count'])
+    ret['avg_solved_difficulty'] = _ratio(ret['solved_difficulty_total'],
+                                          ret['solved_difficulty_count'])
+    return ret
+
+
+_STATS_SQL = [
+    ('dabblets, source_pages, difficulty_total, difficulty_count',
+     'SELECT COUNT(*), COUNT(DISTINCT source_pageid), '
+     'COALESCE(SUM(difficulty), 0), COUNT(NULLIF(difficulty, 0)) FROM dabblet;'),
+    ('dabblets_solved, solved_difficulty_total, solved_difficulty_count',
+     'SELECT COUNT(*), COALESCE(SUM(difficulty), 0), COUNT(NULLIF(difficulty, 0)) '
+     'FROM dabblet WHERE is_solved = 1;'),
+    ('dabblets_stale', 'SELECT COUNT(*) FROM dabblet WHERE is_stale = 1;'),
+    ('dab_pages', 'SELECT COUNT(*) FROM dabpage;'),
+    ('choices', 'SELECT COUNT(*) FROM dabchoice;'),
+    ('solutions', 'SELECT COUNT(*) FROM dabbletsolution;'),
+    ('dabblet_choices',
+     'SELECT COUNT(*) FROM dabblet JOIN dabchoice '
+     'ON dabchoice.dab_page_id = dabblet.dab_page_id;')]
+
+@dab_db.commit_on_success
+def rebuild_stats():
+    """
+    Recounts the stats from the tables. dabblets_served isn't recorded
+    anywhere else, so it's left alone.
+    """
+    rows = []
+    for names, sql in _STATS_SQL:
+        values = dab_db.execute(sql).fetchone()
+        rows.extend(zip(values, [ n.strip() for n in names.split(',') ]))
+    dab_db.get_cursor().executemany('UPDATE dabstat SET value = ? WHERE name = ?;', rows)
+
+
+def count_unsolved():
+    "Dabblets in the serving pool: unsolved and not stale."
+    return Dabblet.select().where(is_solved=False, is_stale=False).count()
+
+
+_POOL_RANGE = 'SELECT MIN(id), MAX(id) FROM dabblet WHERE is_solved = 0 AND is_stale = 0;'
+_IN_POOL = 'SELECT id FROM dabblet WHERE is_solved = 0 AND is_stale = 0 AND id = ?;'
+_NEXT_UNSOLVED = 'SELECT id FROM dabblet WHERE is_solved = 0 AND is_stale = 0 AND id >= ? ' \
+                 'ORDER BY id LIMIT 1;'
+RANDOM_TRIES = 20 # misses per id wanted before falling back to the next pooled id
+
+def _random_unsolved_ids(count):
+    """
+    Draws up to count distinct ids, uniformly, from the serving pool by
+    picking ids in the pool's id range and retrying on misses.
+    """
+    min_id, max_id = dab_db.execute(_POOL_RANGE).fetchone()
+    if not max_id:
+        return []
+    ids = []
+    for i in range(count * RANDOM_TRIES):
+        if len(ids) >= count:
+            return ids
+        draw = random.randint(min_id, max_id)
+        if draw not in ids and dab_db.execute(_IN_POOL, (draw,)).fetchone():
+            ids.append(draw)
+    # a sparse pool: settle for the next pooled id after each draw
+    for i in range(count * 3):
+        if len(ids) >= count:
+            break
+        row = dab_db.execute(_NEXT_UNSOLVED, (random.randint(min_id, max_id),)).fetchone()
+        if row[0] not in ids:
+            ids.append(row[0])
+    return ids
+
+
+def get_random_dabblets(count=5):
+    ids = _random_unsolved_ids(count)
+    if not ids:
+        return []
+    return list(Dabblet.select().where(id__in=ids))
+
+
+def prefetch_choices(dabblets):
+    "Loads the DabPages and DabChoices behind a batch of dabblets in two queries."
+    page_ids = list(set([ d.dab_page_id for d in dabblets if d.dab_page_id ]))
+    if not page_ids:
+        return dabblets
+    pages = dict([ (dp.id, dp) for dp in
+                   DabPage.select().where(id__in=page_ids) ])
+    for dp in pages.values():
+        dp.prefetched_choices = []
+    for choice in DabChoice.select().where(dab_page__in=page_ids).order_by('id'):
+        dp = pages[choice.dab_page_id]
+        choice._cache_dab_page = dp
+        dp.prefetched_choices.append(choice)
+    for d in dabblets:
+        if d.dab_page_id in pages:
+            d._cache_dab_page = pages[d.dab_page_id]
+    return dabblets
+
+
+_payloads = OrderedDict() # dabblet id -> JSON of its _asdict(), oldest use first
+
+def get_payloads(dabblet_ids):
+    """
+    The serialized _asdict() of each dabblet, in order. Cached ones
+    cost nothing; the rest are loaded and prefetched together.
+    """
+    missing = [ i for i in dabblet_ids if i not in _payloads ]
+    if missing:
+        dabblets = prefetch_choices(list(Dabblet.select().where(id__in=missing)))
+        for d in dabblets:
+            _payloads[d.id] = json.dumps(d._asdict())
+    ret = []
+    for i in dabblet_ids:
+        payload = _payloads.pop(i, None)
+        if payload is not None:
+            _payloads[i] = payload
+            ret.append(payload)
+    while len(_payloads) > PAYLOAD_CACHE_SIZE:
+        _payloads.popitem(last=False)
+    return ret
+
+
+def get_random_payloads(count=5):
+    return get_payloads(_random_unsolved_ids(count))
+
+
+def forget_payloads(dabblet_ids):
+    "Call whenever a dabblet or what it points at changes."
+    for i in dabblet_ids:
+        _payloads.pop(i, None)
+
+
+@dab_db.commit_on_success
+def mark_solved(dabblet_ids):
+    return _mark_solved(dabblet_ids)
+
+
+def _mark_solved(dabblet_ids):
+    "Returns the ids that weren't already solved."
+    dabblet_ids = list(dabblet_ids)
+    if not dabblet_ids:
+        return []
+    newly_solved = list(Dabblet.select(['id', 'difficulty'])
+                               .where(id__in=dabblet_ids, is_solved=False))
+    if newly_solved:
+        Dabblet.update(is_solved=True).where(id__in=[ d.id for d in newly_solved ]).execute()
+    difficulties = [ d.difficulty for d in newly_solved if d.difficulty ]
+    _bump_stats({'dabblets_solved':         len(newly_solved),
+                 'solved_difficulty_total': sum(difficulties),
+                 'solved_difficulty_count': len(difficulties)})
+    forget_payloads(dabblet_ids)
+    return [ d.id for d in newly_solved ]
+
+
+def _valid_solutions(solutions):
+    "The solutions whose choice is one of their dabblet's."
+    dabblet_ids = list(set([ s.dabblet_id for s in solutions ]))
+    choice_ids = list(set([ s.choice_id for s in solutions ]))
+    dabblet_pages, choice_pages = {}, {}
+    for chunk in _chunks(dabblet_ids):
+        dabblet_pages.update([ (d.id, d.dab_page_id) for d in
+                               Dabblet.select(['id', 'dab_page_id']).where(id__in=chunk) ])
+    for chunk in _chunks(choice_ids):
+        choice_pages.update([ (c.id, c.dab_page_id) for c in
+                              DabChoice.select(['id', 'dab_page_id']).where(id__in=chunk) ])
+    return [ s for s in solutions
+             if dabblet_pages.get(s.dabblet_id) is not None
+             and dabblet_pages.get(s.dabblet_id) == choice_pages.get(s.choice_id) ]
+
+
+@dab_db.commit_on_success
+def save_solutions(solutions):
+    """
+    Group-commits DabbletSolutions and their tallies. Returns {dabblet id:
+    choice id} for the dabblets that just reached CONSENSUS_VOTES.
+    """
+    solutions = _valid_solutions(solutions)
+    cursor = dab_db.get_cursor()
+    sql, fields = _insert_sql(DabbletSolution)
+    cursor.executemany(sql, [ _insert_row(s, fields) for s in solutions ])
+
+    new_votes = {}
+    for s in solutions:
+        key = (s.dabblet_id, s.choice_id)
+        new_votes[key] = new_votes.get(key, 0) + 1
+    cursor.executemany('INSERT OR IGNORE INTO solutiontally (dabblet_id, choice_id, votes) '
+                       'VALUES (?, ?, 0);', new_votes.keys())
+    cursor.executemany('UPDATE solutiontally SET votes = votes + ? '
+                       'WHERE dabblet_id = ? AND choice_id = ?;',
+                       [ (n,) + key for key, n in new_votes.items() ])
+
+    reached = {}
+    for (dabblet_id, choice_id), n in new_votes.items():
+        votes = dab_db.execute('SELECT votes FROM solutiontally '
+                               'WHERE dabblet_id = ? AND choice_id = ?;',
+                               (dabblet_id, choice_id)).fetchone()[0]
+        if votes >= CONSENSUS_VOTES > votes - n:
+            reached[dabblet_id] = choice_id
+    solved = _mark_solved(reached.keys())
+    _bump_stats({'solutions': len(solutions)})
+    return dict([ (i, reached[i]) for i in solved ])
+
+
+def get_consensus(dabblet_id):
+    "(choice id, votes) for the dabblet's leading choice once it has CONSENSUS_VOTES, else None."
+    row = dab_db.execute('SELECT choice_id, votes FROM solutiontally WHERE dabblet_id = ? '
+                         'ORDER BY votes DESC LIMIT 1;', (dabblet_id,)).fetchone()
+    if row is not None and row[1] >= CONSENSUS_VOTES:
+        return tuple(row)
+    return None
+
+
+def get_unwritten_solutions():
+    "(dabblet, choice title) for each dabblet solved by consensus but not written back."
+    rows = dab_db.execute('SELECT t.dabblet_id, c.title FROM dabblet d '
+                          'JOIN solutiontally t ON t.dabblet_id = d.id '
+                          'JOIN dabchoice c ON c.id = t.choice_id '
+                          'WHERE d.is_solved = 1 AND d.is_written = 0 AND t.votes >= ? '
+                          'ORDER BY t.votes;', (CONSENSUS_VOTES,)).fetchall()
+    guesses = dict(rows) # the most votes wins
+    if not guesses:
+        return []
+    return [ (d, guesses[d.id]) for d in Dabblet.select().where(id__in=guesses.keys()) ]
+
+
+@dab_db.commit_on_success
+def mark_written(dabblet_ids):
+    for chunk in _chunks(dabblet_ids):
+        Dabblet.update(is_written=True).where(id__in=chunk).execute()
+
+
+def get_pool_sources():
+    "(source pageid, source revid) for every dabblet in the serving pool."
+    return dab_db.execute('SELECT DISTINCT source_pageid, source_revid FROM dabblet '
+                          'WHERE is_solved = 0 AND is_stale = 0;').fetchall()
+
+
+@dab_db.commit_on_success
+def mark_stale(current_revids):
+    """
+    Takes {source pageid: current revid or None} and drops pool dabblets
+    from any other revision. Returns their ids.
+    """
+    stale_ids = []
+    for pageid, revid in current_revids.items():
+        stale_ids.extend([ row[0] for row in
+                           dab_db.execute('SELECT id FROM dabblet WHERE source_pageid = ? '
+                                          'AND source_revid != ? AND is_solved = 0 AND is_stale = 0;',
+                                          (pageid, revid or -1)) ])
+    for chunk in _chunks(stale_ids):
+        Dabblet.update(is_stale=True).where(id__in=chunk).execute()
+    forget_payloads(stale_ids)
+    _bump_stats({'dabblets_stale': len(stale_ids)})
+    return stale_ids
+
+
+def get_solved_links(page_ids):
+    "(source pageid, title) of the solved dabblets from the given pages."
+    ret = set()
+    for chunk in _chunks(page_ids):
+        ret.update([ tuple(row) for row in
+                     dab_db.execute('SELECT DISTINCT source_pageid, title FROM dabblet '
+                                    'WHERE is_solved = 1 AND source_pageid IN (%s);'
+                                    % _placeholders(chunk), chunk) ])
+    return ret
+
+
+def filter_new_sources(page_ids):
+    "Returns the page ids that no stored Dabblet was taken from."
+    page_ids = list(page_ids)
+    known = set()
+    for chunk in _chunks(page_ids):
+        known.update([ d.source_pageid for d in
+                       Dabblet.select(['source_pageid'])
+                              .where(source_pageid__in=chunk) ])
+    return [ p for p in page_ids if p not in known ]
+
+
 def test():
     from datetime import datetime
     from dabnabbit import Page
 
     init('dabase_unittest')
+    rebuild_stats() # in case a failed run left them off
     sp = Page('first_source', 'first_source', 0, 0, 'first text', True, datetime.now())
     
     #da2 = Dabblet(title='first', context='first context', source_title='first source', source_pageid=0, source_revid=0, source_order=0, date_created=datetime.now())
     da2 = Dabblet.from_page('first dab title', 'first dab context', sp, 0, '')
     da2.save()
 
+    dp3 = DabPage.from_page(sp, [('second choice', 'second text')])
+    da3 = Dabblet.from_page('second dab title', 'second dab context', sp, 1, '')
+    da3.dab_page = dp3
+    save_dabblets([da3])
+    assert [ c.title for c in DabChoice.select().where(dab_page=dp3.id) ] == ['second choice']
+    assert [ c.title for c in Dabblet.get(id=da3.id).options ] == ['second choice']
+
     dabblets = [ d for d in Dabblet.select() ]
     print len(dabblets), 'Dabblets now in the test db'
 
+    stats = get_stats()
+    rebuild_stats() # picks up da2, saved the slow way
+    assert get_stats()['dabblets'] == stats['dabblets'] + 1 == len(dabblets)
+
 
 if __name__ == '__main__':
-    test()
+    import sys
+    if sys.argv[1:2] == ['rebuild_stats'] and len(sys.argv) == 3:
+        init(sys.argv[2])
+        rebuild_stats()
+        print get_stats()
+    else:
+        test()
@@ -0,0 +1,145 @@
+import time
+import peewee as pw
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024 # bytes of revision text
+
+cache_db = pw.SqliteDatabase(None) #deferred initialization
+_state = {'max_size': DEFAULT_MAX_SIZE,
+          'size':     0}
+
+def init(cache_name='dabcache', max_size=DEFAULT_MAX_SIZE, journal_mode='WAL',
+         synchronous='NORMAL', cache_size=None, **kwargs):
+    "The PRAGMAs are set as in dabase.init()."
+    cache_db.init(str(cache_name)+'.db', **kwargs)
+    cache_db.connect()
+    if journal_mode:
+        cache_db.execute('PRAGMA journal_mode=%s;' % journal_mode)
+    if synchronous:
+        cache_db.execute('PRAGMA synchronous=%s;' % synchronous)
+    if cache_size:
+        cache_db.execute('PRAGMA cache_size=%d;' % cache_size)
+    CachedPage.create_table(fail_silently=True)
+    cache_db.execute('CREATE UNIQUE INDEX IF NOT EXISTS cachedpage_key '
+                     'ON cachedpage (pageid, revid, is_parsed);')
+    _state['max_size'] = max_size
+    _state['size'] = _total_size()
+
+
+def is_ready():
+    return not cache_db.deferred
+
+
+class CachedPage(pw.Model):
+    class Meta:
+        database = cache_db
+
+    pageid     = pw.IntegerField()
+    revid      = pw.IntegerField()
+    is_parsed  = pw.BooleanField()
+    title      = pw.CharField(db_index=True)
+    text       = pw.TextField()
+    size       = pw.IntegerField()
+    fetch_date = pw.FloatField()
+    last_used  = pw.FloatField(db_index=True)
+
+
+def get(pageid, revid, is_parsed):
+    """
+    Returns (title, text, fetch_date) for an exact revision, or None.
+    Looking up an entry counts as a use for eviction purposes.
+    """
+    return get_many([(pageid, revid)], is_parsed).get(pageid)
+
+
+@cache_db.commit_on_success
+def get_many(revisions, is_parsed):
+    """
+    Takes (pageid, revid) pairs and returns a dict of pageid -> (title,
+    text, fetch_date) for the ones cached. All of their last_used
+    times are bumped in the one transaction.
+    """
+    wanted = dict(revisions)
+    found = {}
+    for cp in CachedPage.select(['id', 'pageid', 'revid', 'title', 'text', 'fetch_date']) \
+                        .where(pageid__in=wanted.keys(), is_parsed=is_parsed):
+        if wanted[cp.pageid] == cp.revid:
+            found[cp.pageid] = cp
+    if found:
+        CachedPage.update(last_used=time.time()) \
+                  .where(id__in=[ cp.id for cp in found.values() ]).execute()
+    return dict([ (pageid, (cp.title, cp.text, cp.fetch_date))
+                  for pageid, cp in found.items() ])
+
+
+def put(pageid, revid, is_parsed, title, text, fetch_date):
+    put_many([(pageid, revid, title, text, fetch_date)], is_parsed)
+
+
+@cache_db.commit_on_success
+def put_many(pages, is_parsed):
+    """
+    Caches (pageid, revid, title, text, fetch_date) tuples in one
+    transaction, replacing any other revisions of the same pages, and
+    evicts whatever no longer fits.
+    """
+    pages = dict([ (p[0], p) for p in pages if len(p[3]) <= _state['max_size'] ]).values()
+    if not pages:
+        return
+    # older revisions of the same page are never going to be asked for
+    _drop(CachedPage.select(['id', 'size'])
+                    .where(pageid__in=[ p[0] for p in pages ], is_parsed=is_parsed))
+    now = time.time()
+    cache_db.get_cursor().executemany(
+        'INSERT OR REPLACE INTO cachedpage '
+        '(pageid, revid, is_parsed, title, text, size, fetch_date, last_used) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?);',
+        [ (pageid, revid, is_parsed, title, text, len(text), fetch_date, now)
+          for pageid, revid, title, text, fetch_date in pages ])
+    _state['size'] += sum([ len(p[3]) for p in pages ])
+    evict()
+
+
+def evict(max_size=None):
+    "Drops least recently used pages until the cache fits in max_size."
+    if max_size is None:
+        max_size = _state['max_size']
+    while _state['size'] > max_size:
+        lru, excess = [], _state['size'] - max_size
+        for cp in CachedPage.select(['id', 'size']).order_by('last_used').limit(50):
+            lru.append(cp)
+            excess -= cp.size
+            if excess <= 0:
+                break
+        if not _drop(lru):
+            break
+
+
+def _drop(entries):
+    entries = [ (cp.id, cp.size) for cp in entries ]
+    if not entries:
+        return 0
+    CachedPage.delete().where(id__in=[e[0] for e in entries]).execute()
+    _state['size'] -= sum([e[1] for e in entries])
+    return len(entries)
+
+
+def _total_size():
+    res = cache_db.execute('SELECT SUM(size) FROM cachedpage;').fetchone()
+    return res[0] or 0
+
+
+def test():
+    init('dabcache_unittest', max_size=8)
+    put(1, 100, True, 'One', 'abcdef', time.time())
+    assert get(1, 100, True)[1] == 'abcdef'
+    assert get(1, 100, False) is None
+    put(1, 101, True, 'One', 'abcdefg', time.time())
+    assert get(1, 100, True) is None
+    put(2, 200, True, 'Two', 'xyz', time.time()) # over budget, evicts One
+    assert get(1, 101, True) is None
+    assert get(2, 200, True)[0] == 'Two'
+    print _state['size'], 'bytes now in the test cache'
+
+
+if __name__ == '__main__':
+    test()
@@ -0,0 +1,229 @@
+"""
+Pulls dab links and dab choices out of parsed page HTML using lxml
+and precompiled XPath. Everything here works on plain strings and
+returns plain tuples, so it doesn't need the models, the network or
+PyQuery.
+"""
+import re
+from collections import namedtuple
+from copy import deepcopy
+from lxml import etree
+import lxml.html
+
+DAB_MARKER = 'disambiguation needed'
+CONTEXT_MIN_WORDS = 30
+CONTEXT_MAX_WORDS = 300
+MAX_IMAGES = 3
+
+# images and dab markers, in document order, in a single pass
+_page_items = etree.XPath('//img[@src and contains(concat(" ", normalize-space(@class), " "), " thumbimage ")]'
+                          ' | //span[contains(., "%s")]' % DAB_MARKER)
+_outer_sup = etree.XPath('(ancestor::sup)[1]')
+_disambigbox = etree.XPath('//table[@id="disambigbox"]')
+# the innermost <li> around each link, skipping the table of contents
+_choice_items = etree.XPath('//a[not(ancestor::table[@id="toc"])]/ancestor::li[1]')
+_first_link = etree.XPath('(.//a)[1]')
+
+DabLink = namedtuple("DabLink", "title, context, source_order")
+
+
+def parse_html(text):
+    return lxml.html.fromstring(text)
+
+
+def outer_html(el):
+    return lxml.html.tostring(el, encoding=unicode, with_tail=False)
+
+
+def _add_class(el, cls):
+    old = el.get('class')
+    el.set('class', old + ' ' + cls if old else cls)
+    return old
+
+def _restore_class(el, old):
+    if old is None:
+        del el.attrib['class']
+    else:
+        el.set('class', old)
+
+
+_word_re = re.compile(r'\S+')
+
+def _words(text):
+    return len(text.split()) if text else 0
+
+def _subtree_words(el):
+    return _words(etree.tostring(el, method='text', encoding=unicode, with_tail=False))
+
+
+def _first_words(text, n):
+    "text up to the end of its nth word."
+    ends = [ m.end() for m in _word_re.finditer(text or '') ]
+    if n >= len(ends):
+        return text
+    return text[:ends[n-1]] if n else None
+
+def _last_words(text, n):
+    "text from the start of its nth word from the end."
+    starts = [ m.start() for m in _word_re.finditer(text or '') ]
+    if n >= len(starts):
+        return text
+    return text[starts[-n]:] if n else None
+
+
+def get_context(dab_a, min_words=CONTEXT_MIN_WORDS, max_words=CONTEXT_MAX_WORDS):
+    """
+    Walks up from the link adding up word counts, and stops at the
+    first ancestor with more than min_words words. Siblings are only
+    counted when the walk reaches their parent, so every node is
+    counted once and the cost is linear in the size of the context.
+
+    Returns (context, window). window is None if the context is at
+    most max_words long, else what _window() picked out of it.
+    """
+    child = dab_a
+    child_words = _subtree_words(dab_a)
+    for p in dab_a.iterancestors():
+        kids = list(p)
+        idx = kids.index(child)
+        # the text, then each child and its tail
+        counts = [_words(p.text)]
+        for c in kids:
+            counts.append(child_words if c is child else _subtree_words(c))
+            counts.append(_words(c.tail))
+        words = sum(counts)
+        if words > min_words:
+            if words <= max_words:
+                return p, None
+            return p, _window(counts, 1 + 2 * idx, min_words, max_words)
+        child, child_words = p, words
+    return child, None
+
+
+def _window(counts, pos, min_words, max_words):
+    """
+    Grows a run of get_context()'s counts out from pos, alternating
+    sides, until it has more than min_words words. Children are taken
+    whole or not at all, text (the even positions) a few words at a
+    time, and nothing goes past max_words. Returns (first, last, words
+    taken from first, words taken from last).
+    """
+    first = last = pos
+    taken = {pos: counts[pos]}
+    total = counts[pos]
+    open_sides = set([1, -1])
+    while total <= min_words and open_sides:
+        # text is shared out evenly between the sides still growing
+        need = min_words + 1 - total
+        step = (need + len(open_sides) - 1) // len(open_sides)
+        for side in (1, -1):
+            if side not in open_sides or total > min_words:
+                continue
+            i = last if side > 0 else first
+            while i % 2 or taken[i] == counts[i]:
+                i += side # past whatever's been taken whole
+                if not 0 <= i < len(counts) or counts[i]:
+                    break
+                taken[i] = 0
+            if not 0 <= i < len(counts):
+                open_sides.discard(side)
+                continue
+            n = counts[i] - taken.get(i, 0)
+            if i % 2 == 0:
+                n = min(n, step)
+            if n > max_words - total:
+                open_sides.discard(side)
+                continue
+            taken[i] = taken.get(i, 0) + n
+            total += n
+            if side > 0:
+                last = i
+            else:
+                first = i
+    return first, last, taken[first], taken[last]
+
+
+def context_html(dab_a):
+    """
+    Serializes the link's context with the link marked dab-link and the
+    context marked dab-context. The classes are taken back off after,
+    so links sharing a paragraph don't all come out marked. A context
+    over CONTEXT_MAX_WORDS is cut down to a copy of the context
+    element holding just the text and children nearest the link.
+    """
+    context, window = get_context(dab_a)
+    if context is None:
+        return None
+    old_link_cls = _add_class(dab_a, 'dab-link')
+    try:
+        if window is not None:
+            context = _bounded_copy(context, *window)
+        old_context_cls = _add_class(context, 'dab-context')
+        try:
+            return outer_html(context)
+        finally:
+            _restore_class(context, old_context_cls)
+    finally:
+        _restore_class(dab_a, old_link_cls)
+
+
+def _bounded_copy(context, first, last, first_words, last_words):
+    "A copy of context holding just the window _window() picked."
+    kids = list(context)
+    bounded = etree.Element(context.tag, attrib=dict(context.attrib))
+    if first % 2 == 0:
+        text = context.text if first == 0 else kids[first // 2 - 1].tail
+        bounded.text = _last_words(text, first_words)
+    for c in kids[first // 2:(last + 1) // 2]:
+        bounded.append(deepcopy(c))
+    bounded[-1].tail = _first_words(bounded[-1].tail, last_words) if last % 2 == 0 else None
+    return bounded
+
+
+def extract_dab_links(text):
+    """
+    Returns (images, dab_links) for a parsed article: the srcs of up
+    to MAX_IMAGES thumbnails, and a DabLink for each "disambiguation
+    needed" marker that follows a link. source_order counts markers,
+    including ones that get skipped.
+    """
+    root = parse_html(text)
+    images = []
+    markers = []
+    for el in _page_items(root):
+        if el.tag == 'img':
+            images.append(el.get('src'))
+        else:
+            markers.append(el)
+
+    dab_links = []
+    for i, marker in enumerate(markers):
+        sup = _outer_sup(marker)
+        if not sup:
+            continue
+        dab_a = sup[0].getprevious()
+        if dab_a is None or dab_a.tag != 'a':
+            continue
+        dab_links.append(DabLink(title = dab_a.get('title'),
+                                 context = context_html(dab_a),
+                                 source_order = i))
+    return images[:MAX_IMAGES], dab_links
+
+
+def extract_dab_choices(text):
+    """
+    Returns the (title, text) of each choice listed on a parsed dab
+    page, or None if it isn't actually a disambiguation page.
+    """
+    root = parse_html(text)
+    if not _disambigbox(root):
+        return None
+    ret = []
+    for li in _choice_items(root):
+        # TODO: better heuristic than the first link?
+        first = _first_link(li)
+        title = first[0].get('title') if first else None
+        choice_text = li.text_content().strip()
+        if title and choice_text:
+            ret.append((title, choice_text))
+    return ret
@@ -0,0 +1,146 @@
+"""
+In-process timing histograms, counters and gauges for the harvester
+and the server. Everything is keyed by a name plus keyword labels,
+e.g. observe('api_req', 0.2, action='query', servedby='mw1234').
+snapshot() gives the lot as a dict, ready for json.dumps.
+"""
+import gc
+import json
+import time
+from bisect import bisect_left
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60) # seconds
+
+_histograms = {} # name -> label string -> Histogram
+_counters   = {} # name -> label string -> count
+_gauges     = {} # name -> function returning the current value
+_started    = time.time()
+
+
+class Histogram(object):
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.buckets[bisect_left(BUCKETS, value)] += 1
+
+    def _asdict(self):
+        bounds = [ str(b) for b in BUCKETS ] + ['inf']
+        return {'count':   self.count,
+                'total':   self.total,
+                'mean':    self.total / self.count if self.count else None,
+                'max':     self.max,
+                'buckets': dict(zip(bounds, self.buckets))}
+
+
+def _label_str(labels):
+    return ','.join([ '%s=%s' % (k, labels[k]) for k in sorted(labels) ])
+
+
+def observe(name, value, **labels):
+    hists = _histograms.setdefault(name, {})
+    key = _label_str(labels)
+    if key not in hists:
+        hists[key] = Histogram()
+    hists[key].observe(value)
+
+
+def incr(name, count=1, **labels):
+    counts = _counters.setdefault(name, {})
+    key = _label_str(labels)
+    counts[key] = counts.get(key, 0) + count
+
+
+def gauge(name, func):
+    "Registers func to be called for name's value at snapshot time."
+    _gauges[name] = func
+
+
+class timed(object):
+    """
+    Times a with block into the name histogram. Exceptions are
+    counted under name + '.errors' and not swallowed.
+    """
+    def __init__(self, name, **labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        observe(self.name, time.time() - self.start, **self.labels)
+        if exc_type is not None:
+            incr(self.name + '.errors', error=exc_type.__name__, **self.labels)
+
+
+def count_greenlets():
+    # only for snapshots, this walks every object on the heap
+    from greenlet import greenlet
+    return len([ o for o in gc.get_objects() if isinstance(o, greenlet) ])
+
+gauge('greenlets', count_greenlets)
+
+
+def snapshot():
+    gauges = {}
+    for name, func in _gauges.items():
+        try:
+            gauges[name] = func()
+        except Exception as e:
+            gauges[name] = repr(e)
+    return {'uptime':     time.time() - _started,
+            'histograms': dict([ (name, dict([ (k, h._asdict()) for k, h in hists.items() ]))
+                                 for name, hists in _histograms.items() ]),
+            'counters':   dict([ (name, dict(counts)) for name, counts in _counters.items() ]),
+            'gauges':     gauges}
+
+
+def reset():
+    _histograms.clear()
+    _counters.clear()
+
+
+def dump(path):
+    "Appends a timestamped snapshot to path, one JSON object per line."
+    snap = snapshot()
+    snap['time'] = time.time()
+    with open(path, 'a') as f:
+        f.write(json.dumps(snap) + '\n')
+    return snap
+
+
+def report(name):
+    "One line per label set of a histogram, slowest total first."
+    hists = _histograms.get(name, {})
+    for key, h in sorted(hists.items(), key=lambda kh: -kh[1].total):
+        print '%-40s %6d calls %9.3f s total %8.4f s mean %8.4f s max' % \
+            (key or name, h.count, h.total, h.total / h.count, h.max)
+
+
+def test():
+    observe('test', 0.003, kind='a')
+    observe('test', 2, kind='a')
+    incr('test.calls', kind='a')
+    try:
+        with timed('test', kind='b'):
+            raise ValueError()
+    except ValueError:
+        pass
+    snap = snapshot()
+    assert snap['histograms']['test']['kind=a']['count'] == 2
+    assert snap['histograms']['test']['kind=a']['buckets']['0.005'] == 1
+    assert snap['counters']['test.errors']['error=ValueError,kind=b'] == 1
+    assert snap['gauges']['greenlets'] >= 0
+    report('test')
+
+
+if __name__ == '__main__':
+    test()
@@ -1,5 +1,8 @@
 import gevent
 from gevent.pool import Pool
+from gevent.coros import BoundedSemaphore
+from gevent.queue import Queue, Empty
+from gevent.event import AsyncResult
 from gevent import monkey
 monkey.patch_all()
 
@@ -7,22 +10,114 @@ import requests
 import json
 import time
 import random
-from pyquery import PyQuery as pq
-from collections import namedtuple
+from collections import namedtuple, deque
 
 import dabase
-from dabase import Dabblet, DabChoice
+import dabcache
+import dabextract
+import dabparse
+import dabmetrics
+from dabase import Dabblet, DabPage
 
 API_URL = "http://en.wikipedia.org/w/api.php"
 EDIT_SUMMARY = 'DAB link solved with disambiguity!'
+USER_AGENT   = 'DAB/0.0.0 stephen laporte stephen.laporte@gmail.com'
 
 class WikiException(Exception): pass
 
 Page = namedtuple("Page", "title, req_title, pageid, revisionid, revisiontext, is_parsed, fetch_date")
 
+API_POOL_SIZE = 20    # max concurrent connections to the API
+API_TIMEOUT   = 30
+API_MAXLAG    = 5     # seconds of replication lag we're willing to tolerate
+API_RETRIES   = 5
+API_BACKOFF   = 1.0   # base seconds for exponential backoff
+API_MAX_WAIT  = 120
+
+api_session = requests.session(config={'keep_alive':       True,
+                                       'pool_connections': 1,
+                                       'pool_maxsize':     API_POOL_SIZE},
+                               headers={'User-Agent': USER_AGENT})
+api_slots = BoundedSemaphore(API_POOL_SIZE)
+dabmetrics.gauge('api_slots_in_use', lambda: API_POOL_SIZE - api_slots.counter)
+
+
+class Throttle(object):
+    """
+    Rate limiter shared by every greenlet: when the API says to slow down,
+    every caller waits out the Retry-After, not just the one told.
+    """
+    def __init__(self):
+        self.resume_at = 0
+
+    def wait(self):
+        delay = self.resume_at - time.time()
+        if delay > 0:
+            gevent.sleep(delay)
+
+    def back_off(self, delay):
+        delay = min(delay, API_MAX_WAIT)
+        self.resume_at = max(self.resume_at, time.time() + delay)
+
+api_throttle = Throttle()
+dabmetrics.gauge('api_throttled_for', lambda: max(0, api_throttle.resume_at - time.time()))
+
+
+def _retry_delay(resp, attempt):
+    try:
+        return float(resp.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return API_BACKOFF * 2 ** attempt
+
+def _is_throttled(resp):
+    if resp.status_code in (429, 503):
+        return True
+    return resp.headers.get('MediaWiki-API-Error') == 'maxlag'
+
+def _send(action, all_params):
+    attempt = 0
+    while True:
+        api_throttle.wait()
+        try:
+            # prefetch, so the body is read while the slot is held and
+            # the connection goes back to the pool
+            with api_slots:
+                if action == 'edit':
+                    # in the body, article text is too long for a URL
+                    resp = api_session.post(API_URL, data=all_params,
+                                            timeout=API_TIMEOUT, prefetch=True)
+                else:
+                    resp = api_session.get(API_URL, params=all_params,
+                                           timeout=API_TIMEOUT, prefetch=True)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= API_RETRIES:
+                raise
+            dabmetrics.incr('api_req.retries', action=action, reason=type(e).__name__)
+            gevent.sleep(API_BACKOFF * 2 ** attempt)
+        else:
+            if attempt >= API_RETRIES or not _is_throttled(resp):
+                return resp
+            dabmetrics.incr('api_req.retries', action=action, reason='throttled')
+            api_throttle.back_off(_retry_delay(resp, attempt))
+        attempt += 1
+
 def api_req(action, params=None, raise_exc=False, **kwargs):
-    all_params = {'format': 'json',
-                  'servedby': 'true'}
+    start = time.time()
+    resp = None
+    try:
+        resp = _api_req(action, params, raise_exc, **kwargs)
+        return resp
+    finally:
+        servedby = getattr(resp, 'servedby', None) or 'unknown'
+        dabmetrics.observe('api_req', time.time() - start,
+                           action=action, servedby=servedby)
+        if resp is None or getattr(resp, 'error', None):
+            dabmetrics.incr('api_req.errors', action=action)
+
+def _api_req(action, params=None, raise_exc=False, **kwargs):
+    all_params = {'format':  'json',
+                  'servedby': 'true',
+                  'maxlag':  API_MAXLAG}
     all_params.update(kwargs)
     all_params.update(params)
     all_params['action'] = action
@@ -30,10 +125,7 @@ def api_req(action, params=None, raise_exc=False, **kwargs):
     resp = requests.Response()
     resp.results = None
     try:
-        if action == 'edit':
-            resp = requests.post(API_URL, params=all_params)
-        else:
-            resp = requests.get(API_URL, params=all_params)
+        resp = _send(action, all_params)
     except Exception as e:
         if raise_exc:
             raise
@@ -66,88 +158,220 @@ def api_req(action, params=None, raise_exc=False, **kwargs):
 
     return resp
 
-CategoryMember = namedtuple("CategoryMember", "pageid, ns, title")
-def get_category(cat_name, count=500, cont_str=""):
-    ret = []
+CategoryMember = namedtuple("CategoryMember", "pageid, ns, title, timestamp")
+def category_title(cat_name):
+    "The title the API reports for a category, whatever form it came in."
     if not cat_name.startswith('Category:'):
         cat_name = 'Category:'+cat_name
+    return cat_name.replace('_', ' ')
+
+def get_category_page(cat_name, count=500, cont_str="", start=None):
+    """
+    One query's worth of category members, oldest first, from start.
+    Returns (members, next cont_str), members None if the query failed.
+    """
+    params = {'list':       'categorymembers',
+              'cmtitle':    category_title(cat_name),
+              'cmprop':     'ids|title|timestamp',
+              'cmsort':     'timestamp',
+              'cmdir':      'asc',
+              'cmlimit':    min(count, 500),
+              'cmcontinue': cont_str}
+    if start:
+        params['cmstart'] = start
+    resp = api_req('query', params)
+    try:
+        qres = resp.results['query']
+    except:
+        print resp.error
+        return None, cont_str
+    members = [ CategoryMember(pageid   =cm['pageid'],
+                               ns       =cm['ns'],
+                               title    =cm['title'],
+                               timestamp=cm.get('timestamp'))
+                for cm in qres['categorymembers']
+                if cm.get('pageid') ]
+    return members, _get_continue(resp.results, 'categorymembers').get('cmcontinue')
+
+def get_category(cat_name, count=500, cont_str=""):
+    ret = []
     while len(ret) < count and cont_str is not None:
-        cur_count = min(count - len(ret), 500)
-        params = {'list':       'categorymembers', 
-                  'cmtitle':    cat_name, 
-                  'prop':       'info', 
-                  'cmlimit':    cur_count,
-                  'cmcontinue': cont_str}
-        resp = api_req('query', params)
-        try:
-            qres = resp.results['query']
-        except:
-            print resp.error
+        members, cont_str = get_category_page(cat_name, count - len(ret), cont_str)
+        if members is None:
             break
-        ret.extend([ CategoryMember(pageid=cm['pageid'],
-                                    ns    =cm['ns'],
-                                    title =cm['title'])
-                     for cm in qres['categorymembers']
-                     if cm.get('pageid') ])
+        ret.extend(members)
+
+    return ret
+
+def get_category_sizes(cat_names):
+    """
+    Member counts from prop=categoryinfo, API_MAX_IDS categories a
+    query. Categories the lookup failed for are left out.
+    """
+    ret = {}
+    cat_names = [ category_title(c) for c in cat_names ]
+    for i in range(0, len(cat_names), API_MAX_IDS):
+        resp = api_req('query', {'prop': 'categoryinfo'},
+                       titles='|'.join(cat_names[i:i+API_MAX_IDS]))
         try:
-            cont_str = resp.results['query-continue']['categorymembers']['cmcontinue']
+            pages = resp.results['query']['pages'].values()
         except:
-            cont_str = None
-
+            print "Couldn't get category sizes:", resp.error
+            continue
+        for page in pages:
+            ret[page['title']] = page.get('categoryinfo', {}).get('size', 0)
     return ret
 
+def crawl_category(cat, full=False):
+    """
+    Brings a CrawlCategory's stored members up to date from its watermark,
+    or all of them with full. Interrupted crawls resume where they stopped.
+    """
+    if cat.cmcontinue is None:
+        if full:
+            cat.generation += 1
+            cat.cmstart = ''
+        else:
+            cat.cmstart = cat.watermark or ''
+        cat.cmcontinue = ''
+        cat.save()
+    full = not cat.cmstart
+    while cat.cmcontinue is not None:
+        members, cont_str = get_category_page(cat.title,
+                                              cont_str=cat.cmcontinue,
+                                              start=cat.cmstart)
+        if members is None:
+            return False
+        cat.cmcontinue = cont_str
+        dabase.save_crawl_members(cat, members)
+    dabase.finish_crawl(cat, full)
+    return True
+
+def refresh_category(cat, size=None):
+    """
+    Lists members added since the watermark, then does a full crawl if
+    the stored count still doesn't match size.
+    """
+    if not crawl_category(cat):
+        return
+    if size is not None and size != cat.member_count:
+        crawl_category(cat, full=True)
+
+def update_category_tree(cat_name):
+    """
+    Refreshes the stored members of a category and, level by level,
+    its subcategories.
+    """
+    seen = set([category_title(cat_name)])
+    level = list(seen)
+    api_pool = Pool(CAT_CONC)
+    while level:
+        sizes = get_category_sizes(level)
+        cats = [ dabase.get_crawl_category(title) for title in level ]
+        api_pool.map(lambda c: refresh_category(c, sizes.get(c.title)), cats)
+        level = []
+        for c in cats:
+            for sub in dabase.get_subcategories(c):
+                if sub not in seen:
+                    seen.add(sub)
+                    level.append(sub)
+    print 'Updated', len(seen), 'categories under', cat_name
+    return seen
+
 CAT_CONC = 10
 ALL = 10**14
-def get_category_recursive(cat_name, count=None):
-    ret = set()
-    seen_cats = set()
-
+def iter_category_recursive(cat_name, count=None, max_depth=None, max_breadth=None):
+    """
+    Yields up to count members of a category and its subcategories as
+    pages of results come in, within max_depth and max_breadth.
+    """
     if count is None:
         count = ALL
-        print 'Recursively getting all members of', cat_name
-    else:
-        print 'Recursively getting',count,'members of', cat_name
-
-    jobs = []
+    done_q = Queue()
+    todo = deque()
     api_pool = Pool(CAT_CONC)
-    jobs.append(api_pool.spawn(get_category, cat_name, count))
-    while len(ret) < count and jobs:
-        cur_count = count - len(ret)
-        api_pool.join(timeout=0.3, raise_error=True)
-        for j in jobs:
-            if not j.ready():
-                continue
-            jobs.remove(j)
-            if not j.successful():
+    level_sizes = {}
+    seen_cats, seen_ids = set(), set()
+    state = {'pending': 0, 'yielded': 0}
+
+    def fetch(title, depth, cont_str):
+        members = None # reported as a failed fetch if this raises
+        try:
+            members, cont_str = get_category_page(title, count - state['yielded'], cont_str)
+        finally:
+            done_q.put((title, depth, members, cont_str))
+
+    def add_cat(title, depth):
+        if title in seen_cats:
+            return
+        if max_depth is not None and depth > max_depth:
+            return
+        if max_breadth is not None and level_sizes.get(depth, 0) >= max_breadth:
+            return
+        seen_cats.add(title)
+        level_sizes[depth] = level_sizes.get(depth, 0) + 1
+        todo.append((title, depth, ''))
+
+    def spawn_ready():
+        # pending, not the pool's free count, which lags behind fetches
+        # that have put their results but not yet exited
+        while todo and state['pending'] < CAT_CONC:
+            api_pool.spawn(fetch, *todo.popleft())
+            state['pending'] += 1
+
+    seen_cats.add(category_title(cat_name))
+    todo.append((category_title(cat_name), 0, ''))
+    spawn_ready()
+    try:
+        while (state['pending'] or todo) and state['yielded'] < count:
+            title, depth, members, cont_str = done_q.get()
+            state['pending'] -= 1
+            if members is None:
                 print 'failed a cat fetch'
-                continue
-            cur_mems = j.value
-            for m in cur_mems:
+                members, cont_str = [], None
+            if cont_str:
+                todo.appendleft((title, depth, cont_str))
+            for m in members:
                 if m.ns == 14:
-                    if m.title not in seen_cats:
-                        jobs.append(api_pool.spawn(get_category, m.title, cur_count))
-                        seen_cats.add(m.title)
-                else:
-                    ret.add(m)
-            print 'Got', len(cur_mems),'members, returns up to', len(ret)
+                    add_cat(m.title, depth + 1)
+                elif m.pageid not in seen_ids and state['yielded'] < count:
+                    seen_ids.add(m.pageid)
+                    state['yielded'] += 1
+                    yield m
+            spawn_ready()
+    finally:
+        api_pool.kill()
 
-    ret = list(ret)[:count]
+def get_category_recursive(cat_name, count=None, **kwargs):
+    if count is None:
+        print 'Recursively getting all members of', cat_name
+    else:
+        print 'Recursively getting',count,'members of', cat_name
+    ret = list(iter_category_recursive(cat_name, count, **kwargs))
     print 'Done, returning', len(ret),'items'
-    return list(ret)
+    return ret
     
-def get_dab_page_ids(date=None, count=500):
-    #cat_res = get_category_recursive("Articles_with_links_needing_disambiguation_from_June_2011", count)
-    cat_res = get_category_recursive("Articles_with_links_needing_disambiguation", count)
-    # TODO: Continue query?
-    # TODO: Get subcategory of Category:Articles_with_links_needing_disambiguation
-    return [ a.pageid for a in cat_res ]
-
+DAB_CATEGORY = "Articles_with_links_needing_disambiguation"
+def get_dab_page_ids(date=None, count=500, unharvested=False, crawl=True):
+    """
+    date picks the monthly subcategory. With dabase ready, the ids come from
+    stored members, crawled first unless crawl is False.
+    """
+    cat_name = DAB_CATEGORY
+    if date:
+        if not isinstance(date, basestring):
+            date = date.strftime('%B_%Y')
+        cat_name += '_from_' + date.replace(' ', '_')
+    if not dabase.is_ready():
+        cat_res = get_category_recursive(cat_name, count)
+        return [ a.pageid for a in cat_res ]
+    if crawl:
+        update_category_tree(cat_name)
+    return dabase.get_category_pageids(category_title(cat_name), count, unharvested)
 
-def get_articles(page_ids=None, titles=None, parsed=True, follow_redirects=False, **kwargs):
-    ret = []
-    params = {'prop':   'revisions',  
-              'rvprop': 'content|ids' }
 
+def _page_params(page_ids=None, titles=None):
+    params = {}
     if page_ids:
         if not isinstance(page_ids, (str,unicode)):
             try:
@@ -164,160 +388,458 @@ def get_articles(page_ids=None, titles=None, parsed=True, follow_redirects=False
         params['titles'] = titles
     else:
         raise Exception('You need to pass in a page id or a title.')
+    return params
+
+
+PageInfo = namedtuple("PageInfo", "title, req_title, pageid, lastrevid")
+def get_page_infos(page_ids=None, titles=None, follow_redirects=False, **kwargs):
+    """
+    Cheap prop=info lookup of the current revision ids, no content.
+    Returns None if the query failed outright.
+    """
+    params = _page_params(page_ids, titles)
+    params['prop'] = 'info'
+    if follow_redirects:
+        params['redirects'] = 'true'
+
+    info_resp = api_req('query', params, **kwargs)
+    try:
+        pages = info_resp.results['query']['pages'].values()
+        rename_list = info_resp.results['query'].get('normalized', []) \
+                      + info_resp.results['query'].get('redirects', [])
+    except:
+        print "Couldn't get_page_infos() with params: ", params
+        return None
+
+    renames = dict([ (r['to'],r['from']) for r in rename_list ])
+    ret = []
+    for page in pages:
+        if not page.get('pageid') or not page.get('lastrevid'):
+            continue
+        title = page['title']
+        ret.append(PageInfo(title     = title,
+                            req_title = _requested_title(renames, title),
+                            pageid    = page['pageid'],
+                            lastrevid = page['lastrevid']))
+    return ret
+
+
+API_MAX_IDS  = 50  # pageids/titles the API accepts per query
+ARTICLE_CONC = 10
+
+def _as_list(items):
+    if isinstance(items, (str,unicode)):
+        return items.split('|')
+    try:
+        return list(items)
+    except TypeError:
+        return [items]
+
+def get_articles(page_ids=None, titles=None, parsed=True, follow_redirects=False,
+                 infos=None, **kwargs):
+    """
+    Fetches any number of pages in API_MAX_IDS batches, ARTICLE_CONC at a
+    time, in the order asked for. infos are PageInfos already looked up.
+    """
+    if page_ids:
+        page_ids, titles = _as_list(page_ids), None
+        items = page_ids
+    elif titles:
+        titles = _as_list(titles)
+        items = titles
+    else:
+        raise Exception('You need to pass in a page id or a title.')
+
+    def get_batch(i):
+        batch = items[i:i+API_MAX_IDS]
+        batch_infos = None
+        if infos is not None:
+            if page_ids:
+                keys = set([ str(b) for b in batch ])
+                batch_infos = [ info for info in infos if str(info.pageid) in keys ]
+            else:
+                keys = set(batch)
+                batch_infos = [ info for info in infos if info.req_title in keys ]
+        if page_ids:
+            return get_article_batch(page_ids=batch, parsed=parsed,
+                                     follow_redirects=follow_redirects,
+                                     infos=batch_infos, **kwargs)
+        return get_article_batch(titles=batch, parsed=parsed,
+                                 follow_redirects=follow_redirects,
+                                 infos=batch_infos, **kwargs)
+
+    starts = range(0, len(items), API_MAX_IDS)
+    if len(starts) == 1:
+        return get_batch(0)
+    ret = []
+    for batch_pages in Pool(ARTICLE_CONC).map(get_batch, starts):
+        ret.extend(batch_pages)
+    return ret
+
+
+def _order_pages(pages, page_ids=None, titles=None):
+    if page_ids:
+        order = dict([ (str(pid), i) for i, pid in enumerate(page_ids) ])
+        key = lambda p: order.get(str(p.pageid), len(order))
+    else:
+        order = dict([ (t, i) for i, t in enumerate(titles) ])
+        key = lambda p: order.get(p.req_title, len(order))
+    return sorted(pages, key=key)
+
+
+def get_article_batch(page_ids=None, titles=None, parsed=True, follow_redirects=False,
+                      infos=None, **kwargs):
+    """
+    Fetches up to API_MAX_IDS pages, only downloading the revisions
+    dabcache doesn't have. infos saves the prop=info query.
+    """
+    if not dabcache.is_ready():
+        ret = fetch_articles(page_ids, titles, parsed, follow_redirects, **kwargs)
+        return _order_pages(ret, page_ids, titles)
+
+    if infos is None:
+        infos = get_page_infos(page_ids, titles, follow_redirects, **kwargs)
+    if infos is None:
+        ret = fetch_articles(page_ids, titles, parsed, follow_redirects, **kwargs)
+        return _order_pages(ret, page_ids, titles)
+
+    ret = []
+    misses = {}
+    cache_hits = dabcache.get_many([ (i.pageid, i.lastrevid) for i in infos ], parsed)
+    for info in infos:
+        cached = cache_hits.get(info.pageid)
+        if cached is None:
+            misses[info.pageid] = info
+            continue
+        title, text, fetch_date = cached
+        ret.append(Page(title        = info.title,
+                        req_title    = info.req_title,
+                        pageid       = info.pageid,
+                        revisionid   = info.lastrevid,
+                        revisiontext = text,
+                        is_parsed    = parsed,
+                        fetch_date   = fetch_date))
+    if misses:
+        fetched = [ page._replace(req_title=misses[page.pageid].req_title)
+                    for page in fetch_articles(misses.keys(), parsed=parsed, **kwargs) ]
+        dabcache.put_many([ (p.pageid, p.revisionid, p.title, p.revisiontext, p.fetch_date)
+                            for p in fetched ], parsed)
+        ret.extend(fetched)
+    return _order_pages(ret, page_ids, titles)
+
+
+def fetch_articles(page_ids=None, titles=None, parsed=True, follow_redirects=False, **kwargs):
+    ret = []
+    params = {'prop':   'revisions',  
+              'rvprop': 'content|ids' }
+    params.update(_page_params(page_ids, titles))
 
     if parsed:
         params['rvparse'] = 'true'
     if follow_redirects:
         params['redirects'] = 'true'
 
-    parse_resp = api_req('query', params, **kwargs)
-    if parse_resp.results:
+    pages = {}
+    renames = {}
+    cont = {}
+    while True:
+        cur_params = dict(params)
+        cur_params.update(cont)
+        parse_resp = api_req('query', cur_params, **kwargs)
         try:
-            pages = parse_resp.results['query']['pages'].values()
-            redirect_list = parse_resp.results['query'].get('redirects', [])
+            qres = parse_resp.results['query']
         except:
-            print "Couldn't get_articles() with params: ", params
-            return ret
+            print "Couldn't get_articles() with params: ", cur_params
+            break
+        # big batches get cut off at the response size limit, with
+        # the rest of the revisions left for the continuation
+        for page_key, page in qres.get('pages', {}).items():
+            if page.get('revisions') or page_key not in pages:
+                pages[page_key] = page
+        for r in qres.get('normalized', []) + qres.get('redirects', []):
+            renames[r['to']] = r['from']
+        cont = _get_continue(parse_resp.results, 'revisions')
+        if not cont:
+            break
 
-        redirects = dict([ (r['to'],r['from']) for r in redirect_list ])
-        # this isn't perfect since multiple pages might redirect to the same page
-        for page in pages:
-            if not page.get('pageid') or not page.get('title'):
-                continue
-            title = page['title']
-            pa = Page( title  = title,
-                       req_title  = redirects.get(title, title),
-                       pageid = page['pageid'],
-                       revisionid = page['revisions'][0]['revid'],
-                       revisiontext = page['revisions'][0]['*'],
-                       is_parsed = parsed,
-                       fetch_date = time.time())
-            ret.append(pa)
+    # this isn't perfect since multiple pages might redirect to the same page
+    for page in pages.values():
+        if not page.get('pageid') or not page.get('title') \
+           or not page.get('revisions'):
+            continue
+        title = page['title']
+        pa = Page( title  = title,
+                   req_title  = _requested_title(renames, title),
+                   pageid = page['pageid'],
+                   revisionid = page['revisions'][0]['revid'],
+                   revisiontext = page['revisions'][0]['*'],
+                   is_parsed = parsed,
+                   fetch_date = time.time())
+        ret.append(pa)
     return ret
 
 
+def _requested_title(renames, title):
+    # undo the redirect first, then the title normalization
+    for step in ('redirects', 'normalized'):
+        title = renames.get(title, title)
+    return title
+
+
+def _get_continue(results, module):
+    "Continuation params from either the old or the new style of query."
+    if results.get('continue'):
+        return results['continue']
+    return results.get('query-continue', {}).get(module, {})
+
+
 def is_fixable_dab_link(parsed_page):
     # Check for redirect
     # Check for hat notes
     pass
 
 
-def get_dab_choices(dabblets): # side effect-y..
-    ret = []
-    if not dabblets:
-        return ret
-    dab_map = dict([(d.title, d) for d in dabblets])
-    dab_pages = get_articles(titles=dab_map.keys(), follow_redirects=True)
-
-    for dp in dab_pages:
-        dabblet  = dab_map.get(dp.req_title) # :/ (worried about special characters)
-        dab_text = dp.revisiontext
-        
-        d = pq(dab_text)
-        if not d('table#disambigbox'):
-            print 'Article "'+dp.req_title+'" has no table#disambigbox, skipping.'
-            #print '(pulled in from', dabblet.source_title,')'
-            continue
+def parse_dab_choices(dab_page, extractor=dabextract):
+    "(title, text) of each choice on a dab page, or None if it isn't one."
+    ret = extractor.extract_dab_choices(dab_page.revisiontext)
+    if ret is None:
+        print 'Article "'+dab_page.req_title+'" has no table#disambigbox, skipping.'
+    return ret
 
-        d('table#toc').remove()
-        liasons = set([ d(a).parents('li')[-1] for a in d('li a') ])
-        for lia in liasons:
-            # TODO: better heuristic than ":first" link?
-            title = d(lia).find('a:first').attr('title') 
-            text = lia.text_content().strip()
-            if title and text:
-                ret.append(DabChoice(dabblet=dabblet,
-                                     title=title, 
-                                     text=text))
-            else:
-                print 'skippin a bogus link'
-    
+
+def fetch_dab_pages(titles, extractor=dabextract):
+    """
+    title -> DabPage for each title that's a dab page, reusing stored
+    DabPages at the current revision.
+    """
+    ret = {}
+    infos = get_page_infos(titles=titles, follow_redirects=True)
+    if infos is None:
+        misses = titles
+    else:
+        current = dict([ (i.req_title, i.lastrevid) for i in infos ])
+        if current and dabase.is_ready():
+            for dp in DabPage.select().where(title__in=current.keys()):
+                if current[dp.title] == dp.revid:
+                    ret[dp.title] = dp
+        misses = [ t for t in current if t not in ret ]
+
+    if misses:
+        miss_infos = None
+        if infos is not None:
+            miss_infos = [ i for i in infos if i.req_title in misses ]
+        for page in get_articles(titles=misses, follow_redirects=True, infos=miss_infos):
+            choices = parse_dab_choices(page, extractor)
+            if choices is not None:
+                ret[page.req_title] = DabPage.from_page(page, choices)
     return ret
 
 
-def get_context(dab_a):
-    d = dab_a(dab_a.parents()[0])
-    d(dab_a).addClass('dab-link')
-    link_parents = dab_a.parents()
-    cand_contexts = [ p for p in link_parents 
-                      if p.text_content() and len(p.text_content().split()) > 30 ]
-    chosen_context = cand_contexts[-1]
-    d(chosen_context).addClass('dab-context')
-    # add upperbound/wrapping div
-    return d(chosen_context)
-    
-def get_dabblets(parsed_page):
-    "Call with a Page object, the type you'd get from get_articles()"
-    ret = []
-    d = pq(parsed_page.revisiontext)
-    page_title = parsed_page.title
+class DabPageCache(object):
+    """
+    One DabPage per dab title for a harvest; titles being fetched by
+    another greenlet are waited on, not fetched again.
+    """
+    def __init__(self, extractor=dabextract):
+        self.results = {}
+        self.extractor = extractor
+
+    def get_dab_pages(self, titles):
+        mine = []
+        for title in set(titles):
+            if title not in self.results:
+                self.results[title] = AsyncResult()
+                mine.append(title)
+        if mine:
+            fetched = {}
+            try:
+                fetched = fetch_dab_pages(mine, self.extractor)
+            finally:
+                for title in mine:
+                    self.results[title].set(fetched.get(title))
 
-    images_found = [img.attrib['src'] 
-                    for img in d('img.thumbimage')
-                    if img.attrib.get('src')][:3]
+        ret = {}
+        for title in set(titles):
+            dp = self.results[title].get()
+            if dp is not None:
+                ret[title] = dp
+        return ret
 
-    dab_link_markers = d('span:contains("disambiguation needed")')
-    for i, dlm in enumerate(dab_link_markers):
-        try:
-            dab_link = d(dlm).parents("sup")[0].getprevious() # TODO: remove extra d?
-            dab_link = d(dab_link)
-        except Exception as e:
-            print 'nope', e
-            continue
-        if dab_link.is_('a'):
-            dab_title = dab_link.attr('title')
-            context = get_context(dab_link)
-
-            ret.append( Dabblet.from_page(dab_title, 
-                                          context.outerHtml(), 
-                                          parsed_page, 
-                                          i,
-                                          '||'.join(images_found)))
-            
-    return ret
+
+def assign_dab_pages(dabblets, dab_pages=None): # side effect-y..
+    "Points each dabblet at the DabPage for its title, if there is one."
+    if not dabblets:
+        return dabblets
+    if dab_pages is None:
+        dab_pages = DabPageCache()
+    found = dab_pages.get_dab_pages([ d.title for d in dabblets ])
+    for d in dabblets:
+        if d.title in found:
+            d.dab_page = found[d.title]
+    return dabblets
+
+
+def get_dabblets(parsed_page, extractor=dabextract):
+    "Call with a Page object, the type you'd get from get_articles()"
+    images, dab_links = extractor.extract_dab_links(parsed_page.revisiontext)
+    return [ Dabblet.from_page(dl.title,
+                               dl.context,
+                               parsed_page,
+                               dl.source_order,
+                               '||'.join(images))
+             for dl in dab_links ]
 
 def get_random_dabblets(count=2):
     dabblets = []
     page_ids = random.sample(get_dab_page_ids(count=count*2), count)
     articles = get_articles(page_ids)
     dabblets.extend(sum([get_dabblets(a) for a in articles], []))
-    return dabblets
+    return assign_dab_pages(dabblets)
 
 import re
-def replace_nth(n, guess):
-    def alternate(n):
-        i=0
-        while True:
-            i += 1
-            yield i%n == 0
-    gen = alternate(n)
-    def match(m):
-        replace = gen.next()
-        if replace:
-            return '[[' + guess + m.group(1)
-        else:
-            return m.group(0)
-    return match
+DAB_TEMPLATES = ['disambiguation needed', 'dn', 'dab needed', 'disambig needed']
+# a dab template, and the link right before it if there is one
+_dab_marker_re = re.compile(r'(?:\[\[([^\[\]|]+)(\|[^\[\]]*)?\]\](\s*))?'
+                            r'\{\{\s*(?:%s)\s*(?:\|[^{}]*)?\}\}'
+                            % '|'.join([ re.escape(t) for t in DAB_TEMPLATES ]),
+                            re.IGNORECASE)
+
+def _same_title(a, b):
+    a, b = [ t.strip().replace('_', ' ') for t in (a, b) ]
+    return a[:1].upper() + a[1:] == b[:1].upper() + b[1:]
+
+def _links_to(match, title):
+    return match.group(1) is not None and _same_title(match.group(1), title)
+
+def _solved_link(match, guess):
+    label = match.group(2)[1:] if match.group(2) else match.group(1)
+    if label == guess:
+        return '[[%s]]' % guess
+    return '[[%s|%s]]' % (guess, label)
+
+def apply_solutions(text, solutions):
+    """
+    Fixes the dab links of (dabblet, guess) solutions in one pass over a
+    page's wikitext. Returns (new text, the dabblets applied).
+    """
+    matches = list(_dab_marker_re.finditer(text))
+    claimed, applied = {}, []
+    for dabblet, guess in solutions:
+        i = dabblet.source_order
+        if i >= len(matches) or i in claimed or not _links_to(matches[i], dabblet.title):
+            i = None
+            for j, m in enumerate(matches):
+                if j not in claimed and _links_to(m, dabblet.title):
+                    i = j
+                    break
+        if i is None:
+            continue
+        claimed[i] = guess
+        applied.append(dabblet)
+
+    ret, pos = [], 0
+    for i, m in enumerate(matches):
+        if i in claimed:
+            ret.append(text[pos:m.start()])
+            ret.append(_solved_link(m, claimed[i]))
+            pos = m.end()
+    ret.append(text[pos:])
+    return ''.join(ret), applied
+
+WikiText = namedtuple("WikiText", "title, pageid, revid, timestamp, text")
+def get_wikitext(pageid):
+    "The current revision's wikitext, with what an edit needs to detect conflicts."
+    resp = api_req('query', {'prop':    'revisions',
+                             'rvprop':  'content|ids|timestamp',
+                             'pageids': pageid})
+    try:
+        page = resp.results['query']['pages'][str(pageid)]
+        rev = page['revisions'][0]
+    except:
+        print "Couldn't get_wikitext() for page", pageid
+        return None
+    return WikiText(title     = page['title'],
+                    pageid    = page['pageid'],
+                    revid     = rev['revid'],
+                    timestamp = rev['timestamp'],
+                    text      = rev['*'])
 
 def replace_dabblet(dabblet, guess):
-    article_text = get_articles(page_ids=dabblet.source_page.pageid, parsed=False)[0]
-    dab_title = dabblet.title
-    dab_postition = dabblet.source_order + 1
-    if article_text.revisionid == dabblet.source_page.revisionid:
-        return re.sub('\[\[' + dab_title + '(.*){{Disambiguation needed.*}}', replace_nth(dab_postition, guess), article_text.revisiontext)
-    else:
-        return 'error: the revids don\'t match'
-
-def submit_solution(title, solution):
-    params = {'action': 'edit',
-              'format': 'json',
-              'title': title,
-              'text': solution,
-              'summary': EDIT_SUMMARY,
-              'token': '+\\'}
-    resp = api_req('query', params)
+    wikitext = get_wikitext(dabblet.source_pageid)
+    if wikitext is None:
+        return 'error: couldn\'t fetch the page'
+    return apply_solutions(wikitext.text, [(dabblet, guess)])[0]
+
+def submit_solution(title, solution, basetimestamp=None, token='+\\'):
+    params = {'title':    title,
+              'text':     solution,
+              'summary':  EDIT_SUMMARY,
+              'token':    token,
+              'nocreate': 'true'}
+    if basetimestamp:
+        params['basetimestamp'] = basetimestamp
+    resp = api_req('edit', params)
     return resp
 
+EDIT_RETRIES = 3 # refetches after an edit conflict
+
+def write_page_solutions(pageid, solutions, token='+\\'):
+    """
+    Writes a page's solutions as one edit, reapplied after conflicts. Returns
+    (dabblets written, edit response); raises WikiException if unfetchable.
+    """
+    for attempt in range(EDIT_RETRIES + 1):
+        wikitext = get_wikitext(pageid)
+        if wikitext is None:
+            raise WikiException("Couldn't fetch page %s to write to" % pageid)
+        text, applied = apply_solutions(wikitext.text, solutions)
+        if not applied:
+            return [], None
+        resp = submit_solution(wikitext.title, text, wikitext.timestamp, token)
+        error = getattr(resp, 'error', None)
+        if not error:
+            return applied, resp
+        if not str(error).startswith('editconflict'):
+            break
+        dabmetrics.incr('edit_conflicts')
+    return [], resp
+
+class SolutionQueue(object):
+    """
+    Collects solved dabblets by source page, so that however many of
+    a page's dab links get solved, it costs one fetch and one edit.
+    """
+    def __init__(self, token='+\\'):
+        self.token = token
+        self.pending = {} # source_pageid -> [(dabblet, guess)]
+
+    def add(self, dabblet, guess):
+        self.pending.setdefault(dabblet.source_pageid, []).append((dabblet, guess))
+
+    def _write(self, pageid, solutions):
+        try:
+            return write_page_solutions(pageid, solutions, self.token)
+        except Exception as e:
+            print 'writing solutions to page', pageid, 'failed:', repr(e)
+            return None
+
+    def flush(self):
+        """
+        Writes every queued page; failed ones are queued again. Returns pageid ->
+        (its solutions, dabblets written, edit response) for pages done with.
+        """
+        pending, self.pending = self.pending, {}
+        pageids = pending.keys()
+        results = Pool(ARTICLE_CONC).map(lambda p: self._write(p, pending[p]), pageids)
+        done = {}
+        for pageid, res in zip(pageids, results):
+            if res is None or getattr(res[1], 'error', None):
+                for dabblet, guess in pending[pageid]:
+                    self.add(dabblet, guess)
+            else:
+                done[pageid] = (pending[pageid],) + tuple(res)
+        return done
+
 P_PER_CALL = 4
 DEFAULT_TIMEOUT = 30
 def green_call_list(func, arglist, per_call=P_PER_CALL, timeout=DEFAULT_TIMEOUT):
@@ -345,39 +867,189 @@ def green_call_list(func, arglist, per_call=P_PER_CALL, timeout=DEFAULT_TIMEOUT)
 
     return ret
 
-def save_a_bunch(count=1000):
-    import time
+HARVEST_QUEUE_SIZE = 200
+ARTICLE_WORKERS    = 4
+PARSE_WORKERS      = 1
+CHOICE_WORKERS     = 8
+WRITE_BATCH        = 500 # dabblets committed per transaction
 
-    db_name = 'abunch'
-    dabase.init(db_name)
+_DONE = object() # end of stream marker passed down the harvest queues
 
-    start = time.time()
+def _take(in_q, max_items):
+    """
+    Blocks for one item, then grabs whatever else is already waiting,
+    up to max_items. Returns None once the stream has ended.
+    """
+    first = in_q.get()
+    if first is _DONE:
+        in_q.put(_DONE) # leave it for the other workers
+        return None
+    items = [first]
+    while len(items) < max_items:
+        try:
+            item = in_q.get_nowait()
+        except Empty:
+            break
+        if item is _DONE:
+            in_q.put(_DONE)
+            break
+        items.append(item)
+    return items
 
-    page_ids = get_dab_page_ids(count=count)
+def _stage(func, in_q, out_q=None, workers=1, batch_size=1):
+    """
+    Spawns workers feeding batches from in_q through func onto out_q, passing
+    the end of in_q on once they've all seen it.
+    """
+    stage = func.__name__
+    def work():
+        while True:
+            with dabmetrics.timed('harvest_wait', stage=stage):
+                items = _take(in_q, batch_size)
+            if items is None:
+                return
+            dabmetrics.incr('harvest_items', len(items), stage=stage)
+            try:
+                with dabmetrics.timed('harvest_stage', stage=stage):
+                    results = func(items)
+            except Exception as e:
+                print 'harvest stage', stage, 'failed:', repr(e)
+                continue
+            if out_q is not None:
+                for r in results:
+                    out_q.put(r)
 
-    pages    = green_call_list(get_articles, page_ids)
-    dabblets = sum([ get_dabblets(p) for p in pages ], [])
+    def run():
+        gevent.joinall([ gevent.spawn(work) for i in range(workers) ])
+        if out_q is not None:
+            out_q.put(_DONE)
+    return gevent.spawn(run)
 
-    # TODO start transaction
-    for d in dabblets:
-        d.save()
+def harvest(count=1000,
+            page_ids=None,
+            queue_size=HARVEST_QUEUE_SIZE,
+            article_workers=ARTICLE_WORKERS,
+            parse_workers=PARSE_WORKERS,
+            choice_workers=CHOICE_WORKERS,
+            parse_procs=0,      # worker processes to parse in, see dabparse
+            metrics_path=None,  # where to append a dabmetrics snapshot
+            skip_solved=False): # leave out links already solved on the page
+    """
+    Streams pages (count from the dab category, or page_ids) through fetch,
+    extract, choice fetch and DB write stages joined by bounded queues.
+    """
+    extractor = dabextract
+    if parse_procs:
+        extractor = dabparse.ParsePool(parse_procs)
+        parse_workers = max(parse_workers, extractor.size)
+
+    stats = {'pages': 0, 'dabblets': 0, 'choices': 0}
+    queues = id_q, page_q, dab_q, write_q = [ Queue(queue_size) for i in range(4) ]
+    dabmetrics.gauge('harvest_queues', lambda: [ q.qsize() for q in queues ])
+
+    def fetch_pages(page_ids):
+        return get_article_batch(page_ids)
+
+    no_dabblets = [] # harvested pages save_dabblets won't hear of
+
+    def extract_dabblets(pages):
+        stats['pages'] += len(pages)
+        solved = set()
+        if skip_solved:
+            solved = dabase.get_solved_links([ p.pageid for p in pages ])
+        ret = []
+        for p in pages:
+            dabblets = [ d for d in get_dabblets(p, extractor)
+                         if (d.source_pageid, d.title) not in solved ]
+            if not dabblets:
+                no_dabblets.append(p.pageid)
+            ret.extend(dabblets)
+        return ret
+
+    dab_pages = DabPageCache(extractor)
+    def fetch_choices(dabblets):
+        return assign_dab_pages(dabblets, dab_pages)
 
-    all_choices = green_call_list(get_dab_choices, dabblets)
+    def write(dabblets):
+        stats['choices']  += dabase.save_dabblets(dabblets)
+        stats['dabblets'] += len(dabblets)
+        if no_dabblets:
+            dabase.mark_harvested(no_dabblets)
+            del no_dabblets[:]
+        return []
 
-    for c in all_choices:
-        c.save()
-    # TODO end transaction 
+    stages = [ _stage(fetch_pages, id_q, page_q, article_workers, API_MAX_IDS),
+               _stage(extract_dabblets, page_q, dab_q, parse_workers),
+               _stage(fetch_choices, dab_q, write_q, choice_workers, API_MAX_IDS),
+               _stage(write, write_q, batch_size=WRITE_BATCH) ]
+
+    try:
+        try:
+            if page_ids is None:
+                page_ids = get_dab_page_ids(count=count)
+            for page_id in page_ids:
+                id_q.put(page_id)
+        finally:
+            # even if page_ids raised, so the stages finish what they have
+            id_q.put(_DONE)
+            gevent.joinall(stages)
+        if no_dabblets:
+            dabase.mark_harvested(no_dabblets)
+    finally:
+        if extractor is not dabextract:
+            extractor.close()
+    if metrics_path:
+        dabmetrics.dump(metrics_path)
+    return stats
+
+def check_sources(reharvest=True):
+    """
+    Marks pool dabblets stale if their source page changed, and harvests
+    the edited pages again. Returns the number marked stale.
+    """
+    harvested = {}
+    for pageid, revid in dabase.get_pool_sources():
+        harvested.setdefault(pageid, set()).add(revid)
+    pageids = harvested.keys()
+    batches = [ pageids[i:i+API_MAX_IDS] for i in range(0, len(pageids), API_MAX_IDS) ]
+    results = Pool(ARTICLE_CONC).map(lambda b: get_page_infos(page_ids=b), batches)
+
+    changed = {}
+    for batch, infos in zip(batches, results):
+        if infos is None:
+            continue # left for the next check
+        current = dict([ (i.pageid, i.lastrevid) for i in infos ])
+        for pageid in batch:
+            if harvested[pageid] != set([current.get(pageid)]):
+                changed[pageid] = current.get(pageid)
+    if not changed:
+        return 0
+
+    stale = dabase.mark_stale(changed)
+    edited = [ pageid for pageid, revid in changed.items() if revid is not None ]
+    print len(pageids), 'source pages checked,', len(changed), 'changed,', \
+        len(stale), 'dabblets marked stale'
+    if reharvest and edited:
+        harvest(page_ids=edited, skip_solved=True)
+    return len(stale)
+
+def save_a_bunch(count=1000, db_name='abunch', **kwargs):
+    dabase.init(db_name)
+    dabcache.init()
+
+    start = time.time()
+    stats = harvest(count, **kwargs)
     end = time.time()
 
-    print len(dabblets), 'Dabblets saved to', db_name, 'in', end-start, 'seconds'
-    print len(set([d.title for d in dabblets])), 'unique titles'
-    print len(set([d.source_title for d in dabblets])), 'unique source pages'
-    print len(all_choices), 'dabblet choices fetched and saved.'
+    print stats['dabblets'], 'Dabblets saved to', db_name, 'in', end-start, 'seconds'
+    print stats['pages'], 'source pages fetched'
+    print stats['choices'], 'dabblet choices fetched and saved.'
+    dabmetrics.report('harvest_stage')
 
     print Dabblet.select().count(), 'total records in database'
-    print len(set([d.title for d in Dabblet.select()])), 'unique titles in database'
+    print Dabblet.select(['title']).distinct().count(), 'unique titles in database'
 
-    return dabblets
+    return stats
 
 def test():
     print 'getting one article by ID'
@@ -391,5 +1063,5 @@ def test():
     title_articles = get_articles(titles=["Dog"], raise_exc=True)
 
 if __name__ == '__main__':
-    dabblets = save_a_bunch(600)
+    stats = save_a_bunch(600)
     import pdb;pdb.set_trace()
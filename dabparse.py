@@ -0,0 +1,103 @@
+"""
+Runs dabextract in worker processes, so a harvest can parse on every
+core while fetching stays on gevent in the parent. Pages go over a
+pipe as plain text and come back as the same plain tuples dabextract
+returns; no models cross the process boundary.
+"""
+import multiprocessing
+from gevent.queue import Queue
+from gevent.socket import wait_read
+
+import dabextract
+
+_FUNCS = {'extract_dab_links':   dabextract.extract_dab_links,
+          'extract_dab_choices': dabextract.extract_dab_choices}
+
+
+class WorkerError(Exception): pass
+
+
+def _work(requests, results):
+    while True:
+        try:
+            msg = requests.recv()
+        except EOFError:
+            return
+        if msg is None:
+            return
+        name, text = msg
+        try:
+            results.send((True, _FUNCS[name](text)))
+        except Exception as e:
+            results.send((False, repr(e)))
+
+
+class ParsePool(object):
+    """
+    Has the same extract_dab_links() and extract_dab_choices() as
+    dabextract, so it can be passed wherever that is. A call only
+    blocks the calling greenlet, and waits for an idle worker first.
+    Start it before spawning much, since every worker is a fork.
+    """
+    def __init__(self, size=None):
+        self.size = size or multiprocessing.cpu_count()
+        self.idle = Queue()
+        self.procs = {} # (request pipe, result pipe) -> process
+        for i in range(self.size):
+            self._start_worker()
+
+    def _start_worker(self):
+        # one-way pipes are plain os.pipe()s, where a duplex Pipe would be
+        # a socketpair, which gevent's patching leaves non-blocking
+        req_read, req_write = multiprocessing.Pipe(duplex=False)
+        res_read, res_write = multiprocessing.Pipe(duplex=False)
+        proc = multiprocessing.Process(target=_work, args=(req_read, res_write))
+        proc.daemon = True
+        proc.start()
+        req_read.close()
+        res_write.close()
+        worker = (req_write, res_read)
+        self.procs[worker] = proc
+        self.idle.put(worker)
+
+    def _call(self, name, text):
+        worker = self.idle.get()
+        req_write, res_read = worker
+        try:
+            req_write.send((name, text))
+            wait_read(res_read.fileno())
+            ok, result = res_read.recv()
+        except BaseException:
+            # an answer may still be on its way, so don't reuse the pipes
+            self._retire(worker)
+            self._start_worker()
+            raise
+        self.idle.put(worker)
+        if not ok:
+            raise WorkerError(result)
+        return result
+
+    def _retire(self, worker):
+        self.procs.pop(worker).terminate()
+        for conn in worker:
+            conn.close()
+
+    def extract_dab_links(self, text):
+        return self._call('extract_dab_links', text)
+
+    def extract_dab_choices(self, text):
+        return self._call('extract_dab_choices', text)
+
+    def close(self):
+        for (req_write, res_read), proc in self.procs.items():
+            try:
+                req_write.send(None)
+            except IOError:
+                pass
+            req_write.close()
+            res_read.close()
+        for proc in self.procs.values():
+            proc.join(1)
+            if proc.is_alive():
+                proc.terminate()
+        self.procs = {}
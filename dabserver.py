@@ -1,20 +1,255 @@
+import os
+import sys
+import json
+import random
+import gevent
+from gevent.queue import Queue, Empty
+from gevent.event import Event
+from datetime import datetime
 import bottle
-from bottle import route, run, response
+from bottle import route, run, response, request, abort
+import dabmetrics
+
+
+class TimingPlugin(object):
+    "Times every route into the dabmetrics 'route' histogram."
+    name = 'timing'
+    api = 2
+
+    def apply(self, callback, route):
+        rule = route.rule
+        def wrapper(*a, **ka):
+            with dabmetrics.timed('route', rule=rule):
+                return callback(*a, **ka)
+        return wrapper
+
+# installed ahead of bottle_jsonp's plugin, so it wraps (and times) that too
+bottle.install(TimingPlugin())
 import bottle_jsonp
 
 import dabnabbit
+import dabase
+import dabcache
 
-bottle.debug(True)
+DB_NAME         = 'dabserver'
+HOST            = 'localhost'
+PORT            = 8080
+MAX_CLIENTS     = 1000 # requests handled at once
+REQUEST_TIMEOUT = 30 # secs
+POOL_LOW_WATER  = 200 # unsolved dabblets
+POOL_CRAWL      = 2000 # category members to pick new pages from
+POOL_REFILL     = 100 # source pages per refill
+POOL_CHECK_SECS = 30
+CRAWL_SECS      = 900 # between crawls of the dab category
+VALIDATE_SECS   = 3600 # between checks for edited source pages
+SOLUTION_BATCH  = 500 # solutions per commit, at most
+SOLUTION_WAIT   = 0.5 # secs to let solutions pile up before a commit
+EDIT_TOKEN      = None # set to write consensus solutions back to Wikipedia
+WRITE_BACK_SECS = 600 # between write-backs, so a page's solutions go in one edit
+
+solution_q = Queue()
+crawled = Event() # set once the first category crawl is over
+write_back_q = None # a dabnabbit.SolutionQueue, if writing back
+
+FAKE_DABS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_dabs.json')
+_fake_dabs = {}
+
+def _fake_dabs_json():
+    if 'json' not in _fake_dabs:
+        with open(FAKE_DABS_PATH) as f:
+            _fake_dabs['json'] = f.read()
+    return _fake_dabs['json']
 
-@route('/fake/')
 def fake_dabs():
-    null = ''
-    dabs = {"dabs": [{"images": [], "page_title": "14th Bombardment Squadron", "options": [{"text": "4S (disambiguation)", "dab_title": "S4", "title": "4S (disambiguation)"}, {"text": "Yamaha grand piano model S4", "dab_title": "S4", "title": "Yamaha grand piano"}, {"text": "British NVC community S4, a swamps and tall-herb fens in the British National Vegetation Classification system", "dab_title": "S4", "title": "British NVC community S4 (page does not exist)"}, {"text": "Shareable SG2 (Fire Control) Software Suite (S4), a common development between NATO nations for artillery software", "dab_title": "S4", "title": "Shareable SG2 (Fire Control) Software Suite (S4) (page does not exist)"}, {"text": "Form S-4, a form required by the Securities and Exchange Commission to declare Mergers and Acquisitions", "dab_title": "S4", "title": "Form S-4"}, {"text": "S4, a sustainability trends in fashion newsletter created by model Summer Rayne Oakes", "dab_title": "S4", "title": "Summer Rayne Oakes"}, {"text": "Source Four, an ERS theatre lighting fixture by Electronic Theatre Controls", "dab_title": "S4", "title": "Source Four"}, {"text": "Lancia Delta S4, a 1984 Group B rally car", "dab_title": "S4", "title": "Lancia Delta S4"}, {"text": "Bremen S-Bahn line S4", "dab_title": "S4", "title": "Bremen S-Bahn"}, {"text": "Nikon Coolpix S4, a 6.0 million pixels digital camera", "dab_title": "S4", "title": "Nikon Coolpix S4"}, {"text": "Munich S-Bahn line S4", "dab_title": "S4", "title": "Munich S-Bahn"}, {"text": "Rans S-4 Coyote, an ultralight aircraft", "dab_title": "S4", "title": "Rans S-4 Coyote"}, {"text": "S4, a normal modal logic", "dab_title": "S4", "title": "Kripke semantics"}, {"text": "line S4 (Rhine-Ruhr S-Bahn) of the Rhein-Ruhr S-Bahn", "dab_title": "S4", "title": "S4 (Rhine-Ruhr S-Bahn)"}, {"text": "Stuttgart S-Bahn line S4", "dab_title": "S4", "title": "Stuttgart S-Bahn"}, {"text": "USS S-4 (SS-109), a 1919 US Navy submarine", "dab_title": "S4", "title": "USS S-4 (SS-109)"}, {"text": "Rostock S-Bahn line S4, a 2010-planned future line", "dab_title": "S4", "title": "Rostock S-Bahn"}, {"text": "Audi S4, a car", "dab_title": "S4", "title": "Audi S4"}, {"text": "S4: Keep away from living quarters, a safety phrase in chemistry", "dab_title": "S4", "title": "S4: Keep away from living quarters"}, {"text": "hibernation a sleeping state in which the contents of RAM are saved to a hard disk (Advanced Configuration and Power Interface code)", "dab_title": "S4", "title": "Hibernate (OS feature)"}, {"text": "S4 (military), a logistics officer within military units", "dab_title": "S4", "title": "S4 (military)"}, {"text": "S (programming language) version 4", "dab_title": "S4", "title": "S (programming language)"}, {"text": "S-4 (Sector Four) a rumored secret military installation in Nevada", "dab_title": "S4", "title": "S-4 (Sector Four)"}, {"text": "Seibel S-4, a 1951 helicopter", "dab_title": "S4", "title": "Seibel S-4"}, {"text": "Stadtbahn Karlsruhe line S4", "dab_title": "S4", "title": "Stadtbahn Karlsruhe"}, {"text": "Fourth sacrum of the vertebral column, in human anatomy", "dab_title": "S4", "title": "Sacrum"}, {"text": "Sonic the Hedgehog 4, a video game by Sega", "dab_title": "S4", "title": "Sonic the Hedgehog 4"}, {"text": "SOCOM 4, a 2011 video game developed by Zipper Interactive", "dab_title": "S4", "title": "SOCOM 4"}, {"text": "Rhine-Main S-Bahn line S4", "dab_title": "S4", "title": "Rhine-Main S-Bahn"}, {"text": "Hydra Technologies Eh\u00e9catl, S4, A Mexican Unmanned aerial vehicle (UAV) made by Hydra technologies of Mexico", "dab_title": "S4", "title": "Hydra Technologies Eh\u00e9catl"}, {"text": "Alco S-4, a locomotive", "dab_title": "S4", "title": "Alco S-4"}, {"text": "Berlin S-Bahn line S4", "dab_title": "S4", "title": "Berlin S-Bahn"}, {"text": "Letov \u0160-4, a 1923 Czechoslovak single-bay unstaggared biplane fighter", "dab_title": "S4", "title": "Letov \u0160-4"}, {"text": "Hanover S-Bahn line S4", "dab_title": "S4", "title": "Hanover S-Bahn"}, {"text": "Prussian S 4, a 1894 steam locomotives class", "dab_title": "S4", "title": "Prussian S 4"}, {"text": "RheinNeckar S-Bahn line S4", "dab_title": "S4", "title": "RheinNeckar S-Bahn"}, {"text": "SG2 Shareable (Fire Control) Software Suite (S4), shareable fire control software developed by NATO", "dab_title": "S4", "title": "SG2 Shareable (Fire Control) Software Suite (S4)"}, {"text": "Supermarine S.4, a 1925 British single-engined single-seat monoplane racing seaplane", "dab_title": "S4", "title": "Supermarine S.4"}, {"text": "County Route S4 (California), a road in San Diego, California", "dab_title": "S4", "title": "County Route S4 (California)"}, {"text": "Fourth heart sound, an abnormal heart sound often indicative of congestive heart failure or cor pulmonale", "dab_title": "S4", "title": "Fourth heart sound"}, {"text": "S4 algebra, a variety of modal algebras, also called Interior algebra", "dab_title": "S4", "title": "S4 algebra"}, {"text": "S4 standard, a standard of P4 gauge with reduced tolerance, a highly accurate 4mm/1\u00a0ft  railways modeling format", "dab_title": "S4", "title": "P4 gauge"}, {"text": "S4 (ZVV) line S4, a line of the S-Bahn Z\u00fcrich in Switzerland", "dab_title": "S4", "title": "S4 (ZVV)"}, {"text": "S04, a code name for FC Schalke 04", "dab_title": "S4", "title": "S04"}, {"text": "S4 League, a Korean MMORPG Shooter made by Pentavision, the makers of the music video game, DJMAX", "dab_title": "S4", "title": "S4 League"}, {"text": "SATA International (IATA airline designator)", "dab_title": "S4", "title": "SATA International"}, {"text": "S postcode area, covering areas of northern Sheffield", "dab_title": "S4", "title": "S postcode area"}, {"text": "Tetrasulfur, an allotrope of sulfur", "dab_title": "S4", "title": "Tetrasulfur"}, {"text": "Sacral spinal nerve 4, a spinal nerve of the sacral segment", "dab_title": "S4", "title": "Sacral spinal nerve 4"}], "context": "<ul class=\"dab-context\"><li> <a href=\"/wiki/JN-4\" title=\"JN-4\" class=\"mw-redirect\">JN-4</a>, <a href=\"/w/index.php?title=JN-6&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"JN-6 (page does not exist)\">JN-6</a>, and <a href=\"/wiki/S-4\" title=\"S-4\" class=\"dab-link mw-redirect\">S-4</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=14th_Bombardment_Squadron&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup> during period 1917\u20131918.\n</li><li> <a href=\"/wiki/Curtiss_Falcon\" title=\"Curtiss Falcon\">O-1</a>, 1928 \u2013 c. 1930,\n</li><li> <a href=\"/wiki/Douglas_O-2\" title=\"Douglas O-2\">Douglas O-2</a> and <a href=\"/wiki/P-1_Hawk\" title=\"P-1 Hawk\" class=\"mw-redirect\">P-1 Hawk</a>, 1928 \u2013 c. 1931,\n</li><li>  <a href=\"/wiki/O-38\" title=\"O-38\" class=\"mw-redirect\">O-38</a>, 1931\u20131935,\n</li><li>included, <a href=\"/wiki/DH-4\" title=\"DH-4\" class=\"mw-redirect\">DH-4</a>, <a href=\"/wiki/Curtiss_Falcon\" title=\"Curtiss Falcon\">A-3</a>, <a href=\"/wiki/Douglas_C-1\" title=\"Douglas C-1\">Douglas C-1</a>, <a href=\"/wiki/Fokker_C-2\" title=\"Fokker C-2\" class=\"mw-redirect\">C-2</a>, <a href=\"/wiki/Ford_Trimotor\" title=\"Ford Trimotor\">C-4</a>, <a href=\"/wiki/Fokker_C-5\" title=\"Fokker C-5\" class=\"mw-redirect\">C-5</a>, <a href=\"/wiki/Sikorsky_S-38\" title=\"Sikorsky S-38\">C-6</a>, <a href=\"/wiki/Ford_C-9\" title=\"Ford C-9\" class=\"mw-redirect\">C-9</a>, C-n, <a href=\"/wiki/Y1C-12\" title=\"Y1C-12\" class=\"mw-redirect\">Y1C-12</a>, <a href=\"/wiki/Y1C-17\" title=\"Y1C-17\" class=\"mw-redirect\">Y1C-17</a>, <a href=\"/wiki/Y1C-19\" title=\"Y1C-19\" class=\"mw-redirect\">Y1C-19</a>, <a href=\"/wiki/Lockheed_Y1C-23\" title=\"Lockheed Y1C-23\" class=\"mw-redirect\">Lockheed Y1C-23</a>, <a href=\"/wiki/C-30_Condor\" title=\"C-30 Condor\" class=\"mw-redirect\">C-30 Condor</a>, <a href=\"/wiki/Douglas_C-34\" title=\"Douglas C-34\" class=\"mw-redirect\">C-34</a>, <a href=\"/wiki/Curtiss_Falcon\" title=\"Curtiss Falcon\">O-11</a>, <a href=\"/wiki/Curtiss_Falcon\" title=\"Curtiss Falcon\">O-13</a>, <a href=\"/w/index.php?title=O-29&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"O-29 (page does not exist)\">O-29</a>, <a href=\"/wiki/O-43\" title=\"O-43\" class=\"mw-redirect\">O-43</a>, <a href=\"/wiki/OA-1\" title=\"OA-1\" class=\"mw-redirect\">OA-1</a>, <a href=\"/wiki/PW-9\" title=\"PW-9\" class=\"mw-redirect\">PW-9</a>, <a href=\"/wiki/Boeing_P-12\" title=\"Boeing P-12\">Boeing P-12</a>, <a href=\"/wiki/P-26_Peashooter\" title=\"P-26 Peashooter\" class=\"mw-redirect\">P-26 Peashooter</a>, <a href=\"/wiki/P-1_Hawk\" title=\"P-1 Hawk\" class=\"mw-redirect\">AT-5</a>, <a href=\"/wiki/PT-1\" title=\"PT-1\" class=\"mw-redirect\">PT-1</a>, <a href=\"/wiki/BT-2\" title=\"BT-2\" class=\"mw-redirect\">BT-2</a>, and apparently <a href=\"/wiki/YB-9\" title=\"YB-9\" class=\"mw-redirect\">YB-9</a>, <a href=\"/wiki/Martin_B-10\" title=\"Martin B-10\">Martin B-10</a>, <a href=\"/wiki/C-29_Dolphin\" title=\"C-29 Dolphin\" class=\"mw-redirect\">C-29 Dolphin</a>, and <a href=\"/wiki/Thomas-Morse_YO-20\" title=\"Thomas-Morse YO-20\" class=\"mw-redirect\">Thomas-Morse YO-20</a> during period 1928\u20131936\n</li><li> <a href=\"/wiki/B-18_Bolo\" title=\"B-18 Bolo\" class=\"mw-redirect\">B-18 Bolo</a>, 1940\u20131941\n</li><li> <a href=\"/wiki/B-17_Flying_Fortress\" title=\"B-17 Flying Fortress\" class=\"mw-redirect\">B-17 Flying Fortress</a>, 1941\n</li><li> B-17, and probably <a href=\"/wiki/B-24\" title=\"B-24\" class=\"mw-redirect\">B-24</a> and <a href=\"/wiki/LB-30\" title=\"LB-30\" class=\"mw-redirect\">LB-30</a>, December 7, 1941 \u2013 c. March 1, 1942\n</li></ul>", "title": "S-4"}, {"images": [], "page_title": "1420s in England", "options": [{"text": "John McDouall Stuart (1815\u20131866), explorer, the first European to successfully traverse Australia from south to north", "dab_title": "John Stuart", "title": "John McDouall Stuart"}, {"text": "John Stuart, co-founder of locomotive builders Kerr Stuart", "dab_title": "John Stuart", "title": "Kerr Stuart"}, {"text": "John Stuart (Canadian politician) (1830\u20131913), Member of Parliament in the late 19th century", "dab_title": "John Stuart", "title": "John Stuart (Canadian politician)"}, {"text": "John Stuart (actor) (1898\u20131979), Scottish actor", "dab_title": "John Stuart", "title": "John Stuart (actor)"}, {"text": "Sir John Stuart, 4th Baronet (died 1821), MP for Kincardineshire", "dab_title": "John Stuart", "title": "Sir John Stuart, 4th Baronet"}, {"text": "John Stuart (loyalist) (1718\u20131779), British Superintendent of Indian Affairs in the southern colonies during the American Revolution", "dab_title": "John Stuart", "title": "John Stuart (loyalist)"}, {"text": "John Stuart, Lord Mount Stuart (1767\u20131794), Scottish Tory politician", "dab_title": "John Stuart", "title": "John Stuart, Lord Mount Stuart"}, {"text": "John Stuart (genealogist) (1813\u20131877), Scottish antiquarian, genealogist", "dab_title": "John Stuart", "title": "John Stuart (genealogist)"}, {"text": "Jon Stewart (born 1962), US comedian, TV host of The Daily Show", "dab_title": "John Stuart", "title": "Jon Stewart"}, {"text": "John Stuart, 3rd Earl of Bute (1713\u20131792), Prime Minister of Great Britain from 1762\u20131763", "dab_title": "John Stuart", "title": "John Stuart, 3rd Earl of Bute"}, {"text": "John Stuart, Count of Maida (1759\u20131815), British soldier, lieutenant-general during the Napoleonic Wars", "dab_title": "John Stuart", "title": "John Stuart, Count of Maida"}, {"text": "John T. Stuart (1807\u20131885), U.S. Representative from Illinois and law partner of Abraham Lincoln", "dab_title": "John Stuart", "title": "John T. Stuart"}, {"text": "John Stuart (Nova Scotia politician) (1752\u20131835), lawyer and politician in Nova Scotia", "dab_title": "John Stuart", "title": "John Stuart (Nova Scotia politician)"}, {"text": "John Stuart (CEO) (1877\u20131969), CEO of the Quaker Oats Company", "dab_title": "John Stuart", "title": "John Stuart (CEO)"}, {"text": "John Stuart (1743\u20131821), reviser of the New Testament in Scottish Gaelic", "dab_title": "John Stuart", "title": "John Stuart (1743\u20131821)"}, {"text": "John Leighton Stuart (1876\u20131962), President of Yenching University and later United States ambassador to China", "dab_title": "John Stuart", "title": "John Leighton Stuart"}, {"text": "John Stuart, 1st Marquess of Bute (1744\u20131814)", "dab_title": "John Stuart", "title": "John Stuart, 1st Marquess of Bute"}, {"text": "John Stuart, Jr. (1912\u20131997), one of the heirs to the Quaker Oats Company fortune", "dab_title": "John Stuart", "title": "John Stuart, Jr."}, {"text": "John Stuart (judge) (1793\u20131876), British Conservative MP 1846\u20131852, judge from 1852", "dab_title": "John Stuart", "title": "John Stuart (judge)"}, {"text": "John Stuart Mill (1806\u20131873), 19th century philosopher", "dab_title": "John Stuart", "title": "John Stuart Mill"}, {"text": "John Stuart (Virginia) (1749\u20131823), western Virginia settler and soldier at the Battle of Point Pleasant", "dab_title": "John Stuart", "title": "John Stuart (Virginia)"}, {"text": "John Stewart (disambiguation)", "dab_title": "John Stuart", "title": "John Stewart (disambiguation)"}, {"text": "John Stuart, 12th Earl of Moray (1797\u20131867), Scottish soldier and politician", "dab_title": "John Stuart", "title": "John Stuart, 12th Earl of Moray"}, {"text": "John Stuart (explorer) (1780\u20131847), Canadian explorer", "dab_title": "John Stuart", "title": "John Stuart (explorer)"}], "context": "<li class=\"dab-context\"> 12 February - Hundred Years' War: at the <a href=\"/wiki/Battle_of_the_Herrings\" title=\"Battle of the Herrings\">Battle of the Herrings</a>, English forces under Sir <a href=\"/wiki/John_Fastolf\" title=\"John Fastolf\">John Fastolf</a> defend a supply convoy carrying rations to the army of <a href=\"/wiki/William_de_la_Pole,_1st_Duke_of_Suffolk\" title=\"William de la Pole, 1st Duke of Suffolk\">William de la Pole, 4th Earl of Suffolk</a> at <a href=\"/wiki/Orl%C3%A9ans\" title=\"Orl\u00e9ans\">Orl\u00e9ans</a> from attack by the <a href=\"/wiki/Charles_I,_Duke_of_Bourbon\" title=\"Charles I, Duke of Bourbon\">Comte de Clermont</a> and <a href=\"/wiki/John_Stuart\" title=\"John Stuart\" class=\"dab-link\">John Stuart</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=1420s_in_England&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup>.\n</li>", "title": "John Stuart"}, {"images": ["//upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Eisenhower_d-day.jpg/200px-Eisenhower_d-day.jpg", "//upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Paratrooper_applies_war_paint_111-SC-193551cropped.jpg/220px-Paratrooper_applies_war_paint_111-SC-193551cropped.jpg", "//upload.wikimedia.org/wikipedia/commons/thumb/3/38/101st_Airborne_Division_-_WW2_01.jpg/220px-101st_Airborne_Division_-_WW2_01.jpg"], "page_title": "101st Airborne Division", "options": [{"text": "John Miller, Jr (bassoonist) (born 1942), American bassoonist, principal of the Minnesota Orchestra", "dab_title": "John Miller", "title": "John Miller, Jr (bassoonist)"}, {"text": "John Classon Miller (1836\u20131884), Ontario lumber merchant and political figure", "dab_title": "John Miller", "title": "John Classon Miller"}, {"text": "John Miller (entrepreneur) (1872\u20131941), roller coaster designer and builder", "dab_title": "John Miller", "title": "John Miller (entrepreneur)"}, {"text": "John P. Miller (born 1976), birthname of actor and singer Austin Miller", "dab_title": "John Miller", "title": "Austin Miller"}, {"text": "John Franklin Miller (senator) (1831\u20131886), U.S. Senator from California, uncle of John Franklin Miller the Washington congressman", "dab_title": "John Miller", "title": "John Franklin Miller (senator)"}, {"text": "John Miller (pitcher) (born 1941), American baseball player for the Baltimore Orioles", "dab_title": "John Miller", "title": "John Miller (pitcher)"}, {"text": "John Miller (journalist and author), British journalist and author", "dab_title": "John Miller", "title": "John Miller (journalist and author)"}, {"text": "John Miller (Missouri politician) (1781\u20131846), Governor of Missouri, 1826\u20131832; U.S. Representative from Missouri, 1837\u20131843", "dab_title": "John Miller", "title": "John Miller (Missouri politician)"}, {"text": "John Gaines Miller (1812\u20131856), U.S. Representative from Missouri", "dab_title": "John Miller", "title": "John Gaines Miller"}, {"text": "John Miller (footballer born 1878) (1878-unknown), Scottish footballer for Burnley", "dab_title": "John Miller", "title": "John Miller (footballer born 1878)"}, {"text": "Miller (name)", "dab_title": "John Miller", "title": "Miller (name)"}, {"text": "John J. Miller (born 1970), American political reporter", "dab_title": "John Miller", "title": "John J. Miller"}, {"text": "John Michael Miller (born 1946), Canadian prelate of the Roman Catholic Church", "dab_title": "John Miller", "title": "John Michael Miller"}, {"text": "John Lester Miller (1901\u20131978), U.S. federal judge", "dab_title": "John Miller", "title": "John Lester Miller"}, {"text": "John Miller (cyclist) (1881\u20131957), British Olympic road racing cyclist", "dab_title": "John Miller", "title": "John Miller (cyclist)"}, {"text": "John Miller (1865 Medal of Honor recipient) (1839\u20131882), Medal of Honor recipient", "dab_title": "John Miller", "title": "John Miller (1865 Medal of Honor recipient)"}, {"text": "John Stewart Miller (born 1844), former Member of Provincial Parliament in Ontario", "dab_title": "John Miller", "title": "John Stewart Miller"}, {"text": "John Miller (linebacker) (born 1960), NFL player, 1987", "dab_title": "John Miller", "title": "John Miller (linebacker)"}, {"text": "John Miller (film), American film producer", "dab_title": "John Miller", "title": "John Miller (film)"}, {"text": "John William Miller (1895\u20131978), American philosopher", "dab_title": "John Miller", "title": "John William Miller"}, {"text": "John Miller (rower) (1903\u20131965), American rower", "dab_title": "John Miller", "title": "John Miller (rower)"}, {"text": "Jon Miller (disambiguation)", "dab_title": "John Miller", "title": "Jon Miller (disambiguation)"}, {"text": "John Frederick Miller (1759\u20131796), English illustrator", "dab_title": "John Miller", "title": "John Frederick Miller"}, {"text": "John Miller (journalist), Assistant Director of Public Affairs for the FBI and former co-host of 20/20", "dab_title": "John Miller", "title": "John Miller (journalist)"}, {"text": "John Lucas Miller (1831\u20131864), attorney and state legislator in South Carolina", "dab_title": "John Miller", "title": "John Lucas Miller"}, {"text": "Jack Miller (disambiguation)", "dab_title": "John Miller", "title": "Jack Miller (disambiguation)"}, {"text": "Sir John Miller, 3rd Baronet (1867\u20131918), Justice of the Peace and magistrate for Kent, 1889", "dab_title": "John Miller", "title": "Miller Baronets"}, {"text": "Sir John Riggs Miller (c. 1744\u20131798), Anglo-Irish politician", "dab_title": "John Miller", "title": "John Riggs Miller"}, {"text": "John Miller (author), historical fiction author", "dab_title": "John Miller", "title": "John Miller (author)"}, {"text": "John Miller (basketball), American basketball coach", "dab_title": "John Miller", "title": "John Miller (basketball)"}, {"text": "John Miller (Washington politician) (born 1938), U.S. Representative from Washington", "dab_title": "John Miller", "title": "John Miller (Washington politician)"}, {"text": "John Miller (guitarist), from Pennsylvania, who recorded albums Rounder Records and \u202aBlue Goose Records\u202c", "dab_title": "John Miller", "title": "John Miller (guitarist) (page does not exist)"}, {"text": "Johnny Miller (disambiguation)", "dab_title": "John Miller", "title": "Johnny Miller (disambiguation)"}, {"text": "John Miller (outlaw) (c.1850\u20131937)", "dab_title": "John Miller", "title": "John Miller (outlaw)"}, {"text": "John Douglas Miller (1860-1903), English engraver", "dab_title": "John Miller", "title": "John Douglas Miller"}, {"text": "John Henry Miller (1702\u20131782), printer and publisher", "dab_title": "John Miller", "title": "John Henry Miller"}, {"text": "John E. Miller (1888\u20131981), U.S. federal judge", "dab_title": "John Miller", "title": "John E. Miller"}, {"text": "John Miller (first baseman) (born 1944), baseball player in the United States (1966\u20131969) and Japan (1970\u20131972)", "dab_title": "John Miller", "title": "John Miller (first baseman)"}, {"text": "John Miller (minister), Moderator of the General Assembly of the Church of Scotland, 2001", "dab_title": "John Miller", "title": "John Miller (minister)"}, {"text": "John Franklin Miller (representative) (1862\u20131936), U.S. Representatives for Washington", "dab_title": "John Miller", "title": "John Franklin Miller (representative)"}, {"text": "John Miller (footballer born 1870) (1870\u20131933), Scottish footballer with Liverpool and Sheffield Wednesday", "dab_title": "John Miller", "title": "John Miller (footballer born 1870)"}, {"text": "Sir John Miller, 2nd Baronet (1665\u20131721), MP for Chichester 1698\u20131700, 1701\u20131705 and 1710\u20131713 and Sussex 1701", "dab_title": "John Miller", "title": "Miller Baronets"}, {"text": "John K. Miller (1819\u20131863), U.S. Representative from Ohio", "dab_title": "John Miller", "title": "John K. Miller"}, {"text": "John Miller (North Dakota politician) (1843\u20131908), Governor of North Dakota, 1889\u20131891", "dab_title": "John Miller", "title": "John Miller (North Dakota politician)"}, {"text": "John Bryan Peter Miller (1903\u20131994), British recipient of the George Cross in World War II", "dab_title": "John Miller", "title": "John Bryan Peter Miller"}, {"text": "John Ontario Miller (1857\u20131943), British Indian civil servant", "dab_title": "John Miller", "title": "John Ontario Miller"}, {"text": "John Miller (offensive lineman) (born 1934), NFL player, 1956\u20131960", "dab_title": "John Miller", "title": "John Miller (offensive lineman)"}, {"text": "John Millar (disambiguation)", "dab_title": "John Miller", "title": "John Millar (disambiguation)"}, {"text": "John Ramsey Miller (born 1949), American author", "dab_title": "John Miller", "title": "John Ramsey Miller"}, {"text": "John Miller (engineer) (1805\u20131883), MP for Edinburgh 1868\u20131874", "dab_title": "John Miller", "title": "John Miller (engineer)"}, {"text": "John Milton Miller (1882\u20131962), American electrical engineer", "dab_title": "John Miller", "title": "John Milton Miller"}, {"text": "Ox Miller (1915\u20132007), John Anthony \"Ox\" Miller, American MLB pitcher", "dab_title": "John Miller", "title": "Ox Miller"}, {"text": "John Miller (engineer) (1805\u20131883), 19th century Edinburgh-based railway engineer (Grainger & Miller)", "dab_title": "John Miller", "title": "John Miller (engineer)"}, {"text": "John Jackson Miller (born 1968), American comic book writer and commentator", "dab_title": "John Miller", "title": "John Jackson Miller"}, {"text": "John P. Miller, United States Navy officer and acting Naval Governor of Guam", "dab_title": "John Miller", "title": "John P. Miller"}, {"text": "John Miller (Virginia politician) (born 1947), State Senator from Virginia", "dab_title": "John Miller", "title": "John Miller (Virginia politician)"}, {"text": "Captain John H. Miller, fictional character in the 1998 film Saving Private Ryan", "dab_title": "John Miller", "title": "Saving Private Ryan"}, {"text": "John J. Miller (author) (born 1954), science fiction author known for his work in the Wild Cards series", "dab_title": "John Miller", "title": "John J. Miller (author)"}, {"text": "John Miller (artist) (1931\u20132002), English artist specializing in beach scenes", "dab_title": "John Miller", "title": "John Miller (artist)"}, {"text": "John Grider Miller (1935\u20132009), Colonel in the United States Marine Corps", "dab_title": "John Miller", "title": "John Grider Miller"}, {"text": "John Miller (Australian politician) (1870\u20131934), New South Wales state MP", "dab_title": "John Miller", "title": "John Miller (Australian politician)"}, {"text": "John Miller (musician) (born 1945), Broadway music coordinator and actor", "dab_title": "John Miller", "title": "John Miller (musician)"}, {"text": "John Miller (footballer born 1897),(1879\u2013unknown), Scottish footballer for Liverpool", "dab_title": "John Miller", "title": "John Miller (footballer born 1897)"}, {"text": "Jonathan Miller (disambiguation)", "dab_title": "John Miller", "title": "Jonathan Miller (disambiguation)"}, {"text": "John Miller (New York politician) (1774\u20131862), U.S. representative from New York", "dab_title": "John Miller", "title": "John Miller (New York politician)"}], "context": "<ul class=\"dab-context\"><li> MG <a href=\"/wiki/John_J._Hennessey\" title=\"John J. Hennessey\">John J. Hennessey</a> May-70 \u2013 February-71\n</li><li> MG <a href=\"/w/index.php?title=Thomas_M._Tarpley&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Thomas M. Tarpley (page does not exist)\">Thomas M. Tarpley</a> February-71 \u2013 April-72\n</li><li> MG <a href=\"/w/index.php?title=John_H._Cushman&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"John H. Cushman (page does not exist)\">John H. Cushman</a> April-72 \u2013 August-73\n</li><li> MG <a href=\"/wiki/Sidney_Bryan_Berry\" title=\"Sidney Bryan Berry\">Sidney Bryan Berry</a> August-73 \u2013 July-74\n</li><li> MG <a href=\"/w/index.php?title=John_W._McEnery&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"John W. McEnery (page does not exist)\">John W. McEnery</a> August-74 \u2013 February-76\n</li><li> MG <a href=\"/wiki/John_A._Wickham,_Jr.\" title=\"John A. Wickham, Jr.\">John A. Wickham, Jr.</a> March-76 \u2013 March-78\n</li><li> MG <a href=\"/w/index.php?title=John_N._Brandenburg&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"John N. Brandenburg (page does not exist)\">John N. Brandenburg</a> March-78 \u2013 June-80\n</li><li> MG <a href=\"/w/index.php?title=Jack_V._Mackmull&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Jack V. Mackmull (page does not exist)\">Jack V. Mackmull</a> June-80 \u2013 August-81\n</li><li> MG <a href=\"/w/index.php?title=Charles_W._Bagnal&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Charles W. Bagnal (page does not exist)\">Charles W. Bagnal</a> August-81 \u2013 August-83\n</li><li> MG James E. Thompson August-83 \u2013 June-85\n</li><li> MG <a href=\"/w/index.php?title=Burton_D._Patrick&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Burton D. Patrick (page does not exist)\">Burton D. Patrick</a> June-85 \u2013 May-87\n</li><li> MG <a href=\"/w/index.php?title=Teddy_G._Allen&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Teddy G. Allen (page does not exist)\">Teddy G. Allen</a> May-87 \u2013 August-89\n</li><li> MG <a href=\"/wiki/J._H._Binford_Peay_III\" title=\"J. H. Binford Peay III\">J. H. Binford Peay III</a> August-89 \u2013 June-91\n</li><li> MG <a href=\"/wiki/John_Miller\" title=\"John Miller\" class=\"dab-link\">John Miller</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=101st_Airborne_Division&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup> June-91 \u2013 July-93\n</li><li> MG <a href=\"/wiki/John_M._Keane\" title=\"John M. Keane\" class=\"mw-redirect\">John M. Keane</a> July-93 \u2013 February-96\n</li><li> MG <a href=\"/wiki/William_F._Kernan\" title=\"William F. Kernan\">William F. \"Buck\" Kernan</a> February-96 \u2013 February-98\n</li><li> MG <a href=\"/wiki/Robert_T._Clark\" title=\"Robert T. Clark\">Robert T. Clark</a> February-98 \u2013 June-00\n</li><li> MG <a href=\"/wiki/Richard_A._Cody\" title=\"Richard A. Cody\">Richard A. Cody</a> June-00 \u2013 July-02\n</li><li> MG <a href=\"/wiki/David_H._Petraeus\" title=\"David H. Petraeus\" class=\"mw-redirect\">David H. Petraeus</a> July-02 \u2013 May-04\n</li><li> MG <a href=\"/wiki/Thomas_R._Turner_II\" title=\"Thomas R. Turner II\">Thomas R. Turner II</a> May-04 \u2013 November-06\n</li><li> MG <a href=\"/wiki/Jeffrey_J._Schloesser\" title=\"Jeffrey J. Schloesser\">Jeffrey J. Schloesser</a> November-06 \u2013 July-09\n</li><li> MG John F. Campbell July-09 \u2013 August 2011\n</li><li> MG James McConville August-2011 \u2013 present\n</li></ul>", "title": "John Miller"}, {"images": [], "page_title": "100 Memories", "options": [{"text": "\"Born to Lose\", a song by Ray Charles", "dab_title": "Born to Lose", "title": "Ray Charles"}, {"text": "\"Born Too Loose\" or \"Born to Lose\", a song by Johnny Thunders and the Heartbreakers from L.A.M.F.", "dab_title": "Born to Lose", "title": "Johnny Thunders and the Heartbreakers"}, {"text": "\"Born to Lose\", a song by Social Distortion from Somewhere Between Heaven and Hell", "dab_title": "Born to Lose", "title": "Social Distortion"}, {"text": "\"Born to Lose\", a song by The Devil Wears Prada", "dab_title": "Born to Lose", "title": "The Devil Wears Prada (band)"}, {"text": "\"Born to Lose\", a song by Ted Daffan", "dab_title": "Born to Lose", "title": "Ted Daffan"}, {"text": "Born to Lose, a song by Brooklyn noise pop duo Sleigh Bells on their 2012 album Reign of Terror (album)", "dab_title": "Born to Lose", "title": "Brooklyn"}, {"text": "\"Born to Lose\", a song by Bouncing Souls", "dab_title": "Born to Lose", "title": "Bouncing Souls"}, {"text": "\"Iron Horse/Born to Lose\", a song by Mot\u00f6rhead from Mot\u00f6rhead", "dab_title": "Born to Lose", "title": "Mot\u00f6rhead"}, {"text": "Born to Lose (Black Label Society song)", "dab_title": "Born to Lose", "title": "Born to Lose (Black Label Society song)"}, {"text": "\"Born to Lose\", a song by Shirley Bassey from Four Decades of Song", "dab_title": "Born to Lose", "title": "Shirley Bassey"}, {"text": "\"Born to Lose\", a song by Dee Dee Ramone", "dab_title": "Born to Lose", "title": "Dee Dee Ramone"}], "context": "<ol class=\"dab-context\"><li> <a href=\"/wiki/Chances_Are_(song)\" title=\"Chances Are (song)\">Chances Are</a>\n</li><li> <a href=\"/wiki/Nevertheless_(I%27m_in_Love_with_You)\" title=\"Nevertheless (I'm in Love with You)\">Nevertheless</a>\n</li><li> <a href=\"/wiki/You_Belong_to_Me_(1952_song)\" title=\"You Belong to Me (1952 song)\">You Belong to Me</a>\n</li><li> <a href=\"/wiki/Mona_Lisa_(Nat_King_Cole_song)\" title=\"Mona Lisa (Nat King Cole song)\">Mona Lisa</a>\n</li><li> <a href=\"/wiki/Hey_Jude\" title=\"Hey Jude\">Hey Jude</a>\n</li><li> <a href=\"/wiki/Song_Sung_Blue\" title=\"Song Sung Blue\">Song Sung Blue</a>\n</li><li> <a href=\"/wiki/Tiny_Bubbles\" title=\"Tiny Bubbles\">Tiny Bubbles</a>\n</li><li> <a href=\"/wiki/Everything_Is_Beautiful\" title=\"Everything Is Beautiful\">Everything Is Beautiful</a>\n</li><li> <a href=\"/wiki/Raindrops_Keep_Fallin%27_on_My_Head\" title=\"Raindrops Keep Fallin' on My Head\">Raindrops Keep Fallin' on My Head</a>\n</li><li> <a href=\"/wiki/Ramblin%27_Rose\" title=\"Ramblin' Rose\">Ramblin' Rose</a>\n</li><li> <a href=\"/wiki/King_of_the_Road_(song)\" title=\"King of the Road (song)\">King of the Road</a>\n</li><li> <a href=\"/wiki/Take_Me_Home,_Country_Roads\" title=\"Take Me Home, Country Roads\">Take Me Home, Country Roads</a>\n</li><li> <a href=\"/wiki/Top_of_the_World_(The_Carpenters_song)\" title=\"Top of the World (The Carpenters song)\">Top of the World</a>\n</li><li> <a href=\"/wiki/I%27m_Henry_VIII,_I_Am\" title=\"I'm Henry VIII, I Am\" class=\"mw-redirect\">I'm Henry VIII, I Am</a>\n</li><li> <a href=\"/wiki/Let_Me_Be_There\" title=\"Let Me Be There\">Let Me Be There</a>\n</li><li> <a href=\"/wiki/Breaking_Up_Is_Hard_to_Do_(song)\" title=\"Breaking Up Is Hard to Do (song)\" class=\"mw-redirect\">Breaking Up Is Hard to Do</a>\n</li><li> <a href=\"/wiki/Yesterday_(song)\" title=\"Yesterday (song)\">Yesterday</a>\n</li><li> <a href=\"/wiki/Since_I_Fell_for_You\" title=\"Since I Fell for You\">Since I Fell for You</a>\n</li><li> <a href=\"/wiki/Born_to_Lose\" title=\"Born to Lose\" class=\"dab-link\">Born to Lose</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=100_Memories&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup></li><li> <a href=\"/wiki/How_Can_You_Mend_a_Broken_Heart\" title=\"How Can You Mend a Broken Heart\">How Can You Mend a Broken Heart</a>\n</li><li> <a href=\"/wiki/Too_Young\" title=\"Too Young\">Too Young</a>\n</li><li> <a href=\"/wiki/Unchained_Melody\" title=\"Unchained Melody\">Unchained Melody</a>\n</li><li> <a href=\"/wiki/Cry\" title=\"Cry\" class=\"mw-redirect\">Cry</a>\n</li><li> <a href=\"/wiki/Can%27t_Help_Falling_in_Love\" title=\"Can't Help Falling in Love\">Can't Help Falling in Love</a>\n</li></ol>", "title": "Born to Lose"}, {"images": ["//upload.wikimedia.org/wikipedia/commons/thumb/d/df/Sri_Lankan_Parliamentary_Election_2000.png/220px-Sri_Lankan_Parliamentary_Election_2000.png"], "page_title": "11th Sri Lankan Parliament", "options": [{"text": "Abdolmajid Pirzadeh Jahromi (1954\u20131976), Iranian political activist", "dab_title": "Abdul Majid", "title": "Abdolmajid Pirzadeh Jahromi"}, {"text": "Abdul Majid Khan (Pakistani diplomat)", "dab_title": "Abdul Majid", "title": "Abdul Majid Khan (Pakistani diplomat)"}, {"text": "Abdul Majid Giaka (born 1960), Libyan double-agent for the CIA", "dab_title": "Abdul Majid", "title": "Abdul Majid Giaka"}, {"text": "Abdulmajidia, genus of Malayan plants", "dab_title": "Abdul Majid", "title": "Abdulmajidia"}, {"text": "Abdul Majid Kubar (born 1909), Libyan politician", "dab_title": "Abdul Majid", "title": "Abdul Majid Kubar"}, {"text": "Abdul-Majid al-Khoei (1962\u20132003), Iraqi Twelver cleric", "dab_title": "Abdul Majid", "title": "Abdul-Majid al-Khoei"}, {"text": "Abdul Majid (physicist), Pakistani astrophysicist", "dab_title": "Abdul Majid", "title": "Abdul Majid (physicist)"}, {"text": "Abdul Majeed Khwaja (1885\u20131962), Indian lawyer, educationist, social reformer and freedom fighter", "dab_title": "Abdul Majid", "title": "Abdul Majeed Khwaja"}, {"text": "Abd el-Majid Hidr, original name of Amos Yarkoni (1920\u20131991), Israeli Arab soldier", "dab_title": "Abdul Majid", "title": "Amos Yarkoni"}, {"text": "Abdelmajid Dahoumane (born 1967), Algerian alleged terrorist", "dab_title": "Abdul Majid", "title": "Abdelmajid Dahoumane"}, {"text": "'Abd al-Majid Nimer Zaghmout (died 2000), Palestinian imprisoned in Syria", "dab_title": "Abdul Majid", "title": "'Abd al-Majid Nimer Zaghmout"}, {"text": "Saddam Hussein Abd al-Majid al-Tikriti (1937\u20132006), President of Iraq", "dab_title": "Abdul Majid", "title": "Saddam Hussein"}, {"text": "Abdel Sattar Sabry Abdelmajid Mahmoud, or just Abdel Sattar Sabry (born 1974), Egyptian footballer", "dab_title": "Abdul Majid", "title": "Abdel Sattar Sabry"}, {"text": "Iman Mohamed Abdulmajid, or Iman (model), (born 1955), Somali-American model, actress and entrepreneur", "dab_title": "Abdul Majid", "title": "Iman (model)"}, {"text": "Ali Hassan Abd al-Majid al-Tikriti, or just Ali Hassan al-Majid (1941\u20132010), Iraqi politician", "dab_title": "Abdul Majid", "title": "Ali Hassan al-Majid"}, {"text": "Fahd Umr Abd Al Majid Al Sharif (born 1976), Saudi held in Guantanamo", "dab_title": "Abdul Majid", "title": "Fahd Umr Abd Al Majid Al Sharif"}, {"text": "Abdul Majeed bin Abdul Aziz (ca. 1943\u20132007), Saudi prince", "dab_title": "Abdul Majid", "title": "Abdul Majeed bin Abdul Aziz"}, {"text": "Ch Abdul Majid, Pakistani Kashmiri politician", "dab_title": "Abdul Majid", "title": "Ch Abdul Majid"}, {"text": "Abdelmajid Oulmers (born 1978), Moroccan footballer", "dab_title": "Abdul Majid", "title": "Abdelmajid Oulmers"}, {"text": "Abdul Majid Muhammed (born 1978), Iranian held in Guantanamo", "dab_title": "Abdul Majid", "title": "Abdul Majid Muhammed"}, {"text": "^ Salahuddin Ahmed (1999). A Dictionary of Muslim Names. London: Hurst & Company.", "dab_title": "Abdul Majid", "title": null}, {"text": "Abdelmajid Eddine (born 1979), Moroccan footballer", "dab_title": "Abdul Majid", "title": "Abdelmajid Eddine"}, {"text": "Abdelmajid Benjelloun (historian) (born 1944), Moroccan author, historian and poet", "dab_title": "Abdul Majid", "title": "Abdelmajid Benjelloun (historian)"}, {"text": "Abdul Majid Rouzi, Afghan soldier", "dab_title": "Abdul Majid", "title": "Abdul Majid Rouzi"}, {"text": "Tun Habib Abdul Majid (1637\u20131697), Bendahara of the Johor Sultanate", "dab_title": "Abdul Majid", "title": "Tun Habib Abdul Majid"}, {"text": "Abdelmajid Bourebbou (born 1951), Algerian footballer", "dab_title": "Abdul Majid", "title": "Abdelmajid Bourebbou"}, {"text": "Abd\u00fclmecid I (1823\u20131861), Sultan of the Ottoman Empire", "dab_title": "Abdul Majid", "title": "Abd\u00fclmecid I"}, {"text": "Abdelmajid Dolmy (born 1953), Moroccan footballer", "dab_title": "Abdul Majid", "title": "Abdelmajid Dolmy"}, {"text": "The March for Sultan Abdul-Mejid, Ottoman anthem", "dab_title": "Abdul Majid", "title": "The March for Sultan Abdul-Mejid"}, {"text": "Abdulmajid (music), instrumental piece written and performed by David Bowie and Brian Eno", "dab_title": "Abdul Majid", "title": "Abdulmajid (music)"}, {"text": "Abd\u00fclmecid II (1868\u20131944), Head of the Ottoman Imperial House", "dab_title": "Abdul Majid", "title": "Abd\u00fclmecid II"}, {"text": "Abdul Majid Khan (born 1953), Afghan held in Bagram", "dab_title": "Abdul Majid", "title": "Abdul Majid Khan"}, {"text": "Abdulmajid Dostiev, Tajik diplomat", "dab_title": "Abdul Majid", "title": "Abdulmajid Dostiev"}, {"text": "Abdelmajid Saleh, Lebanese politician", "dab_title": "Abdul Majid", "title": "Abdelmajid Saleh"}, {"text": "Qazi Abdul Majeed Abid, Pakistani politician", "dab_title": "Abdul Majid", "title": "Qazi Abdul Majeed Abid"}, {"text": "M. N. Abdul Majeed (born 1957), Sri Lankan politician", "dab_title": "Abdul Majid", "title": "M. N. Abdul Majeed"}, {"text": "Chaudhry Abdul Majeed (died 2006), Pakistani nuclear physicist", "dab_title": "Abdul Majid", "title": "Chaudhry Abdul Majeed"}, {"text": "Abdul Madzhid (Dagestan rebel) (died 2008), leader in the Second Chechen War", "dab_title": "Abdul Majid", "title": "Abdul Madzhid (Dagestan rebel)"}, {"text": "Abdel Meguid Amir (born 1961), Egyptian basketball player", "dab_title": "Abdul Majid", "title": "Abdel Meguid Amir"}, {"text": "Abdelmajid Benjelloun (1919\u20131981), Moroccan novelist, journalist and ambassador", "dab_title": "Abdul Majid", "title": "Abdelmajid Benjelloun"}, {"text": "Abdelmajid Bouyboud (born 1966), Moroccan footballer", "dab_title": "Abdul Majid", "title": "Abdelmajid Bouyboud"}, {"text": "Abdul Majeed al-Zindani (born 1942), Yemeni academic and politician", "dab_title": "Abdul Majid", "title": "Abdul Majeed al-Zindani"}, {"text": "Ahmed Asmat Abdel-Meguid (born 1923), Egyptian diplomat", "dab_title": "Abdul Majid", "title": "Ahmed Asmat Abdel-Meguid"}, {"text": "Tunku Abdul Majid (born 1970), Tunku Bendahara of Johor", "dab_title": "Abdul Majid", "title": "Tunku Abdul Majid"}, {"text": "Abdelmajid Chetali (born 1939), Tunisian footballer", "dab_title": "Abdul Majid", "title": "Abdelmajid Chetali"}, {"text": "Radhi Ben Abdelmajid Ja\u00efdi, or just Radhi Ja\u00efdi (born 1975), Tunisian footballer", "dab_title": "Abdul Majid", "title": "Radhi Ja\u00efdi"}, {"text": "Abdul Majid Samim, Afghan politician", "dab_title": "Abdul Majid", "title": "Abdul Majid Samim"}, {"text": "Abdul Majeed (cricketer), Pakistani cricketer", "dab_title": "Abdul Majid", "title": "Abdul Majeed (cricketer)"}, {"text": "Abdul Majid Zabuli (1896\u20131998), Afghan banker", "dab_title": "Abdul Majid", "title": "Abdul Majid Zabuli"}, {"text": "Hussein 'Abd al-Majid (disappeared 1936), Iraqi, Saddam Hussein's father", "dab_title": "Abdul Majid", "title": "Hussein 'Abd al-Majid"}, {"text": "Abdol Majid Mirza (1845\u20131927), Qajar prince and Prime Minister of Iran", "dab_title": "Abdul Majid", "title": "Abdol Majid Mirza"}, {"text": "Khalid \u2018Abd al-Majid, Palestinian politician", "dab_title": "Abdul Majid", "title": "Khalid \u2018Abd al-Majid"}, {"text": "Abdul Majid Mahmoud (born 1979), Pakistani held in Guantanamo", "dab_title": "Abdul Majid", "title": "Abdul Majid Mahmoud"}, {"text": "Adhyapak Abdul Majid College, school in Bangladesh", "dab_title": "Abdul Majid", "title": "Adhyapak Abdul Majid College"}, {"text": "Sheikh Humam Baqir Abdul Majeed Hamoudi, or just Humam Hamoudi, Iraqi politician", "dab_title": "Abdul Majid", "title": "Humam Hamoudi"}, {"text": "Abdelmadjid Tahraoui (born 1981), Algerian footballer", "dab_title": "Abdul Majid", "title": "Abdelmadjid Tahraoui"}, {"text": "Bassam Abdel Majeed (born 1950), Syrian politician", "dab_title": "Abdul Majid", "title": "Bassam Abdel Majeed"}, {"text": "Abdul Majid Daryabadi (1892\u20131977), Indian Muslim writer and exegete of the Qur'an", "dab_title": "Abdul Majid", "title": "Abdul Majid Daryabadi"}, {"text": "S. M. Abdul Majid, Indian politician", "dab_title": "Abdul Majid", "title": "S. M. Abdul Majid"}, {"text": "Abdul Majid al-Qa\u2032ud (born 1943), Libyan politician", "dab_title": "Abdul Majid", "title": "Abdul Majid al-Qa\u2032ud"}, {"text": "Munshi Abdul Majid (born 1952), Afghan politician", "dab_title": "Abdul Majid", "title": "Munshi Abdul Majid"}, {"text": "^ S. A. Rahman (2001). A Dictionary of Muslim Names. New Delhi: Goodword Books.", "dab_title": "Abdul Majid", "title": null}, {"text": "Abdul Majid Hassan (ca. 1380-1408), Sultan of Brunei", "dab_title": "Abdul Majid", "title": "Abdul Majid Hassan"}, {"text": "Abdelmadjid Mada (born 1953), Algerian runner", "dab_title": "Abdul Majid", "title": "Abdelmadjid Mada"}, {"text": "Adel Mohammed Abdel Magid Abdel Bari, known as Adel Abdel Bari, Egyptian alleged terrorist", "dab_title": "Abdul Majid", "title": "Adel Abdel Bari"}, {"text": "Abdul Majeed Didi (1873\u20131952), Sultan of the Maldives", "dab_title": "Abdul Majid", "title": "Abdul Majeed Didi"}], "context": "<table class=\"dab-context wikitable sortable\" border=\"1\" style=\"text-align:center;\"><tr style=\"height: 70px;\"><th valign=\"bottom\" width=\"200\">Name<br></th>\n<th valign=\"bottom\" width=\"20\"><small><a href=\"/wiki/Electoral_districts_in_Sri_Lanka\" title=\"Electoral districts in Sri Lanka\">Electoral<br>District</a></small><br></th>\n<th valign=\"bottom\" width=\"50\"><small>Preference<br>Votes</small><br></th>\n<th valign=\"bottom\" width=\"125\">Member<br>From<br></th>\n<th valign=\"bottom\" width=\"125\">Member<br>To<br></th>\n<th valign=\"bottom\" width=\"60\"><small>Elected<br>Party</small><br></th>\n<th valign=\"bottom\" width=\"40\"><small>Elected<br>Alliance</small><br></th>\n<th valign=\"bottom\" width=\"60\"><small>Final<br>Party</small><br></th>\n<th valign=\"bottom\" width=\"40\"><small>Final<br>Alliance</small><br></th>\n<th valign=\"bottom\" width=\"390\">Notes<br></th></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Piyadasa_Abeynayake&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Piyadasa Abeynayake (page does not exist)\">Abeynayake, Piyadasa</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">41,365</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=P._D._Abeyratne&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"P. D. Abeyratne (page does not exist)\">Abeyratne, P. D.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">47,271</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Lakshman_Yapa_Abeywardena\" title=\"Lakshman Yapa Abeywardena\">Abeywardena, Lakshman Yapa</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">81,053</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mahinda_Yapa_Abeywardena\" title=\"Mahinda Yapa Abeywardena\">Abeywardena, Mahinda Yapa</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">70,091</td>\n<td>18 October 2000</td>\n<td>14 November 2000</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Resigned to become <a href=\"/wiki/Chief_Minister_of_Sri_Lanka\" title=\"Chief Minister of Sri Lanka\">Chief Minister</a> of the <a href=\"/wiki/Southern_Province,_Sri_Lanka\" title=\"Southern Province, Sri Lanka\">Southern Province</a>.\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Vajira_Abeywardena\" title=\"Vajira Abeywardena\">Abeywardena, Vajira</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">104,483</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Selvam_Adaikalanathan\" title=\"Selvam Adaikalanathan\">Adaikalanathan, Selvam</a></td>\n<td align=\"left\"><a href=\"/wiki/Vanni_Electoral_District\" title=\"Vanni Electoral District\">VAN</a></td>\n<td align=\"right\">15,490</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Tamil_Eelam_Liberation_Organization\" title=\"Tamil Eelam Liberation Organization\"><span style=\"color:white;\">TELO</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Tamil_Eelam_Liberation_Organization\" title=\"Tamil Eelam Liberation Organization\"><span style=\"color:white;\">TELO</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Dullas_Alahapperuma\" title=\"Dullas Alahapperuma\">Alahapperuma, Dullas</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">48,721</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Samurdhi, Rural Development, Parliamentary Affairs &amp; Up-country Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mahindananda_Aluthgamage\" title=\"Mahindananda Aluthgamage\">Aluthgamage, Mahindananda</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">71,653</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Alick_Aluvihare&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Alick Aluvihare (page does not exist)\">Aluvihare, Alick</a></td>\n<td align=\"left\"><a href=\"/wiki/Matale_Electoral_District\" title=\"Matale Electoral District\">MTL</a></td>\n<td align=\"right\">60,419</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ranjith_Aluvihare\" title=\"Ranjith Aluvihare\">Aluvihare, Ranjith</a></td>\n<td align=\"left\"><a href=\"/wiki/Matale_Electoral_District\" title=\"Matale Electoral District\">MTL</a></td>\n<td align=\"right\">62,911</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/John_Amaratunga\" title=\"John Amaratunga\">Amaratunga, John</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">67,104</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Sarath_Amunugama_(politician)\" title=\"Sarath Amunugama (politician)\">Amunugama, Sarath</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">67,731</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Irrigation &amp; Water Resources Management (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Veerasingham_Anandasangaree\" title=\"Veerasingham Anandasangaree\" class=\"mw-redirect\">Anandasangaree, Veerasingham</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">12,888</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Siri_Andrahannadi&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Siri Andrahannadi (page does not exist)\">Andrahannadi, Siri</a></td>\n<td align=\"left\"><a href=\"/wiki/Hambantota_Electoral_District\" title=\"Hambantota Electoral District\">HAM</a></td>\n<td align=\"right\">39,674</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ferial_Ismail_Ashraff\" title=\"Ferial Ismail Ashraff\" class=\"mw-redirect\">Ashraff, Ferial</a></td>\n<td align=\"left\"><a href=\"/wiki/Ampara_Electoral_District\" title=\"Ampara Electoral District\">AMP</a></td>\n<td align=\"right\">83,353</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/A._L._M._Athaullah\" title=\"A. L. M. Athaullah\">Athaullah. A. L. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/Ampara_Electoral_District\" title=\"Ampara Electoral District\">AMP</a></td>\n<td align=\"right\">75,647</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Gamini_Athukorala&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Gamini Athukorala (page does not exist)\">Athukorala, Gamini</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">109,102</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Tissa_Attanayake\" title=\"Tissa Attanayake\">Attanayake, Tissa</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">73,111</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/A._H._M._Azwer\" title=\"A. H. M. Azwer\">Azwer, A. H. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Nihal_Bakmeewewa&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Nihal Bakmeewewa (page does not exist)\">Bakmeewewa, Nihal</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Arachchilage_Jagath_Balasooriya&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Arachchilage Jagath Balasooriya (page does not exist)\">Balasooriya, Arachchilage Jagath</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">45,862</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Urban Development, Construction &amp; Public Utilities (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Gopallawa_Moithra_Kuda_Banda&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Gopallawa Moithra Kuda Banda (page does not exist)\">Banda, Gopallawa Moithra Kuda</a></td>\n<td align=\"left\"><a href=\"/wiki/Matale_Electoral_District\" title=\"Matale Electoral District\">MTL</a></td>\n<td align=\"right\">40,397</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Palitha_Range_Bandara\" title=\"Palitha Range Bandara\">Bandara, Palitha Range</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">40,296</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/R._M._Ranjith_Madduma_Bandara\" title=\"R. M. Ranjith Madduma Bandara\">Bandara, R. M. Ranjith Madduma</a></td>\n<td align=\"left\"><a href=\"/wiki/Monaragala_Electoral_District\" title=\"Monaragala Electoral District\">MON</a></td>\n<td align=\"right\">31,269</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Rathnayake_Mudiyanselage_Rathna_Nimal_Bandara&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Rathnayake Mudiyanselage Rathna Nimal Bandara (page does not exist)\">Bandara, R. M. R. N.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">49,962</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=S._A._R._Madduma_Bandara&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"S. A. R. Madduma Bandara (page does not exist)\">Bandara, S. A. R. Madduma</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">47,152</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Anura_Bandaranaike\" title=\"Anura Bandaranaike\">Bandaranaike, Anura</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">99,536</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\"><a href=\"/wiki/Speaker_of_the_Parliament_of_Sri_Lanka\" title=\"Speaker of the Parliament of Sri Lanka\">Speaker</a> (00-01).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Pandu_Bandaranaike\" title=\"Pandu Bandaranaike\">Bandaranaike, Pandu</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">92,182</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Forestry &amp; Environment (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Rohitha_Bogollagama\" title=\"Rohitha Bogollagama\">Bogollagama, Rohitha</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">52,095</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/A._R._M._Abdul_Cader\" title=\"A. R. M. Abdul Cader\">Cader, A. R. M. Abdul</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">58,375</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Mohideen_Abdul_Cader&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Mohideen Abdul Cader (page does not exist)\">Cader, Mohideen Abdul</a></td>\n<td align=\"left\"><a href=\"/wiki/Batticaloa_Electoral_District\" title=\"Batticaloa Electoral District\">BAT</a></td>\n<td align=\"right\">22,975</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Muslim_National_Unity_Alliance\" title=\"Muslim National Unity Alliance\"><span style=\"color:black;\">NUA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td align=\"left\"><small>Deputy Minister of Fisheries &amp; Aquatic Resources Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ahangama_Polwaththe_Galappaththige_Chandradasa&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ahangama Polwaththe Galappaththige Chandradasa (page does not exist)\">Chandradasa, A. P. G.</a></td>\n<td align=\"left\"><a href=\"/wiki/Ampara_Electoral_District\" title=\"Ampara Electoral District\">AMP</a></td>\n<td align=\"right\">41,420</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Periyasamy_Chandrasekaran\" title=\"Periyasamy Chandrasekaran\">Chandrasekaran, Periyasamy</a></td>\n<td align=\"left\"><a href=\"/wiki/Nuwara_Eliya_Electoral_District\" title=\"Nuwara Eliya Electoral District\">NUW</a></td>\n<td align=\"right\">54,681</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Up-Country_People%27s_Front\" title=\"Up-Country People's Front\"><span style=\"color:white;\">UCPF</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Up-Country_People%27s_Front\" title=\"Up-Country People's Front\"><span style=\"color:white;\">UCPF</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Somaweera_Chandrasiri&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Somaweera Chandrasiri (page does not exist)\">Chandrasiri, Somaweera</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Mahajana_Eksath_Peramuna\" title=\"Mahajana Eksath Peramuna\"><span style=\"color:white;\">MEP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Mahajana_Eksath_Peramuna\" title=\"Mahajana Eksath Peramuna\"><span style=\"color:white;\">MEP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/K._N._Choksy\" title=\"K. N. Choksy\">Choksy, K. N.</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Raja_Collure&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Raja Collure (page does not exist)\">Collure, Raja</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Communist_Party_of_Sri_Lanka\" title=\"Communist Party of Sri Lanka\"><span style=\"color:white;\">CPSL</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Communist_Party_of_Sri_Lanka\" title=\"Communist Party of Sri Lanka\"><span style=\"color:white;\">CPSL</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Reginold_Cooray&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Reginold Cooray (page does not exist)\">Cooray, Reginold</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">67,945</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Ethnic Affairs &amp; National Integration (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/D._M._Dassanayake\" title=\"D. M. Dassanayake\">Dassanayake, D. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">45,700</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Agriculture (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Basheer_Segu_Dawood\" title=\"Basheer Segu Dawood\">Dawood, Basheer Segu</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Muslim_National_Unity_Alliance\" title=\"Muslim National Unity Alliance\"><span style=\"color:black;\">NUA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/P._Dayaratna\" title=\"P. Dayaratna\">Dayaratna, Petikirige</a></td>\n<td align=\"left\"><a href=\"/wiki/Ampara_Electoral_District\" title=\"Ampara Electoral District\">AMP</a></td>\n<td align=\"right\">47,421</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Tudor_Dayaratne&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Tudor Dayaratne (page does not exist)\">Dayaratne, Tudor</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">63,363</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Education (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ronnie_de_Mel\" title=\"Ronnie de Mel\">de Mel, Ronnie</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Ports Development &amp; Development of the South (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Sirinal_de_Mel&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Sirinal de Mel (page does not exist)\">de Mel, Sirinal</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Nimal_Siripala_de_Silva\" title=\"Nimal Siripala de Silva\">de Silva, Nimal Siripala</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">98,917</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Posts &amp; Telecommunications (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Douglas_Devananda\" title=\"Douglas Devananda\">Devananda, Douglas</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">7,658</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Rehabilitation &amp; Reconstruction of the North (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/P._P._Devaraj\" title=\"P. P. Devaraj\">Devaraj, P. P.</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Duminda_Dissanayake\" title=\"Duminda Dissanayake\">Dissanayake, Duminda</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">83,949</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Lalith_Dissanayake\" title=\"Lalith Dissanayake\">Dissanayake, Lalith</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">40,624</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Chairman of Committees (00-01).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Navin_Dissanayake\" title=\"Navin Dissanayake\">Dissanayake, Navin</a></td>\n<td align=\"left\"><a href=\"/wiki/Nuwara_Eliya_Electoral_District\" title=\"Nuwara Eliya Electoral District\">NUW</a></td>\n<td align=\"right\">55,587</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Punchi_Banda_Dissanayake&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Punchi Banda Dissanayake (page does not exist)\">Dissanayake, Punchi Banda</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">33,738</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/S._B._Dissanayake\" title=\"S. B. Dissanayake\">Dissanayake, S. B.</a></td>\n<td align=\"left\"><a href=\"/wiki/Nuwara_Eliya_Electoral_District\" title=\"Nuwara Eliya Electoral District\">NUW</a></td>\n<td align=\"right\">78,903</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\"><small>Minister of Samurdhi, Rural Development &amp; Parliamentary Affairs (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Salinda_Dissanayake\" title=\"Salinda Dissanayake\">Dissanayake, Salinda</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">52,727</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small><a href=\"/wiki/Ministry_of_Land_and_Land_Development_(Sri_Lanka)\" title=\"Ministry of Land and Land Development (Sri Lanka)\">Minister of Land Development &amp; Minor Export Agricultural Crops</a> (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Amarasiri_Dodangoda\" title=\"Amarasiri Dodangoda\">Dodangoda, Amarasiri</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">89,149</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Vocational Training (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Anthony_Sarathchandra_Peramunagamage_Don&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Anthony Sarathchandra Peramunagamage Don (page does not exist)\">Don, A. S. P.</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">52,416</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Nandimithra_Ekanayake\" title=\"Nandimithra Ekanayake\">Ekanayake, Nandimithra</a></td>\n<td align=\"left\"><a href=\"/wiki/Matale_Electoral_District\" title=\"Matale Electoral District\">MTL</a></td>\n<td align=\"right\">39,585</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\">Minister of Provincial Councils &amp; Local Government (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/T._B._Ekanayake\" title=\"T. B. Ekanayake\">Ekanayake, T. B.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td> </td>\n<td>9 November 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Replaces <a href=\"/wiki/S._B._Nawinne\" title=\"S. B. Nawinne\">S. B. Nawinne</a>. Deputy Minister of Cultural Affairs (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/W._B._Ekanayake\" title=\"W. B. Ekanayake\">Ekanayake, W. B.</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">41,461</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Elabadage_Nimal_Upatissa_Fernando&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Elabadage Nimal Upatissa Fernando (page does not exist)\">Fernando, E. N. U.</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">5,717</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Evone_Sriyani_Fernando&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Evone Sriyani Fernando (page does not exist)\">Fernando, Evone Sriyani</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">28,636</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Johnston_Fernando\" title=\"Johnston Fernando\">Fernando, Johnston</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">94,385</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Milroy_Fernando\" title=\"Milroy Fernando\">Fernando, Milroy</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">39,943</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Minister of Social Services &amp; Fishing Community Housing Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Tyronne_Fernando\" title=\"Tyronne Fernando\">Fernando, Tyronne</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">41,439</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Jeyaraj_Fernandopulle\" title=\"Jeyaraj Fernandopulle\">Fernandopulle, Jeyaraj</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">138,859</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Civil Aviation &amp; Airports Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/A._H._M._Fowzie\" title=\"A. H. M. Fowzie\">Fowzie, A. H. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">100,200</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Highways (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Chandrasiri_Gajadeera\" title=\"Chandrasiri Gajadeera\">Gajadeera, Chandrasiri</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">43,913</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Vocational Training (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Nihal_Galappaththi\" title=\"Nihal Galappaththi\">Galappaththi, Nihal</a></td>\n<td align=\"left\"><a href=\"/wiki/Hambantota_Electoral_District\" title=\"Hambantota Electoral District\">HAM</a></td>\n<td align=\"right\">4,654</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Piyasena_Gamage\" title=\"Piyasena Gamage\">Gamage, Piyasena</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">62,830</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Constitutional Affairs &amp; Industrial Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Somasuntharam_Ganeshamoorthy&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Somasuntharam Ganeshamoorthy (page does not exist)\">Ganeshamoorthy, Somasuntharam</a></td>\n<td align=\"left\"><a href=\"/wiki/Batticaloa_Electoral_District\" title=\"Batticaloa Electoral District\">BAT</a></td>\n<td align=\"right\">9,132</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Ethnic Affairs &amp; National Integration (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=M._C._Gopallawa&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"M. C. Gopallawa (page does not exist)\">Gopallawa, M. C.</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Cultural Affairs (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Markandu_Gunasegaram&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Markandu Gunasegaram (page does not exist)\">Gunasegaram, Markandu</a></td>\n<td align=\"left\"><a href=\"/wiki/Ampara_Electoral_District\" title=\"Ampara Electoral District\">AMP</a></td>\n<td align=\"right\">12,799</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td>IND</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Earl_Gunasekara\" title=\"Earl Gunasekara\">Gunasekara, Earl</a></td>\n<td align=\"left\"><a href=\"/wiki/Polonnaruwa_Electoral_District\" title=\"Polonnaruwa Electoral District\">POL</a></td>\n<td align=\"right\">56,213</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Edward_Gunaserkara\" title=\"Edward Gunaserkara\" class=\"mw-redirect\">Gunaserkara, Edward</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">65,157</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Nandana_Gunathilake\" title=\"Nandana Gunathilake\">Gunathilake, Nandana</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">5,628</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Bandula_Gunawardena\" title=\"Bandula Gunawardena\" class=\"mw-redirect\">Gunawardena, Bandula</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">70,537</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Mahajana_Eksath_Peramuna\" title=\"Mahajana Eksath Peramuna\"><span style=\"color:white;\">MEP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Dinesh_Gunawardena\" title=\"Dinesh Gunawardena\">Gunawardena, Dinesh</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">114,795</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Mahajana_Eksath_Peramuna\" title=\"Mahajana Eksath Peramuna\"><span style=\"color:white;\">MEP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Mahajana_Eksath_Peramuna\" title=\"Mahajana Eksath Peramuna\"><span style=\"color:white;\">MEP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ganegama_Liyanage_Sarath_Gunawardena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ganegama Liyanage Sarath Gunawardena (page does not exist)\">Gunawardena, G. L. S.</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">46,656</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Indika_Gunawardena\" title=\"Indika Gunawardena\">Gunawardena, Indika</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">70,341</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Minister of Higher Education &amp; Information Technology Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Leslie_Gunawardena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Leslie Gunawardena (page does not exist)\">Gunawardena, Leslie</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Lanka_Sama_Samaja_Party\" title=\"Lanka Sama Samaja Party\"><span style=\"color:white;\">LSSP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Lanka_Sama_Samaja_Party\" title=\"Lanka Sama Samaja Party\"><span style=\"color:white;\">LSSP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><a href=\"/wiki/Ministry_of_Science_and_Technology_(Sri_Lanka)\" title=\"Ministry of Science and Technology (Sri Lanka)\">Minister of Science &amp; Technology</a> (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=M._K._A._S._Gunawardena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"M. K. A. S. Gunawardena (page does not exist)\">Gunawardena, M. K. A. S.</a></td>\n<td align=\"left\"><a href=\"/wiki/Trincomalee_Electoral_District\" title=\"Trincomalee Electoral District\">TRI</a></td>\n<td align=\"right\">15,392</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Sarana_Gunawardena\" title=\"Sarana Gunawardena\">Gunawardena, Sarana</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">59,777</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Rauff_Hakeem\" title=\"Rauff Hakeem\">Hakeem, Rauff</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">28,033</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Muslim_National_Unity_Alliance\" title=\"Muslim National Unity Alliance\"><span style=\"color:black;\">NUA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td align=\"left\"><small>Minister of Internal &amp; International Trade Commerce, Muslim Religious Affairs &amp; Shipping Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/M._H._A._Haleem\" title=\"M. H. A. Haleem\">Haleem, M. H. A.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">45,177</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Mohamed_Haneefa&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Mohamed Haneefa (page does not exist)\">Haneefa, Mohamed</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/P._Harrison\" title=\"P. Harrison\">Harrison, Palisge</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">45,834</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Udagama_Liyanage_Heenmahaththaya&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Udagama Liyanage Heenmahaththaya (page does not exist)\">Heenmahaththaya, U. L.</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">39,285</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Estate Infrastructure &amp; Livestock Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Herath_Mudiyanselage_Nandasena_Herath&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Herath Mudiyanselage Nandasena Herath (page does not exist)\">Herath, H. M. N.</a></td>\n<td align=\"left\"><a href=\"/wiki/Polonnaruwa_Electoral_District\" title=\"Polonnaruwa Electoral District\">POL</a></td>\n<td align=\"right\">22,872</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Food &amp; Marketing Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Jayarathna_Herath\" title=\"Jayarathna Herath\">Herath, Jayarathna</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">61,853</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Kirinde_Mudiyanselage_Nimal_Herath&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Kirinde Mudiyanselage Nimal Herath (page does not exist)\">Herath, K. M. N.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">3,407</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Maheepala_Herath&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Maheepala Herath (page does not exist)\">Herath, Maheepala</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">61,625</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Rural Industrial Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Vijitha_Herath\" title=\"Vijitha Herath\">Herath, Vijitha</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">8,823</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/D._M._Jayaratne\" title=\"D. M. Jayaratne\">Jayaratne, D. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">85,711</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Agriculture (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Piyankara_Jayaratne\" title=\"Piyankara Jayaratne\">Jayaratne, Piyankara</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">32,741</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Youth Affairs (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Sumedha_G._Jayasena\" title=\"Sumedha G. Jayasena\">Jayasena, Sumedha</a></td>\n<td align=\"left\"><a href=\"/wiki/Monaragala_Electoral_District\" title=\"Monaragala Electoral District\">MON</a></td>\n<td align=\"right\">33,946</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Women's Affairs (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Chandrani_Bandara_Jayasinghe\" title=\"Chandrani Bandara Jayasinghe\">Jayasinghe, Chandrani Bandara</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">41,874</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Karu_Jayasuriya\" title=\"Karu Jayasuriya\">Jayasuriya, Karu</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">237,387</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Jayalath_Jayawardena\" title=\"Jayalath Jayawardena\">Jayawardena, Jayalath</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">82,730</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Lucky_Jayawardena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Lucky Jayawardena (page does not exist)\">Jayawardena, Lucky</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">42,085</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Shanmugam_Krishnan_Jegatheeswaran&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Shanmugam Krishnan Jegatheeswaran (page does not exist)\">Jegatheeswaran, S. K.</a></td>\n<td align=\"left\"><a href=\"/wiki/Nuwara_Eliya_Electoral_District\" title=\"Nuwara Eliya Electoral District\">NUW</a></td>\n<td align=\"right\">50,735</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Lakshman_Kadirgamar\" title=\"Lakshman Kadirgamar\">Kadirgamar, Lakshman</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><a href=\"/wiki/Minister_of_Foreign_Affairs_(Sri_Lanka)\" title=\"Minister of Foreign Affairs (Sri Lanka)\">Minister of Foreign Affairs</a> (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=K._Kanakaraj&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"K. Kanakaraj (page does not exist)\">Kanakaraj, K.</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Tissa_Karalliyadde\" title=\"Tissa Karalliyadde\">Karalliyadde, Tissa</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">48,360</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Indigenous Medicine (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ravi_Karunanayake\" title=\"Ravi Karunanayake\">Karunanayake, Ravi</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">145,593</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Gayantha_Karunathilaka\" title=\"Gayantha Karunathilaka\">Karunathilaka, Gayantha</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">60,728</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Chandana_Kathriarachchi&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Chandana Kathriarachchi (page does not exist)\">Kathriarachchi, Chandana</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">61,301</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Urban Development, Construction &amp; Public Utilities (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Jayantha_Katugoda&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Jayantha Katugoda (page does not exist)\">Katugoda, Jayantha</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">39,242</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=W_.K_.M._Sarath_Keerthirathna&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"W .K .M. Sarath Keerthirathna (page does not exist)\">Keerthirathna, Sarath</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">77,427</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Agriculture (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Lakshman_Kiriella\" title=\"Lakshman Kiriella\">Kiriella, Lakshman</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">57,424</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\">Minister of Tourism &amp; Sports (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Jinadasa_Kitulagoda\" title=\"Jinadasa Kitulagoda\">Kitulagoda, Jinadasa</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">4,012</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Karunasena_Kodituwakku\" title=\"Karunasena Kodituwakku\">Kodituwakku, Karunasena</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">60,318</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Irasa_Kuganeswaran&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Irasa Kuganeswaran (page does not exist)\">Kuganeswaran, Irasa</a></td>\n<td align=\"left\"><a href=\"/wiki/Vanni_Electoral_District\" title=\"Vanni Electoral District\">VAN</a></td>\n<td align=\"right\">6,739</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Tamil_Eelam_Liberation_Organization\" title=\"Tamil Eelam Liberation Organization\"><span style=\"color:white;\">TELO</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Tamil_Eelam_Liberation_Organization\" title=\"Tamil Eelam Liberation Organization\"><span style=\"color:white;\">TELO</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Karthigesu_Velummylum_Kugendran&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Karthigesu Velummylum Kugendran (page does not exist)\">Kugendran, K. V.</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">4,244</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ananda_Kularathne&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ananda Kularathne (page does not exist)\">Kularathne, Ananda</a></td>\n<td align=\"left\"><a href=\"/wiki/Hambantota_Electoral_District\" title=\"Hambantota Electoral District\">HAM</a></td>\n<td align=\"right\">27,618</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Jeewan_Kumaranatunga\" title=\"Jeewan Kumaranatunga\">Kumaranatunga, Jeewan</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">88,620</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Youth Affairs (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ananda_Kumarasiri&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ananda Kumarasiri (page does not exist)\">Kumarasiri, Ananda</a></td>\n<td align=\"left\"><a href=\"/wiki/Monaragala_Electoral_District\" title=\"Monaragala Electoral District\">MON</a></td>\n<td align=\"right\">36,487</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/W._J._M._Lokubandara\" title=\"W. J. M. Lokubandara\">Lokubandara, W. J. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">75,417</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\">Chief Opposition Whip (00-01).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Gamini_Lokuge\" title=\"Gamini Lokuge\">Lokuge, Gamini</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">58,009</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Mohamed_Maharoof&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Mohamed Maharoof (page does not exist)\">Maharoof, Mohamed</a></td>\n<td align=\"left\"><a href=\"/wiki/Trincomalee_Electoral_District\" title=\"Trincomalee Electoral District\">TRI</a></td>\n<td align=\"right\">21,348</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/T._Maheswaran\" title=\"T. Maheswaran\">Maheswaran, Thiagarasah</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">4,807</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/M._Mahroof\" title=\"M. Mahroof\">Mahroof, Mohamed</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">65,400</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Abdul_Majeed\" title=\"Abdul Majeed\" class=\"dab-link mw-redirect\">Majeed, Abdul</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=11th_Sri_Lankan_Parliament&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/M._N._Abdul_Majeed\" title=\"M. N. Abdul Majeed\">Majeed, M. N. Abdul</a></td>\n<td align=\"left\"><a href=\"/wiki/Trincomalee_Electoral_District\" title=\"Trincomalee Electoral District\">TRI</a></td>\n<td align=\"right\">18,173</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Post &amp; Telecommunications (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Imithiyas_Bakeer_Makar_Makar,_Imithiyas_Bakeer&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Imithiyas Bakeer Makar Makar, Imithiyas Bakeer (page does not exist)\">Imithiyas Bakeer Makar Makar, Imithiyas Bakeer</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">74,555</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Thilak_Marapone&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Thilak Marapone (page does not exist)\">Marapone, Thilak</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Noordeen_Mashoor\" title=\"Noordeen Mashoor\">Mashoor, Noordeen</a></td>\n<td align=\"left\"><a href=\"/wiki/Vanni_Electoral_District\" title=\"Vanni Electoral District\">VAN</a></td>\n<td align=\"right\">12,283</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Muslim_National_Unity_Alliance\" title=\"Muslim National Unity Alliance\"><span style=\"color:black;\">NUA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td align=\"left\">Deputy Minister of Ethnic Affairs &amp; National Integration (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Nadarasa_Matanarasa&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Nadarasa Matanarasa (page does not exist)\">Matanarasa, Nadarasa</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">4,673</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=A._A._Keerthi_Suranjith_Mawellage&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"A. A. Keerthi Suranjith Mawellage (page does not exist)\">Mawellage, Keerthi Suranjith</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">51,899</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Wijayapala_Mendis&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Wijayapala Mendis (page does not exist)\">Mendis, Wijayapala</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\">Minister Without Portfolio (00-)\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/M._H._Mohamed\" title=\"M. H. Mohamed\">Mohamed, M. H.</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">49,239</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Uduma_Lebbe_Mohamed_Mohideen&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Uduma Lebbe Mohamed Mohideen (page does not exist)\">Mohideen, U. L. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/Ampara_Electoral_District\" title=\"Ampara Electoral District\">AMP</a></td>\n<td align=\"right\">75,378</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ananda_Moonesinghe&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ananda Moonesinghe (page does not exist)\">Moonesinghe, Ananda</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">48,863</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Sarath_Moonesinghe\" title=\"Sarath Moonesinghe\" class=\"mw-redirect\">Moonesinghe, Sarath</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">51,230</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Speaker &amp; Chairman of Committees (00-01).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Milinda_Moragoda\" title=\"Milinda Moragoda\">Moragoda, Milinda</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Seyed_Ali_Zahir_Moulana\" title=\"Seyed Ali Zahir Moulana\">Moulana, Seyed Ali Zahir</a></td>\n<td align=\"left\"><a href=\"/wiki/Batticaloa_Electoral_District\" title=\"Batticaloa Electoral District\">BAT</a></td>\n<td align=\"right\">14,284</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Alavi_Mowlana&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Alavi Mowlana (page does not exist)\">Mowlana, Alavi</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Labour (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Hemakumara_Nanayakkara\" title=\"Hemakumara Nanayakkara\">Nanayakkara, Hemakumara</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">70,231</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=N._H._S._Ranjith_Nawarathna&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"N. H. S. Ranjith Nawarathna (page does not exist)\">Nawarathna, Ranjith</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">49,174</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/S._B._Nawinne\" title=\"S. B. Nawinne\">Nawinne, S. B.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">81,259</td>\n<td>18 October 2000</td>\n<td> </td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Resigned to become <a href=\"/wiki/Chief_Minister_of_Sri_Lanka\" title=\"Chief Minister of Sri Lanka\">Chief Minister</a> of the <a href=\"/wiki/North_Western_Province,_Sri_Lanka\" title=\"North Western Province, Sri Lanka\">North Western Province</a>. Replaced by <a href=\"/wiki/T._B._Ekanayake\" title=\"T. B. Ekanayake\">T. B. Ekanayake</a>.</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=H._G._P._Nelson&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"H. G. P. Nelson (page does not exist)\">Nelson, H. G. P.</a></td>\n<td align=\"left\"><a href=\"/wiki/Polonnaruwa_Electoral_District\" title=\"Polonnaruwa Electoral District\">POL</a></td>\n<td align=\"right\">31,241</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Vino_Noharathalingam\" title=\"Vino Noharathalingam\">Noharathalingam, Vino</a></td>\n<td align=\"left\"><a href=\"/wiki/Vanni_Electoral_District\" title=\"Vanni Electoral District\">VAN</a></td>\n<td align=\"right\">10,959</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Tamil_Eelam_Liberation_Organization\" title=\"Tamil Eelam Liberation Organization\"><span style=\"color:white;\">TELO</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Tamil_Eelam_Liberation_Organization\" title=\"Tamil Eelam Liberation Organization\"><span style=\"color:white;\">TELO</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Kariyawasam_Haputhanthri_Gamage_Noel_Padmasiri&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Kariyawasam Haputhanthri Gamage Noel Padmasiri (page does not exist)\">Padmasiri, K. H. G. N.</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">46,600</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Plantation Industries (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Joseph_Pararajasingham\" title=\"Joseph Pararajasingham\">Pararajasingham, Joseph</a></td>\n<td align=\"left\"><a href=\"/wiki/Batticaloa_Electoral_District\" title=\"Batticaloa Electoral District\">BAT</a></td>\n<td align=\"right\">12,605</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Richard_Pathirana&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Richard Pathirana (page does not exist)\">Pathirana, Richard</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">114,658</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Leader of the House (00-01). Minister of Public Administration, Home Affairs &amp; Administrative Reforms (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/G._L._Peiris\" title=\"G. L. Peiris\">Peiris, G. L.</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">139,123</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\"><small>Minister of Constitutional Affairs &amp; Industrial Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Dilan_Perera\" title=\"Dilan Perera\">Perera, Dilan</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">38,415</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Felix_Perera\" title=\"Felix Perera\">Perera, Felix</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">96,222</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Power &amp; Energy (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Festus_Perera&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Festus Perera (page does not exist)\">Perera, Festus</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">45,513</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Gamini_Jayawickrama_Perera\" title=\"Gamini Jayawickrama Perera\">Perera, Gamini Jayawickrama</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">123,847</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/M._Joseph_Michael_Perera\" title=\"M. Joseph Michael Perera\">Perera, Joseph Michael</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">59,646</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Lilantha_Perera&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Lilantha Perera (page does not exist)\">Perera, Lilantha</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">48,848</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Neomal_Perera\" title=\"Neomal Perera\">Perera, Neomal</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">49,207</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Upali_Piyasena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Upali Piyasena (page does not exist)\">Piyasena, Upali</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">54,756</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Jayathilaka_Podinilame&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Jayathilaka Podinilame (page does not exist)\">Podinilame, Jayathilaka</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">48,504</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Bharatha_Lazman_Premachandra&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Bharatha Lazman Premachandra (page does not exist)\">Premachandra, B. L.</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">62,237</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=A._M._Munidasa_Premachandra&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"A. M. Munidasa Premachandra (page does not exist)\">Premachandra, Munidasa</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">48,905</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Highways (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/A._D._Champika_Premadasa\" title=\"A. D. Champika Premadasa\">Premadasa, Champika</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">47,342</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Sajith_Premadasa\" title=\"Sajith Premadasa\">Premadasa, Sajith</a></td>\n<td align=\"left\"><a href=\"/wiki/Hambantota_Electoral_District\" title=\"Hambantota Electoral District\">HAM</a></td>\n<td align=\"right\">98,968</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Susil_Premajayanth\" title=\"Susil Premajayanth\">Premajayanth, Susil</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">165,905</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><a href=\"/wiki/Ministry_of_Education_(Sri_Lanka)\" title=\"Ministry of Education (Sri Lanka)\">Minister of Education</a> (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Don_Simanralalage_Shantha_Premaratne&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Don Simanralalage Shantha Premaratne (page does not exist)\">Premaratne, D. S. S.</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">35,800</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ediriweera_Premaratne&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ediriweera Premaratne (page does not exist)\">Premaratne, Ediriweera</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">53,690</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\">Deputy Minister of Buddha Sasana &amp; Religious Affairs (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Santhakumara_Punchihewa&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Santhakumara Punchihewa (page does not exist)\">Punchihewa, Santhakumara</a></td>\n<td align=\"left\"><a href=\"/wiki/Vanni_Electoral_District\" title=\"Vanni Electoral District\">VAN</a></td>\n<td align=\"right\">3,975</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Susantha_Punchinilame\" title=\"Susantha Punchinilame\">Punchinilame, Susantha</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">77,197</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Chamal_Rajapaksa\" title=\"Chamal Rajapaksa\">Rajapaksa, Chamal</a></td>\n<td align=\"left\"><a href=\"/wiki/Hambantota_Electoral_District\" title=\"Hambantota Electoral District\">HAM</a></td>\n<td align=\"right\">66,737</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Ports Development &amp; Development of the South (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mahinda_Rajapaksa\" title=\"Mahinda Rajapaksa\">Rajapaksa, Mahinda</a></td>\n<td align=\"left\"><a href=\"/wiki/Hambantota_Electoral_District\" title=\"Hambantota Electoral District\">HAM</a></td>\n<td align=\"right\">88,726</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Fisheries &amp; Aquatic Resources Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Suranimala_Rajapaksa&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Suranimala Rajapaksa (page does not exist)\">Rajapaksa, Suranimala</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">49,697</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Keheliya_Rambukwella\" title=\"Keheliya Rambukwella\">Rambukwella, Keheliya</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">154,403</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Reggie_Ranatunga&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Reggie Ranatunga (page does not exist)\">Ranatunga, Reggie</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">79,510</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Chief Government Whip (00-01). Minister of Food &amp; Marketing Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Jayatissa_Ranaweera\" title=\"Jayatissa Ranaweera\">Ranaweera, Jayatissa</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">38,631</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Land Development &amp; Minor Export Agriculture (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ravindra_Randeniya\" title=\"Ravindra Randeniya\">Randeniya, Ravindra</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Rathnayake_Mudiyanselage_Rathnayake&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Rathnayake Mudiyanselage Rathnayake (page does not exist)\">Rathnayake, R. M.</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">38,997</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mahinda_Ratnatilaka\" title=\"Mahinda Ratnatilaka\">Ratnatilaka, Mahinda</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">49,808</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Sagala_Ratnayaka\" title=\"Sagala Ratnayaka\">Ratnayaka, Sagala</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">58,634</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Amara_Piyaseeli_Ratnayake\" title=\"Amara Piyaseeli Ratnayake\">Ratnayake, Amara Piyaseeli</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">51,498</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Anuruddha_Ratwatte\" title=\"Anuruddha Ratwatte\">Ratwatte, Anuruddha</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">152,511</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><a href=\"/wiki/Ministry_of_Power_and_Energy\" title=\"Ministry of Power and Energy\">Minister of Power &amp; Energy</a> (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Neil_Rupasinghe\" title=\"Neil Rupasinghe\">Rupasinghe, Neil</a></td>\n<td align=\"left\"><a href=\"/wiki/Gampaha_Electoral_District\" title=\"Gampaha Electoral District\">GAM</a></td>\n<td align=\"right\">51,500</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Labour (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mahinda_Samarasinghe\" title=\"Mahinda Samarasinghe\">Samarasinghe, Mahinda</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">82,511</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mangala_Samaraweera\" title=\"Mangala Samaraweera\">Samaraweera, Mangala</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">93,110</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Urban Development, Construction &amp; Public Utilities (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ravindra_Samaraweera\" title=\"Ravindra Samaraweera\">Samaraweera, Ravindra</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">44,257</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Upali_Samaraweera&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Upali Samaraweera (page does not exist)\">Samaraweera, Upali</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">45,839</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Kandiah_Sangaran&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Kandiah Sangaran (page does not exist)\">Sangaran, Kandiah</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">2,902</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Eelam_People%27s_Democratic_Party\" title=\"Eelam People's Democratic Party\"><span style=\"color:white;\">EPDP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Suppiah_Sathasiwam&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Suppiah Sathasiwam (page does not exist)\">Sathasiwam, Suppiah</a></td>\n<td align=\"left\"><a href=\"/wiki/Nuwara_Eliya_Electoral_District\" title=\"Nuwara Eliya Electoral District\">NUW</a></td>\n<td align=\"right\">47,472</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ashly_Nimalanayagam_Savuntharanayagam&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ashly Nimalanayagam Savuntharanayagam (page does not exist)\">Savuntharanayagam, A. N.</a></td>\n<td align=\"left\"><a href=\"/wiki/Batticaloa_Electoral_District\" title=\"Batticaloa Electoral District\">BAT</a></td>\n<td align=\"right\">16,542</td>\n<td>18 October 2000</td>\n<td>7 November 2000</td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/M._S._Sellasamy\" title=\"M. S. Sellasamy\">Sellasamy, M. S.</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><span style=\"color:white;\">NWC</span></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#F90818\"><span style=\"color:white;\">NWC</span></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=H._B._Semasinghe&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"H. B. Semasinghe (page does not exist)\">Semasinghe, H. B.</a></td>\n<td align=\"left\"><a href=\"/wiki/Anuradhapura_Electoral_District\" title=\"Anuradhapura Electoral District\">ANU</a></td>\n<td align=\"right\">35,090</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Co operative Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Rukman_Senanayake\" title=\"Rukman Senanayake\">Senanayake, Rukman</a></td>\n<td align=\"left\"><a href=\"/wiki/Polonnaruwa_Electoral_District\" title=\"Polonnaruwa Electoral District\">POL</a></td>\n<td align=\"right\">27,200</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Rajitha_Senaratne\" title=\"Rajitha Senaratne\">Senaratne, Rajitha</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">73,382</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mavai_Senathirajah\" title=\"Mavai Senathirajah\">Senathirajah, Mavai</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">10,965</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Athauda_Senewiratne\" title=\"Athauda Senewiratne\" class=\"mw-redirect\">Senewiratne, Athauda</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">76,510</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/John_Senewiratne\" title=\"John Senewiratne\" class=\"mw-redirect\">Senewiratne, John</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">86,744</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Health (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Lakshman_Senewiratne\" title=\"Lakshman Senewiratne\">Senewiratne, Lakshman</a></td>\n<td align=\"left\"><a href=\"/wiki/Badulla_Electoral_District\" title=\"Badulla Electoral District\">BAD</a></td>\n<td align=\"right\">51,382</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Maddumage_Samson_Silva&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Maddumage Samson Silva (page does not exist)\">Silva, Maddumage Samson</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">38,894</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Rizzwi_Sinnalebbe&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Rizzwi Sinnalebbe (page does not exist)\">Sinnalebbe, Rizzwi</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Maithripala_Sirisena\" title=\"Maithripala Sirisena\">Sirisena, Maithripala</a></td>\n<td align=\"left\"><a href=\"/wiki/Polonnaruwa_Electoral_District\" title=\"Polonnaruwa Electoral District\">POL</a></td>\n<td align=\"right\">57,072</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Mahaweli Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=R._A._D._Sirisena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"R. A. D. Sirisena (page does not exist)\">Sirisena, R. A. D.</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">43,002</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Muthu_Sivalingam\" title=\"Muthu Sivalingam\">Sivalingam, Muthu</a></td>\n<td align=\"left\"><a href=\"/wiki/Nuwara_Eliya_Electoral_District\" title=\"Nuwara Eliya Electoral District\">NUW</a></td>\n<td align=\"right\">55,673</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Sinnathamby_Sivamaharajah\" title=\"Sinnathamby Sivamaharajah\">Sivamaharajah, Sinnathamby</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">7,187</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/Tamil_United_Liberation_Front\" title=\"Tamil United Liberation Front\"><span style=\"color:black;\">TULF</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ranjith_Siyambalapitiya\" title=\"Ranjith Siyambalapitiya\">Siyambalapitiya, Ranjith</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">49,582</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Vijith_Wijayamuni_Soyza&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Vijith Wijayamuni Soyza (page does not exist)\">Soyza, Vijith Wijayamuni</a></td>\n<td align=\"left\"><a href=\"/wiki/Monaragala_Electoral_District\" title=\"Monaragala Electoral District\">MON</a></td>\n<td align=\"right\">37,312</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Mahaweli Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Premaratnage_Sumathipala&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Premaratnage Sumathipala (page does not exist)\">Sumathipala, Premaratnage</a></td>\n<td align=\"left\"><a href=\"/wiki/Vanni_Electoral_District\" title=\"Vanni Electoral District\">VAN</a></td>\n<td align=\"right\">5,205</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small>Deputy Minister of Development Rehabilitation &amp; Reconstruction of the North &amp; Tamil Affairs, North &amp; East (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ellawala_Suranganie&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ellawala Suranganie (page does not exist)\">Suranganie, Ellawala</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">54,517</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Janaka_Bandara_Tennakoon\" title=\"Janaka Bandara Tennakoon\">Tennakoon, Janaka Bandara</a></td>\n<td align=\"left\"><a href=\"/wiki/Matale_Electoral_District\" title=\"Matale Electoral District\">MTL</a></td>\n<td align=\"right\">42,366</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Health (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Kumari_Tennakoon&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Kumari Tennakoon (page does not exist)\">Tennakoon, Kumari</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">49,476</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Dayasritha_Thissera\" title=\"Dayasritha Thissera\">Thissera, Dayasritha</a></td>\n<td align=\"left\"><a href=\"/wiki/Puttalam_Electoral_District\" title=\"Puttalam Electoral District\">PUT</a></td>\n<td align=\"right\">38,885</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Arumugan_Thondaman\" title=\"Arumugan Thondaman\" class=\"mw-redirect\">Thondaman, Arumugan</a></td>\n<td align=\"left\"><a href=\"/wiki/Nuwara_Eliya_Electoral_District\" title=\"Nuwara Eliya Electoral District\">NUW</a></td>\n<td align=\"right\">61,779</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td></td>\n<td align=\"left\">Minister of Estate Infrastructure &amp; Livestock Development (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/M._S._Thowfeek\" title=\"M. S. Thowfeek\">Thowfeek, M. S.</a></td>\n<td align=\"left\"><a href=\"/wiki/Trincomalee_Electoral_District\" title=\"Trincomalee Electoral District\">TRI</a></td>\n<td align=\"right\">15,588</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/A.R._Anjan_Umma\" title=\"A.R. Anjan Umma\" class=\"mw-redirect\">Umma, Anjan</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Appathurai_Vinayagamoorthy\" title=\"Appathurai Vinayagamoorthy\" class=\"mw-redirect\">Vinayagamoorthy, Appathurai</a></td>\n<td align=\"left\"><a href=\"/wiki/Jaffna_Electoral_District\" title=\"Jaffna Electoral District\">JAF</a></td>\n<td align=\"right\">3,825</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/All_Ceylon_Tamil_Congress\" title=\"All Ceylon Tamil Congress\"><span style=\"color:black;\">ACTC</span></a></td>\n<td></td>\n<td bgcolor=\"#FFFF00\"><a href=\"/wiki/All_Ceylon_Tamil_Congress\" title=\"All Ceylon Tamil Congress\"><span style=\"color:black;\">ACTC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Arachchige_Dharmadasa_Wanniarachchi&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Arachchige Dharmadasa Wanniarachchi (page does not exist)\">Wanniarachchi, A. D.</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">39,972</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Pavithra_Devi_Wanniarachchi\" title=\"Pavithra Devi Wanniarachchi\">Wanniarachchi, Pavithra Devi</a></td>\n<td align=\"left\"><a href=\"/wiki/Ratnapura_Electoral_District\" title=\"Ratnapura Electoral District\">RAT</a></td>\n<td align=\"right\">108,324</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Plan Implementation (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Dilip_Wedaarachchi\" title=\"Dilip Wedaarachchi\">Wedaarachchi, Dilip</a></td>\n<td align=\"left\"><a href=\"/wiki/Hambantota_Electoral_District\" title=\"Hambantota Electoral District\">HAM</a></td>\n<td align=\"right\">43,949</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Athula_Indika_Weerakoon&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Athula Indika Weerakoon (page does not exist)\">Weerakoon, Athula Indika</a></td>\n<td align=\"left\"><a href=\"/wiki/Galle_Electoral_District\" title=\"Galle Electoral District\">GAL</a></td>\n<td align=\"right\">2,664</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Batty_Weerakoon&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Batty Weerakoon (page does not exist)\">Weerakoon, Batty</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Lanka_Sama_Samaja_Party\" title=\"Lanka Sama Samaja Party\"><span style=\"color:white;\">LSSP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Lanka_Sama_Samaja_Party\" title=\"Lanka Sama Samaja Party\"><span style=\"color:white;\">LSSP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><a href=\"/wiki/Ministry_of_Justice_and_Law_Reforms_(Sri_Lanka)\" title=\"Ministry of Justice and Law Reforms (Sri Lanka)\">Minister of Justice</a> (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Wimal_Weerawansa\" title=\"Wimal Weerawansa\">Weerawansa, Wimal</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">13,284</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ediriweera_Weerawardena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ediriweera Weerawardena (page does not exist)\">Weerawardena, Ediriweera</a></td>\n<td align=\"left\"><a href=\"/wiki/Kandy_Electoral_District\" title=\"Kandy Electoral District\">KAN</a></td>\n<td align=\"right\">35,388</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">D<small>eputy Minister of Development Rehabilitation &amp; Reconstruction of the East &amp; Rural Housing Development (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Kumara_Welgama\" title=\"Kumara Welgama\">Welgama, Kumara</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">60,394</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Deputy Minister of Transport (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ratnasiri_Wickremanayake\" title=\"Ratnasiri Wickremanayake\">Wickremanayake, Ratnasiri</a></td>\n<td align=\"left\"><a href=\"/wiki/Kalutara_Electoral_District\" title=\"Kalutara Electoral District\">KAL</a></td>\n<td align=\"right\">148,705</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\"><small><a href=\"/wiki/Prime_Minister_of_Sri_Lanka\" title=\"Prime Minister of Sri Lanka\">Prime Minister</a> (00-01). Minister of  Buddha Sasana  Religious Affairs &amp; Plantation Industries (00-).</small>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Ranil_Wickremasinghe\" title=\"Ranil Wickremasinghe\">Wickremasinghe, Ranil</a></td>\n<td align=\"left\"><a href=\"/wiki/Colombo_Electoral_District\" title=\"Colombo Electoral District\">COL</a></td>\n<td align=\"right\">363,668</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\"><a href=\"/wiki/Leader_of_the_Opposition_(Sri_Lanka)\" title=\"Leader of the Opposition (Sri Lanka)\">Leader of the Opposition</a> (00-01).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Jayasundara_Wijekoon&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Jayasundara Wijekoon (page does not exist)\">Wijekoon, Jayasundara</a></td>\n<td align=\"left\"><a href=\"/wiki/Monaragala_Electoral_District\" title=\"Monaragala Electoral District\">MON</a></td>\n<td align=\"right\">33,784</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mahinda_Wijesekara\" title=\"Mahinda Wijesekara\">Wijesekara, Mahinda</a></td>\n<td align=\"left\"><a href=\"/wiki/Matara_Electoral_District\" title=\"Matara Electoral District\">MTR</a></td>\n<td align=\"right\">83,625</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td align=\"left\">Minister of Forestry &amp; Environment (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Mano_Wijeyeratne\" title=\"Mano Wijeyeratne\">Wijeyeratne, Mano</a></td>\n<td align=\"left\"><a href=\"/wiki/Kegalle_Electoral_District\" title=\"Kegalle Electoral District\">KEG</a></td>\n<td align=\"right\">41,069</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Daham_Wimalasena&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Daham Wimalasena (page does not exist)\">Wimalasena, Daham</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td bgcolor=\"#1CAE05\"><a href=\"/wiki/United_National_Party\" title=\"United National Party\"><span style=\"color:white;\">UNP</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Dissanayka_Wimalaweera&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Dissanayka Wimalaweera (page does not exist)\">Wimalaweera, Dissanayka</a></td>\n<td align=\"left\"><a href=\"/wiki/Ampara_Electoral_District\" title=\"Ampara Electoral District\">AMP</a></td>\n<td align=\"right\">27,677</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#9acd32\"><a href=\"/wiki/Sri_Lanka_Muslim_Congress\" title=\"Sri Lanka Muslim Congress\"><span style=\"color:black;\">SLMC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\"><a href=\"/wiki/Anura_Priyadharshana_Yapa\" title=\"Anura Priyadharshana Yapa\">Yapa, Anura Priyadharshana</a></td>\n<td align=\"left\"><a href=\"/wiki/Kurunegala_Electoral_District\" title=\"Kurunegala Electoral District\">KUR</a></td>\n<td align=\"right\">60,479</td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/Sri_Lanka_Freedom_Party\" title=\"Sri Lanka Freedom Party\"><span style=\"color:white;\">SLFP</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td align=\"left\">Minister of Information &amp; Media (00-).\n</td></tr><tr><td align=\"left\"><a href=\"/w/index.php?title=Ramaiah_Yogarajan&amp;action=edit&amp;redlink=1\" class=\"new\" title=\"Ramaiah Yogarajan (page does not exist)\">Yogarajan, Ramaiah</a></td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Ceylon_Workers%27_Congress\" title=\"Ceylon Workers' Congress\"><span style=\"color:white;\">CWC</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\">?</td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td></td>\n<td bgcolor=\"#1609F7\"><a href=\"/wiki/People%27s_Alliance_(Sri_Lanka)\" title=\"People's Alliance (Sri Lanka)\"><span style=\"color:white;\">PA</span></a></td>\n<td>\n</td></tr><tr><td align=\"left\">?</td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td bgcolor=\"#F90818\"><a href=\"/wiki/Janatha_Vimukthi_Peramuna\" title=\"Janatha Vimukthi Peramuna\"><span style=\"color:white;\">JVP</span></a></td>\n<td></td>\n<td>\n</td></tr><tr><td align=\"left\">?</td>\n<td align=\"left\"><a href=\"/wiki/National_List_Member_of_Parliament\" title=\"National List Member of Parliament\">NAT</a></td>\n<td></td>\n<td>18 October 2000</td>\n<td>10 October 2001</td>\n<td bgcolor=\"#F4C430\"><span style=\"color:black;\">SH</span></td>\n<td></td>\n<td bgcolor=\"#F4C430\"><span style=\"color:black;\">SH</span>\n</td></tr></table>", "title": "Abdul Majeed"}, {"images": [], "page_title": "1540s", "options": [{"text": "Moriz Rosenthal, Polish-American pianist", "dab_title": "Rosenthal", "title": "Moriz Rosenthal"}, {"text": "Hannah Rosenthal, politician active in Jewish causes", "dab_title": "Rosenthal", "title": "Hannah Rosenthal"}, {"text": "Paul Rosenthal, American violinist", "dab_title": "Rosenthal", "title": "Paul Rosenthal"}, {"text": "Meredith Rosenthal, An alternative name for Meredith Barnes.", "dab_title": "Rosenthal", "title": "Meredith Rosenthal (page does not exist)"}, {"text": "Harold Rosenthal, British music critic", "dab_title": "Rosenthal", "title": "Harold Rosenthal"}, {"text": "Ro\u017emit\u00e1l pod T\u0159em\u0161\u00ednem in the Czech Republic, known as Rosenthal in German", "dab_title": "Rosenthal", "title": "Ro\u017emit\u00e1l pod T\u0159em\u0161\u00ednem"}, {"text": "Rosenthal, a part of Ralbitz-Rosenthal in Bautzen district", "dab_title": "Rosenthal", "title": "Ralbitz-Rosenthal"}, {"text": "Ida Rosenthal, bra designer/inventor and co-founder of Maidenform", "dab_title": "Rosenthal", "title": "Ida Rosenthal"}, {"text": "Arnold Jack Rosenthal (1923-2010), Louisiana politician", "dab_title": "Rosenthal", "title": "Arnold Jack Rosenthal"}, {"text": "Jack Rosenthal, British playwright and television writer", "dab_title": "Rosenthal", "title": "Jack Rosenthal"}, {"text": "Ben Rosenthal, United States Congressman (1962\u20131983)", "dab_title": "Rosenthal", "title": "Ben Rosenthal"}, {"text": "Samuel Rosenthal, Polish-French chess master", "dab_title": "Rosenthal", "title": "Samuel Rosenthal"}, {"text": "Jean Rosenthal (1912\u20131969), pioneer of theatrical lighting design", "dab_title": "Rosenthal", "title": "Jean Rosenthal"}, {"text": "Sir Charles Rosenthal (1875\u20131954), Australian general of World War I", "dab_title": "Rosenthal", "title": "Charles Rosenthal"}, {"text": "Philip Rosenthal, television producer", "dab_title": "Rosenthal", "title": "Philip Rosenthal"}, {"text": "Constantin Daniel Rosenthal, Wallachian painter and revolutionary", "dab_title": "Rosenthal", "title": "Constantin Daniel Rosenthal"}, {"text": "Jim Rosenthal, UK sports presenter", "dab_title": "Rosenthal", "title": "Jim Rosenthal"}, {"text": "Uri Rosenthal, Dutch foreign minister.", "dab_title": "Rosenthal", "title": "Uri Rosenthal"}, {"text": "Joe Rosenthal, American photographer", "dab_title": "Rosenthal", "title": "Joe Rosenthal"}, {"text": "Roosendaal, The Netherlands", "dab_title": "Rosenthal", "title": "Roosendaal"}, {"text": "David Rosenthal (disambiguation), multiple people", "dab_title": "Rosenthal", "title": "David Rosenthal (disambiguation)"}, {"text": "Joseph Rosenthal, Technology Solutions International - Founder", "dab_title": "Rosenthal", "title": "Joseph Rosenthal"}, {"text": "Rick Rosenthal, American film director", "dab_title": "Rosenthal", "title": "Rick Rosenthal"}, {"text": "Rosenthal, a part of Rosenthal-Bielatal in the S\u00e4chsische Schweiz district", "dab_title": "Rosenthal", "title": "Rosenthal-Bielatal"}, {"text": "Bernard \"Tony\" Rosenthal (1914\u20132009), American abstract sculptor", "dab_title": "Rosenthal", "title": "Bernard Rosenthal"}, {"text": "Ed Rosenthal, author and publisher arrested for use of medical marijuana", "dab_title": "Rosenthal", "title": "Ed Rosenthal"}, {"text": "M\u00e1rk R\u00f3zsav\u00f6lgyi, Hungarian violinist and composer, the father of cs\u00e1rd\u00e1s, born Mordecai Rosenthal", "dab_title": "Rosenthal", "title": "M\u00e1rk R\u00f3zsav\u00f6lgyi"}, {"text": "Fran\u00e7ois Rozenthal, French ice hockey player", "dab_title": "Rosenthal", "title": "Fran\u00e7ois Rozenthal"}, {"text": "Bernard Rosenthal, American scholar of the Salem witchcraft trials", "dab_title": "Rosenthal", "title": "Bernard Rosenthal (scholar)"}, {"text": "Franz Rosenthal (1914\u20132003), scholar of Arabic literature and Islam", "dab_title": "Rosenthal", "title": "Franz Rosenthal"}, {"text": "Norman E. Rosenthal, Author of \"Winter Blues\"", "dab_title": "Rosenthal", "title": "Norman E. Rosenthal"}, {"text": "Mike Rosenthal, American NFL football player", "dab_title": "Rosenthal", "title": "Mike Rosenthal"}, {"text": "Harald Rosenthal, German marine biologist", "dab_title": "Rosenthal", "title": "Harald Rosenthal"}, {"text": "Rosenthal, now Bartoszyce, Poland", "dab_title": "Rosenthal", "title": "Bartoszyce"}, {"text": "Ronny Rosenthal (\"Rocket Ronny\"), Israeli footballer", "dab_title": "Rosenthal", "title": "Ronny Rosenthal"}, {"text": "Rosenthal, Hesse, in the Waldeck-Frankenberg district", "dab_title": "Rosenthal", "title": "Rosenthal, Hesse"}, {"text": "Abe M. Rosenthal (1922\u20132006), New York Times editor and columnist", "dab_title": "Rosenthal", "title": "Abe M. Rosenthal"}, {"text": "Rosenthal, a part of Peine in Lower Saxony", "dab_title": "Rosenthal", "title": "Peine"}, {"text": "Ilena Rosenthal, breast implant activist", "dab_title": "Rosenthal", "title": "Ilena Rosenthal"}, {"text": "Arthur Rosenthal (1887\u20131959), German mathematician", "dab_title": "Rosenthal", "title": "Arthur Rosenthal"}, {"text": "Richard P. Rosenthal, author, law enforcement officer, Chief of police for Wellfleet, Massachusetts", "dab_title": "Rosenthal", "title": "Richard P. Rosenthal"}, {"text": "Rosendahl", "dab_title": "Rosenthal", "title": "Rosendahl"}, {"text": "Jane Rosenthal, film producer", "dab_title": "Rosenthal", "title": "Jane Rosenthal"}, {"text": "Dean Rosenthal, American composer", "dab_title": "Rosenthal", "title": "Dean Rosenthal"}, {"text": "Phil Rosenthal, Chicago Tribune columnist", "dab_title": "Rosenthal", "title": "Phil Rosenthal"}, {"text": "Jeffrey S. Rosenthal, Canadian statistician and author", "dab_title": "Rosenthal", "title": "Jeffrey S. Rosenthal"}, {"text": "Chuck Rosenthal (district attorney), the Republican former District Attorney of Harris County, Texas", "dab_title": "Rosenthal", "title": "Chuck Rosenthal (district attorney)"}, {"text": "Maurice Rozenthal, French ice hockey player", "dab_title": "Rosenthal", "title": "Maurice Rozenthal"}, {"text": "Sam Rosenthal, American musician, founder of Projekt Records and the band Black Tape for a Blue Girl", "dab_title": "Rosenthal", "title": "Sam Rosenthal"}, {"text": "Denise Rosenthal, Chilean actress, singer, and songwriter.", "dab_title": "Rosenthal", "title": "Denise Rosenthal"}, {"text": "Laurence Rosenthal, Film and television composer", "dab_title": "Rosenthal", "title": "Laurence Rosenthal"}, {"text": "Rosenthal (Berlin), a part of Berlin, Germany", "dab_title": "Rosenthal", "title": "Rosenthal (Berlin)"}, {"text": "Harold Wallace Rosenthal, the administrative assistant of senator Jacob K. Javits from New York", "dab_title": "Rosenthal", "title": "Harold Wallace Rosenthal"}, {"text": "Dietmar Rosenthal, Russian linguist", "dab_title": "Rosenthal", "title": "Dietmar Rosenthal"}, {"text": "Manuel Rosenthal (1904\u20132003), French composer and conductor", "dab_title": "Rosenthal", "title": "Manuel Rosenthal"}, {"text": "Eliezer Samson Rosenthal, 20th century Israeli Religious Zionist Orthodox rabbi and academic talmudist", "dab_title": "Rosenthal", "title": "Eliezer Samson Rosenthal"}, {"text": "Lukas Rosenthal, German rugby union international", "dab_title": "Rosenthal", "title": "Lukas Rosenthal"}, {"text": "Richard R. Rosenthal, American allergist, co-inventor of Rosenthal-French dosimeter", "dab_title": "Rosenthal", "title": "Richard R. Rosenthal"}, {"text": "Robert Rosenthal (disambiguation), multiple people", "dab_title": "Rosenthal", "title": "Robert Rosenthal (disambiguation)"}, {"text": "Frank \"Lefty\" Rosenthal, Las Vegas entrepreneur", "dab_title": "Rosenthal", "title": "Frank Rosenthal"}], "context": "<li class=\"dab-context\"> <a href=\"/wiki/August_27\" title=\"August 27\">August 27</a> \u2013 Advice and citizenry of <a href=\"/wiki/Hildesheim\" title=\"Hildesheim\">Hildesheim</a> (<a href=\"/wiki/Germany\" title=\"Germany\">Germany</a>) profess themselves to the Lutheran teachings. As a pledge owner, the city <a href=\"/wiki/Hildesheim\" title=\"Hildesheim\">Hildesheim</a> provides for the execution of the Reformation in the city and office of <a href=\"/wiki/Peine\" title=\"Peine\">Peine</a>. The priests from the localities of Clauen, <a href=\"/wiki/Hohenhameln\" title=\"Hohenhameln\">Hohenhameln</a>, <a href=\"/wiki/So%C3%9Fmar\" title=\"So\u00dfmar\">Sossmar</a>, Schmedenstedt, <a href=\"/wiki/Lengede\" title=\"Lengede\">Lengede</a> and <a href=\"/wiki/Rosenthal\" title=\"Rosenthal\" class=\"dab-link\">Rosenthal</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=1540s&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup> resume their offices in the sense of the <a href=\"/wiki/Protestant_Reformation\" title=\"Protestant Reformation\">Reformation</a>.\n</li>", "title": "Rosenthal"}, {"images": ["//upload.wikimedia.org/wikipedia/commons/thumb/a/a8/LocationEthiopia.png/220px-LocationEthiopia.png"], "page_title": "1542", "options": [{"text": "Lukas Rosenthal, German rugby union international", "dab_title": "Rosenthal", "title": "Lukas Rosenthal"}, {"text": "Rosendahl", "dab_title": "Rosenthal", "title": "Rosendahl"}, {"text": "M\u00e1rk R\u00f3zsav\u00f6lgyi, Hungarian violinist and composer, the father of cs\u00e1rd\u00e1s, born Mordecai Rosenthal", "dab_title": "Rosenthal", "title": "M\u00e1rk R\u00f3zsav\u00f6lgyi"}, {"text": "Sam Rosenthal, American musician, founder of Projekt Records and the band Black Tape for a Blue Girl", "dab_title": "Rosenthal", "title": "Sam Rosenthal"}, {"text": "Fran\u00e7ois Rozenthal, French ice hockey player", "dab_title": "Rosenthal", "title": "Fran\u00e7ois Rozenthal"}, {"text": "Abe M. Rosenthal (1922\u20132006), New York Times editor and columnist", "dab_title": "Rosenthal", "title": "Abe M. Rosenthal"}, {"text": "Ben Rosenthal, United States Congressman (1962\u20131983)", "dab_title": "Rosenthal", "title": "Ben Rosenthal"}, {"text": "Franz Rosenthal (1914\u20132003), scholar of Arabic literature and Islam", "dab_title": "Rosenthal", "title": "Franz Rosenthal"}, {"text": "Norman E. Rosenthal, Author of \"Winter Blues\"", "dab_title": "Rosenthal", "title": "Norman E. Rosenthal"}, {"text": "Constantin Daniel Rosenthal, Wallachian painter and revolutionary", "dab_title": "Rosenthal", "title": "Constantin Daniel Rosenthal"}, {"text": "Harald Rosenthal, German marine biologist", "dab_title": "Rosenthal", "title": "Harald Rosenthal"}, {"text": "Phil Rosenthal, Chicago Tribune columnist", "dab_title": "Rosenthal", "title": "Phil Rosenthal"}, {"text": "Robert Rosenthal (disambiguation), multiple people", "dab_title": "Rosenthal", "title": "Robert Rosenthal (disambiguation)"}, {"text": "Harold Wallace Rosenthal, the administrative assistant of senator Jacob K. Javits from New York", "dab_title": "Rosenthal", "title": "Harold Wallace Rosenthal"}, {"text": "Arnold Jack Rosenthal (1923-2010), Louisiana politician", "dab_title": "Rosenthal", "title": "Arnold Jack Rosenthal"}, {"text": "Bernard Rosenthal, American scholar of the Salem witchcraft trials", "dab_title": "Rosenthal", "title": "Bernard Rosenthal (scholar)"}, {"text": "Ilena Rosenthal, breast implant activist", "dab_title": "Rosenthal", "title": "Ilena Rosenthal"}, {"text": "Ro\u017emit\u00e1l pod T\u0159em\u0161\u00ednem in the Czech Republic, known as Rosenthal in German", "dab_title": "Rosenthal", "title": "Ro\u017emit\u00e1l pod T\u0159em\u0161\u00ednem"}, {"text": "Meredith Rosenthal, An alternative name for Meredith Barnes.", "dab_title": "Rosenthal", "title": "Meredith Rosenthal (page does not exist)"}, {"text": "Joe Rosenthal, American photographer", "dab_title": "Rosenthal", "title": "Joe Rosenthal"}, {"text": "Ronny Rosenthal (\"Rocket Ronny\"), Israeli footballer", "dab_title": "Rosenthal", "title": "Ronny Rosenthal"}, {"text": "Rosenthal, a part of Ralbitz-Rosenthal in Bautzen district", "dab_title": "Rosenthal", "title": "Ralbitz-Rosenthal"}, {"text": "Richard P. Rosenthal, author, law enforcement officer, Chief of police for Wellfleet, Massachusetts", "dab_title": "Rosenthal", "title": "Richard P. Rosenthal"}, {"text": "Sir Charles Rosenthal (1875\u20131954), Australian general of World War I", "dab_title": "Rosenthal", "title": "Charles Rosenthal"}, {"text": "Jeffrey S. Rosenthal, Canadian statistician and author", "dab_title": "Rosenthal", "title": "Jeffrey S. Rosenthal"}, {"text": "Rosenthal, Hesse, in the Waldeck-Frankenberg district", "dab_title": "Rosenthal", "title": "Rosenthal, Hesse"}, {"text": "Rosenthal, a part of Peine in Lower Saxony", "dab_title": "Rosenthal", "title": "Peine"}, {"text": "Samuel Rosenthal, Polish-French chess master", "dab_title": "Rosenthal", "title": "Samuel Rosenthal"}, {"text": "Roosendaal, The Netherlands", "dab_title": "Rosenthal", "title": "Roosendaal"}, {"text": "Denise Rosenthal, Chilean actress, singer, and songwriter.", "dab_title": "Rosenthal", "title": "Denise Rosenthal"}, {"text": "Laurence Rosenthal, Film and television composer", "dab_title": "Rosenthal", "title": "Laurence Rosenthal"}, {"text": "Paul Rosenthal, American violinist", "dab_title": "Rosenthal", "title": "Paul Rosenthal"}, {"text": "Dietmar Rosenthal, Russian linguist", "dab_title": "Rosenthal", "title": "Dietmar Rosenthal"}, {"text": "Manuel Rosenthal (1904\u20132003), French composer and conductor", "dab_title": "Rosenthal", "title": "Manuel Rosenthal"}, {"text": "Eliezer Samson Rosenthal, 20th century Israeli Religious Zionist Orthodox rabbi and academic talmudist", "dab_title": "Rosenthal", "title": "Eliezer Samson Rosenthal"}, {"text": "Maurice Rozenthal, French ice hockey player", "dab_title": "Rosenthal", "title": "Maurice Rozenthal"}, {"text": "Rick Rosenthal, American film director", "dab_title": "Rosenthal", "title": "Rick Rosenthal"}, {"text": "Frank \"Lefty\" Rosenthal, Las Vegas entrepreneur", "dab_title": "Rosenthal", "title": "Frank Rosenthal"}, {"text": "Moriz Rosenthal, Polish-American pianist", "dab_title": "Rosenthal", "title": "Moriz Rosenthal"}, {"text": "Bernard \"Tony\" Rosenthal (1914\u20132009), American abstract sculptor", "dab_title": "Rosenthal", "title": "Bernard Rosenthal"}, {"text": "Mike Rosenthal, American NFL football player", "dab_title": "Rosenthal", "title": "Mike Rosenthal"}, {"text": "Hannah Rosenthal, politician active in Jewish causes", "dab_title": "Rosenthal", "title": "Hannah Rosenthal"}, {"text": "Rosenthal, a part of Rosenthal-Bielatal in the S\u00e4chsische Schweiz district", "dab_title": "Rosenthal", "title": "Rosenthal-Bielatal"}, {"text": "Uri Rosenthal, Dutch foreign minister.", "dab_title": "Rosenthal", "title": "Uri Rosenthal"}, {"text": "Harold Rosenthal, British music critic", "dab_title": "Rosenthal", "title": "Harold Rosenthal"}, {"text": "Philip Rosenthal, television producer", "dab_title": "Rosenthal", "title": "Philip Rosenthal"}, {"text": "Ida Rosenthal, bra designer/inventor and co-founder of Maidenform", "dab_title": "Rosenthal", "title": "Ida Rosenthal"}, {"text": "Rosenthal (Berlin), a part of Berlin, Germany", "dab_title": "Rosenthal", "title": "Rosenthal (Berlin)"}, {"text": "Arthur Rosenthal (1887\u20131959), German mathematician", "dab_title": "Rosenthal", "title": "Arthur Rosenthal"}, {"text": "Jack Rosenthal, British playwright and television writer", "dab_title": "Rosenthal", "title": "Jack Rosenthal"}, {"text": "Jane Rosenthal, film producer", "dab_title": "Rosenthal", "title": "Jane Rosenthal"}, {"text": "Rosenthal, now Bartoszyce, Poland", "dab_title": "Rosenthal", "title": "Bartoszyce"}, {"text": "Jean Rosenthal (1912\u20131969), pioneer of theatrical lighting design", "dab_title": "Rosenthal", "title": "Jean Rosenthal"}, {"text": "Ed Rosenthal, author and publisher arrested for use of medical marijuana", "dab_title": "Rosenthal", "title": "Ed Rosenthal"}, {"text": "Chuck Rosenthal (district attorney), the Republican former District Attorney of Harris County, Texas", "dab_title": "Rosenthal", "title": "Chuck Rosenthal (district attorney)"}, {"text": "Jim Rosenthal, UK sports presenter", "dab_title": "Rosenthal", "title": "Jim Rosenthal"}, {"text": "David Rosenthal (disambiguation), multiple people", "dab_title": "Rosenthal", "title": "David Rosenthal (disambiguation)"}, {"text": "Joseph Rosenthal, Technology Solutions International - Founder", "dab_title": "Rosenthal", "title": "Joseph Rosenthal"}, {"text": "Richard R. Rosenthal, American allergist, co-inventor of Rosenthal-French dosimeter", "dab_title": "Rosenthal", "title": "Richard R. Rosenthal"}, {"text": "Dean Rosenthal, American composer", "dab_title": "Rosenthal", "title": "Dean Rosenthal"}], "context": "<li class=\"dab-context\"> <a href=\"/wiki/August_27\" title=\"August 27\">August 27</a> \u2013 Advice and citizenry of <a href=\"/wiki/Hildesheim\" title=\"Hildesheim\">Hildesheim</a> (<a href=\"/wiki/Germany\" title=\"Germany\">Germany</a>) profess themselves to the Lutheran teachings. As a pledge owner, the city <a href=\"/wiki/Hildesheim\" title=\"Hildesheim\">Hildesheim</a> provides for the execution of the Reformation in the city and office of <a href=\"/wiki/Peine\" title=\"Peine\">Peine</a>. The priests from the localities of Clauen, <a href=\"/wiki/Hohenhameln\" title=\"Hohenhameln\">Hohenhameln</a>, <a href=\"/wiki/So%C3%9Fmar\" title=\"So\u00dfmar\">Sossmar</a>, Schmedenstedt, <a href=\"/wiki/Lengede\" title=\"Lengede\">Lengede</a> and <a href=\"/wiki/Rosenthal\" title=\"Rosenthal\" class=\"dab-link\">Rosenthal</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=1542&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup> resume their offices in the sense of the <a href=\"/wiki/Protestant_Reformation\" title=\"Protestant Reformation\">Reformation</a>.\n</li>", "title": "Rosenthal"}, {"images": [], "page_title": "109th (Aberdeenshire) Regiment of Foot", "options": [{"text": "James Abercromby, 1st Baron Dunfermline (1776\u20131858), British politician", "dab_title": "James Abercromby", "title": "James Abercromby, 1st Baron Dunfermline"}, {"text": "James Abercrombie (British Army colonel) (1732\u20131775), British colonel, possibly a relation of the general", "dab_title": "James Abercromby", "title": "James Abercrombie (British Army colonel)"}, {"text": "Jim Abercrombie, Australian rugby league footballer", "dab_title": "James Abercromby", "title": "Jim Abercrombie"}, {"text": "Sir James Abercrombie, 1st Baronet (died 1724)", "dab_title": "James Abercromby", "title": "Sir James Abercrombie, 1st Baronet"}, {"text": "James Abercrombie (British Army general) (1706\u20131781), British general, also spelled Abercromby", "dab_title": "James Abercromby", "title": "James Abercrombie (British Army general)"}, {"text": "James Abercrombie (Congressman) (1795\u20131861), a U.S. Representative from Alabama", "dab_title": "James Abercromby", "title": "James Abercrombie (Congressman)"}, {"text": "Sir James Abercromby, 2nd Baronet (c. 1670\u20131734), Scottish MP for Banffshire", "dab_title": "James Abercromby", "title": "Sir James Abercromby, 2nd Baronet"}], "context": "<p class=\"dab-context\">The Regiment, having formed marched to <a href=\"/wiki/Dundee\" title=\"Dundee\">Dundee</a> at the end of September thence via <a href=\"/wiki/Burntisland\" title=\"Burntisland\">Burntisland</a>, <a href=\"/wiki/Fife\" title=\"Fife\">Fife</a> to <a href=\"/wiki/Southampton\" title=\"Southampton\">Southampton</a>, <a href=\"/wiki/England\" title=\"England\">England</a> in late October. Upon arriving in Southampton the 109th embarked for the <a href=\"/wiki/Bailiwick_of_Jersey\" title=\"Bailiwick of Jersey\" class=\"mw-redirect\">Bailiwick of Jersey</a> for eight months and in 1795 joined General <a href=\"/wiki/James_Abercrombie\" title=\"James Abercrombie\" class=\"dab-link mw-redirect\">Abercrombie</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=109th_(Aberdeenshire)_Regiment_of_Foot&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup>'s force bound for the <a href=\"/wiki/West_Indies\" title=\"West Indies\" class=\"mw-redirect\">West Indies</a>. Before the move could be completed Colonel Hay received notification that his regiment was to be disbanded and amalgamated with the <a href=\"/wiki/53rd_Regiment_of_Foot\" title=\"53rd Regiment of Foot\" class=\"mw-redirect\">53rd Regiment of Foot</a>. As was traditional at that time (and still is with similar circumstance of the British Army) there was much complaint and politicking, however whatever the circumstance of the infighting amongst Aberdeenshire gentry, <a href=\"/wiki/William_Lamond_Allardyce\" title=\"William Lamond Allardyce\" class=\"mw-redirect\">Allardyce</a> of Dunottar (Aberdeenshire) in the <a href=\"/wiki/House_of_Commons_of_Great_Britain\" title=\"House of Commons of Great Britain\">House of Commons of Great Britain</a> declared that Aberdeenshire had no complaint with the amalgamation and this seemed to win the day over the support for the 109th by General Macleod. On 12 September 1795 eighteen officers together with the muster of the 109th transferred to the 53rd Regiment ending the 109th Aberdeenshire Regiment of Foot.\n</p>", "title": "James Abercrombie"}, {"images": [], "page_title": "109th Regiment of Foot (1761)", "options": [{"text": "Royston, Glasgow, a district of Glasgow, Scotland", "dab_title": "Royston", "title": "Royston, Glasgow"}, {"text": "Royston, South Yorkshire, England, a suburban village", "dab_title": "Royston", "title": "Royston, South Yorkshire"}, {"text": "Royston, Georgia, United States, a city", "dab_title": "Royston", "title": "Royston, Georgia"}, {"text": "Robert Royston (1918\u20132008), master landscape architect", "dab_title": "Royston", "title": "Robert Royston"}, {"text": "Royston Evans (1884\u20131977), Australian cricketer and soccer player, commonly known as Mac Evans", "dab_title": "Royston", "title": "Mac Evans"}, {"text": "Royston, Texas, United States, a ghost town", "dab_title": "Royston", "title": "Royston, Texas"}, {"text": "Royston Gabe-Jones (1906\u20131965), Welsh cricketer", "dab_title": "Royston", "title": "Royston Gabe-Jones"}, {"text": "Royston, Hertfordshire, England, a town and civil parish", "dab_title": "Royston", "title": "Royston, Hertfordshire"}, {"text": "Royston Drenthe (born 1987), Dutch football player currently playing for Everton", "dab_title": "Royston", "title": "Royston Drenthe"}, {"text": "Royston Town F.C., an English football club in Hertfordshire", "dab_title": "Royston", "title": "Royston Town F.C."}, {"text": "Richard Royston (1601-1686), English bookseller and publisher", "dab_title": "Royston", "title": "Richard Royston"}, {"text": "Royston Vasey, real name of English comedian Roy 'Chubby' Brown", "dab_title": "Royston", "title": "Roy 'Chubby' Brown"}, {"text": "Royston Tan (born 1976), Singaporean film-maker", "dab_title": "Royston", "title": "Royston Tan"}, {"text": "Royston Crow, another name of the Hooded Crow", "dab_title": "Royston", "title": "Hooded Crow"}, {"text": "Royston, British Columbia, Canada, a small hamlet", "dab_title": "Royston", "title": "Royston, British Columbia"}, {"text": "Shad Royston (born 1982), Australian rugby league player", "dab_title": "Royston", "title": "Shad Royston"}, {"text": "Royston Ellis (born 1941), English writer", "dab_title": "Royston", "title": "Royston Ellis"}], "context": "<p class=\"dab-context\">The 109th Regiment (Battalion of London Volunteers) was raised in the counties of <a href=\"/wiki/Hertfordshire\" title=\"Hertfordshire\">Hertfordshire</a> and <a href=\"/wiki/Middlesex\" title=\"Middlesex\">Middlesex</a>, England with Major Commandant <a href=\"/wiki/John_Nairne\" title=\"John Nairne\">John Nairne</a> as C.O. Establishment from December 1761 was 280 men in four companies. The Regiment was stationed at <a href=\"/wiki/Harrow,_London\" title=\"Harrow, London\">Harrow</a>, <a href=\"/wiki/Middlesex\" title=\"Middlesex\">Middlesex</a>, then <a href=\"/wiki/Royston\" title=\"Royston\" class=\"dab-link\">Royston</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=109th_Regiment_of_Foot_(1761)&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup> and <a href=\"/wiki/Wisbech\" title=\"Wisbech\">Wisbech</a> until being sent to <a href=\"/wiki/Aylesbury\" title=\"Aylesbury\">Aylesbury</a> in <a href=\"/wiki/Buckinghamshire\" title=\"Buckinghamshire\">Buckinghamshire</a> during March 1762. In 1762 'Pountenay's Independent Company' was added as a fifth company to the Regiment to be followed by the 'Independent Company of London Volunteers, although in the strictest sense this company never served with the 109th as it was used exclusively to guard French prisoners captured during the <a href=\"/wiki/Seven_Years%27_War\" title=\"Seven Years' War\">Seven Years' War</a>, at a camp in <a href=\"/wiki/Bristol\" title=\"Bristol\">Bristol</a>.\n</p>", "title": "Royston"}, {"images": [], "page_title": "1000 Ways to Die (season 1)", "options": [{"text": "Colorado", "dab_title": "Ohio", "title": "Colorado River"}, {"text": "Gun politics", "dab_title": "Ohio", "title": "Gun politics in the United States"}, {"text": "New Jersey", "dab_title": "Ohio", "title": "New Jersey"}, {"text": "Wake Island", "dab_title": "Ohio", "title": "Wake Island"}, {"text": "Dollar", "dab_title": "Ohio", "title": "United States dollar"}, {"text": "Huron", "dab_title": "Ohio", "title": "Huron County, Ohio"}, {"text": "Racism", "dab_title": "Ohio", "title": "Racism in the United States"}, {"text": "Washington Court House", "dab_title": "Ohio", "title": "Washington Court House, Ohio"}, {"text": "North Dakota", "dab_title": "Ohio", "title": "North Dakota"}, {"text": "Portsmouth Spartans (NFL) (1930\u20131933)", "dab_title": "Ohio", "title": "Portsmouth Spartans"}, {"text": "War on Terror (War in Afghanistan, Iraq War)", "dab_title": "Ohio", "title": "War on Terror"}, {"text": "Akron Pros (NFL) (1920\u20131925)", "dab_title": "Ohio", "title": "Akron Pros"}, {"text": "Holmes", "dab_title": "Ohio", "title": "Holmes County, Ohio"}, {"text": "^ Riskind, Jonathan (December 24, 2008). \"Ohio likely to lose 2 seats in Congress in 2012\". Columbus Dispatch. http://www.dispatchpolitics.com/live/content/national_world/stories/2008/12/24/ohcong.ART_ART_12-24-08_A6_0ACB253.html?sid=101. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "District courts", "dab_title": "Ohio", "title": "United States district court"}, {"text": "Cleveland State University, Cleveland, Ohio", "dab_title": "Ohio", "title": "Cleveland State University"}, {"text": "Theater", "dab_title": "Ohio", "title": "Theater of the United States"}, {"text": "Category", "dab_title": "Ohio", "title": "Category:United States"}, {"text": "Pickaway", "dab_title": "Ohio", "title": "Pickaway County, Ohio"}, {"text": "^ \"Best High Schools: State by State Statistics\", U.S. News and World Report. Retrieved December 2, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Ohio Sunshine Wiki", "dab_title": "Ohio", "title": null}, {"text": "Household income", "dab_title": "Ohio", "title": "Household income in the United States"}, {"text": "Paulding", "dab_title": "Ohio", "title": "Paulding County, Ohio"}, {"text": "Texas", "dab_title": "Ohio", "title": "Texas"}, {"text": "Taxation", "dab_title": "Ohio", "title": "Taxation in the United States"}, {"text": "^ Cayton (2002), p. 3.", "dab_title": "Ohio", "title": null}, {"text": "Health care reform", "dab_title": "Ohio", "title": "Health care reform in the United States"}, {"text": "Pre-Columbian era", "dab_title": "Ohio", "title": "Pre-Columbian era"}, {"text": "Insurance", "dab_title": "Ohio", "title": "Insurance in the United States"}, {"text": "List of Ohio state highways", "dab_title": "Ohio", "title": "List of Ohio state highways"}, {"text": "Federal courts", "dab_title": "Ohio", "title": "United States federal courts"}, {"text": "^ \n\"All-Time Temperature Minimums By State (2003)\" (PDF). National Climatic Data Center. http://www.ncdc.noaa.gov/oa/pub/data/special/mintemps.pdf. Retrieved November 7, 2006.", "dab_title": "Ohio", "title": null}, {"text": "Timeline of modern American conservatism", "dab_title": "Ohio", "title": "Timeline of modern American conservatism"}, {"text": "Butler", "dab_title": "Ohio", "title": "Butler County, Ohio"}, {"text": "^ \"The Official Site of the Cincinnati Reds\". Major League Baseball. http://cincinnati.reds.mlb.com/index.jsp?c_id=cin. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "e", "dab_title": "Ohio", "title": null}, {"text": "Federal Bureau of Investigation", "dab_title": "Ohio", "title": "Federal Bureau of Investigation"}, {"text": "^ Roseboom and Weisenburger (1967), p. 188.", "dab_title": "Ohio", "title": null}, {"text": "Literature", "dab_title": "Ohio", "title": "American literature"}, {"text": "Richland", "dab_title": "Ohio", "title": "Richland County, Ohio"}, {"text": "^ \"Fortune 500 2008\".  . May 5, 2008. http://money.cnn.com/magazines/fortune/fortune500/2008/states/OH.html. Retrieved 2009-03-31.", "dab_title": "Ohio", "title": null}, {"text": "Mansfield", "dab_title": "Ohio", "title": "Mansfield-Bucyrus, OH Combined Statistical Area"}, {"text": "Professional and working class conflict", "dab_title": "Ohio", "title": "Professional and working class conflict in the United States"}, {"text": "West Virginia", "dab_title": "Ohio", "title": "West Virginia"}, {"text": "Education", "dab_title": "Ohio", "title": "Ohio"}, {"text": "Southern", "dab_title": "Ohio", "title": "Southern United States"}, {"text": "^ a b \"City of Columbus: Fun Facts\". City of Columbus, Ohio. 2006. http://home.columbus.gov/GenInfo/index.asp. Retrieved 2009-03-26.", "dab_title": "Ohio", "title": null}, {"text": "Human rights", "dab_title": "Ohio", "title": "Human rights in the United States"}, {"text": "Celina", "dab_title": "Ohio", "title": "Celina, Ohio"}, {"text": "Civil service", "dab_title": "Ohio", "title": "United States civil service"}, {"text": "Kent State University, Kent, Ohio", "dab_title": "Ohio", "title": "Kent State University"}, {"text": "Elections\n Electoral College", "dab_title": "Ohio", "title": "Elections in the United States"}, {"text": "English (10.1%);", "dab_title": "Ohio", "title": "English American"}, {"text": "^ \"Constitution Online\". Ohio General Assembly. http://www.legislature.state.oh.us/constitution.cfm?Part=2&Section=01. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "^ \"January 1986 Northeastern Ohio Earthquake\". The Ohio Seismic Network (Ohio Department of Natural Resources). Retrieved 2009-09-13.", "dab_title": "Ohio", "title": null}, {"text": "Toledo", "dab_title": "Ohio", "title": "Toledo Metropolitan Area"}, {"text": "Dept. of Commerce\n NOAA Corps", "dab_title": "Ohio", "title": "United States Department of Commerce"}, {"text": "State bird: Cardinal (1933)[132]", "dab_title": "Ohio", "title": "Northern Cardinal"}, {"text": "^ a b \"NFL Teams\". National Football League. http://www.nfl.com/teams. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "Wyandot", "dab_title": "Ohio", "title": "Wyandot County, Ohio"}, {"text": "Index of Ohio-related articles", "dab_title": "Ohio", "title": "Index of Ohio-related articles"}, {"text": "Dept. of Defense\n Air Force\n Army\n Marine Corps\n Navy\n National Guard", "dab_title": "Ohio", "title": "United States Department of Defense"}, {"text": "^ \"Best Colleges 2010\", U.S. News and World Report. Retrieved December 2, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Euclid", "dab_title": "Ohio", "title": "Euclid, Ohio"}, {"text": "Family structure", "dab_title": "Ohio", "title": "Family structure in the United States"}, {"text": "Florida", "dab_title": "Ohio", "title": "Florida"}, {"text": "Shelby", "dab_title": "Ohio", "title": "Shelby County, Ohio"}, {"text": "^ Kissell, Margo R. (March 24, 2009). \"Englewood Man Wins $250,000 in Lottery\". Englewood, O.H.: Dayton Daily News. http://www.daytondailynews.com/n/content/oh/story/news/local/2009/03/24/ddn032409lotteryweb.html. Retrieved 2009-03-31.", "dab_title": "Ohio", "title": null}, {"text": "Cinema", "dab_title": "Ohio", "title": "Cinema of the United States"}, {"text": "Marion (home of Marion Popcorn Festival)", "dab_title": "Ohio", "title": "Marion, Ohio"}, {"text": "Northern Mariana Islands", "dab_title": "Ohio", "title": "Northern Mariana Islands"}, {"text": "1.3% mixed race", "dab_title": "Ohio", "title": "Multiracial"}, {"text": "Don Plusquellic (D) (Akron)", "dab_title": "Ohio", "title": "Don Plusquellic"}, {"text": "Territory", "dab_title": "Ohio", "title": "United States territory"}, {"text": "Marion", "dab_title": "Ohio", "title": "Marion County, Ohio"}, {"text": "^ Historic Earthquakes: Western Ohio, U.S. Geological Survey.", "dab_title": "Ohio", "title": null}, {"text": "Immigration", "dab_title": "Ohio", "title": "Immigration to the United States"}, {"text": "New Philadelphia-Dover", "dab_title": "Ohio", "title": "New Philadelphia, Ohio"}, {"text": "^ \"Official USPS Abbreviations\". United States Postal Service. 1998. http://www.usps.com/ncsc/lookups/usps_abbreviations.html. Retrieved 2009-03-26.", "dab_title": "Ohio", "title": null}, {"text": "University of Toledo, Toledo, Ohio", "dab_title": "Ohio", "title": "University of Toledo"}, {"text": "Mountains\n Peaks\n Appalachian\n Rocky", "dab_title": "Ohio", "title": "List of mountains of the United States"}, {"text": "^ Ohio Seismic Network, What was the biggest earthquake in Ohio?", "dab_title": "Ohio", "title": null}, {"text": "Fulton", "dab_title": "Ohio", "title": "Fulton County, Ohio"}, {"text": "^ Akron & Summit County History:Police", "dab_title": "Ohio", "title": null}, {"text": "House of Representatives\n Speaker", "dab_title": "Ohio", "title": "United States House of Representatives"}, {"text": "^ a b c Knepper (1989), p. 13.", "dab_title": "Ohio", "title": null}, {"text": "Economic (Debt Ceiling)", "dab_title": "Ohio", "title": "Economic history of the United States"}, {"text": "Toledo", "dab_title": "Ohio", "title": "Toledo, Ohio"}, {"text": "Cleveland Rams (NFL) (1936\u20131945)", "dab_title": "Ohio", "title": "St. Louis Rams"}, {"text": "Cincinnati Royals (NBA) (1957\u20131972)", "dab_title": "Ohio", "title": "Sacramento Kings"}, {"text": "Van Wert", "dab_title": "Ohio", "title": "Van Wert County, Ohio"}, {"text": "^ \"GDP by State\". Greyhill Advisors. http://greyhill.com/gdp-by-state. Retrieved September 15, 2011.", "dab_title": "Ohio", "title": null}, {"text": "California", "dab_title": "Ohio", "title": "California"}, {"text": "^ a b Elevation adjusted to North American Vertical Datum of 1988.", "dab_title": "Ohio", "title": null}, {"text": "American English", "dab_title": "Ohio", "title": "American English"}, {"text": "State stone: Ohio Flint (1965)[132]", "dab_title": "Ohio", "title": "Flint"}, {"text": "Union", "dab_title": "Ohio", "title": "Union County, Ohio"}, {"text": "Northwest Ohio", "dab_title": "Ohio", "title": "Northwest Ohio"}, {"text": "Wall Street", "dab_title": "Ohio", "title": "Wall Street"}, {"text": "Cincinnati (home of University of Cincinnati, Xavier University, Cincinnati Museum Center, Cincinnati Symphony Orchestra, Procter & Gamble, Kroger, Macy's Inc., Chiquita Brands International, and Fifth Third Bank)", "dab_title": "Ohio", "title": "Cincinnati"}, {"text": "Energy policy", "dab_title": "Ohio", "title": "Energy policy of the United States"}, {"text": "Jarvis Island", "dab_title": "Ohio", "title": "Jarvis Island"}, {"text": "11.8% Black (non-Hispanic);", "dab_title": "Ohio", "title": "Black (people)"}, {"text": "Gary Leitzell (I) (Dayton)", "dab_title": "Ohio", "title": "Gary Leitzell"}, {"text": "Rio Grande", "dab_title": "Ohio", "title": "Rio Grande"}, {"text": "Lucas", "dab_title": "Ohio", "title": "Lucas County, Ohio"}, {"text": "Illegal Immigration", "dab_title": "Ohio", "title": "Illegal immigration to the United States"}, {"text": "Sidney", "dab_title": "Ohio", "title": "Sidney, Ohio"}, {"text": "^ Davidson, William M. (1902). A History of the United States. Chicago, IL: Scott, Foresman and Company. p.\u00a0265. ISBN\u00a01-4297-5239-4. http://books.google.com/?id=G24AAAAAYAAJ&pg=PA265&lpg=PA265&dq=ohio+admitted+to+the+union.", "dab_title": "Ohio", "title": null}, {"text": "The Ohio State University College of Medicine and Public Health", "dab_title": "Ohio", "title": "OSU College of Medicine and Public Health"}, {"text": "Coast Guard", "dab_title": "Ohio", "title": "United States Coast Guard"}, {"text": "Hamilton", "dab_title": "Ohio", "title": "Hamilton County, Ohio"}, {"text": "Capital punishment", "dab_title": "Ohio", "title": "Capital punishment in the United States"}, {"text": "Lake Erie", "dab_title": "Ohio", "title": "Lake Erie"}, {"text": "Vice President", "dab_title": "Ohio", "title": "Vice President of the United States"}, {"text": "Missouri", "dab_title": "Ohio", "title": "Missouri"}, {"text": "Federal Reporter", "dab_title": "Ohio", "title": "Federal Reporter"}, {"text": "Columbus", "dab_title": "Ohio", "title": "Columbus, Ohio metropolitan area"}, {"text": "Rhode Island", "dab_title": "Ohio", "title": "Rhode Island"}, {"text": "Mithun, Marianne (1999). Languages of Native North America. Cambridge, UK: Cambridge University Press.", "dab_title": "Ohio", "title": "Cambridge University Press"}, {"text": "^ Holli (1999), p. 162.", "dab_title": "Ohio", "title": null}, {"text": "List of National Register of Historic Places in Ohio", "dab_title": "Ohio", "title": "National Register of Historic Places listings in Ohio"}, {"text": "^ \"Columbus Chamber Announces Ohio Ranked on 'Top 10 Business Climates' List for 2009\", Earth Times. Retrieved November 19, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Holli, Melvin G. (1999). The American Mayor. State College, PA: Pennsylvania State University Press. ISBN 0-271-01876-3", "dab_title": "Ohio", "title": "Pennsylvania State University"}, {"text": "Public holidays", "dab_title": "Ohio", "title": "Public holidays in the United States"}, {"text": "^ \"Democrats Jennifer Brunner, Lee Fisher to run for U.S. Senate\". Associated Press. February 17, 2009. http://www.cantonrep.com/archive/x1802686467/Democrats-Jennifer-Brunner-Lee-Fisher-to-run-for-U-S-Senate. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "Territorial acquisitions", "dab_title": "Ohio", "title": "United States territorial acquisitions"}, {"text": "Allegheny Plateau", "dab_title": "Ohio", "title": "Allegheny Plateau"}, {"text": "Public debt", "dab_title": "Ohio", "title": "United States public debt"}, {"text": "Television", "dab_title": "Ohio", "title": "Television in the United States"}, {"text": "Ashtabula", "dab_title": "Ohio", "title": "Ashtabula, Ohio"}, {"text": "Palmyra Atoll", "dab_title": "Ohio", "title": "Palmyra Atoll"}, {"text": "New York", "dab_title": "Ohio", "title": "New York"}, {"text": "Communications", "dab_title": "Ohio", "title": "Communications in the United States"}, {"text": "Jefferson", "dab_title": "Ohio", "title": "Jefferson County, Ohio"}, {"text": "LGBT rights\n Same-sex marriage", "dab_title": "Ohio", "title": "LGBT rights in the United States"}, {"text": "Tiffin (home of Heidelberg College and Tiffin University)", "dab_title": "Ohio", "title": "Tiffin, Ohio"}, {"text": "^ Ohio v. Kentucky, 444 U.S. 335 (1980)", "dab_title": "Ohio", "title": null}, {"text": "Findlay-Tiffin", "dab_title": "Ohio", "title": "Findlay-Tiffin, OH Combined Statistical Area"}, {"text": "Public Library of Cincinnati and Hamilton County (Tenth)", "dab_title": "Ohio", "title": "Public Library of Cincinnati and Hamilton County"}, {"text": "Defense Intelligence Agency", "dab_title": "Ohio", "title": "Defense Intelligence Agency"}, {"text": "Clark", "dab_title": "Ohio", "title": "Clark County, Ohio"}, {"text": "Highland", "dab_title": "Ohio", "title": "Highland County, Ohio"}, {"text": "^ \"President / Vice President: November 4, 2008\" (ASPX). Ohio Secretary of State. November 4, 2008. http://www.sos.state.oh.us/SOS/elections/electResultsMain/2008ElectionResults/pres110408.aspx. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "^ \"Rep. Marcy Kaptur (D-OH) Urges Homeowners to Stay in Foreclosed Homes\". Democracy Now. February 3, 2009. http://i1.democracynow.org/2009/2/3/rep_marcy_kaptur_d_oh_urges. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "^ \"Ohio's State Motto\". Ohio Historical Society. July 1, 2005. http://www.ohiohistorycentral.org/entry.php?rec=1885. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "^ a b \"2000 Population and Geographic Centers of Ohio\" (PDF). Ohio Department of Development, Office of Strategic Research. 2001-03. http://www.odod.state.oh.us/research/FILES/G101.pdf. Retrieved 2009-03-26.", "dab_title": "Ohio", "title": null}, {"text": "Military", "dab_title": "Ohio", "title": "Military history of the United States"}, {"text": "State tree: Buckeye (1953)[132]", "dab_title": "Ohio", "title": "Ohio Buckeye"}, {"text": "Radio", "dab_title": "Ohio", "title": "Radio in the United States"}, {"text": "Coshocton", "dab_title": "Ohio", "title": "Coshocton County, Ohio"}, {"text": "The Ohio State University, Columbus, Ohio", "dab_title": "Ohio", "title": "The Ohio State University"}, {"text": "^ a b c d e f g h i j \"Economic Overview\" (PDF). Ohio Department of Development. 2009-02. http://www.odod.state.oh.us/research/FILES/E000.pdf. Retrieved 2009-03-31.", "dab_title": "Ohio", "title": null}, {"text": "Ohio State Facts", "dab_title": "Ohio", "title": null}, {"text": "Homelessness", "dab_title": "Ohio", "title": "Homelessness in the United States"}, {"text": "South Dakota", "dab_title": "Ohio", "title": "South Dakota"}, {"text": "Geography", "dab_title": "Ohio", "title": "Ohio"}, {"text": "National Park System", "dab_title": "Ohio", "title": "List of areas in the United States National Park System"}, {"text": "People", "dab_title": "Ohio", "title": "People of the United States"}, {"text": "Youngstown (home of Youngstown State University and Butler Institute of American Art).", "dab_title": "Ohio", "title": "Youngstown, Ohio"}, {"text": "Belmont", "dab_title": "Ohio", "title": "Belmont County, Ohio"}, {"text": "t", "dab_title": "Ohio", "title": "Template talk:United States topics"}, {"text": "The University of Akron, Akron, Ohio", "dab_title": "Ohio", "title": "University of Akron"}, {"text": "Georgia", "dab_title": "Ohio", "title": "Georgia (U.S. state)"}, {"text": "Clinton", "dab_title": "Ohio", "title": "Clinton County, Ohio"}, {"text": "Same-sex marriage", "dab_title": "Ohio", "title": "Same-sex marriage in the United States"}, {"text": "Wilmington (home of Wilmington College)", "dab_title": "Ohio", "title": "Wilmington, Ohio"}, {"text": "^ \"The Supreme Court of Ohio Jurisdiction & Authority\". The Ohio Judicial System. http://www.supremecourt.ohio.gov/SCO/jurisdiction/default.asp. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Central State University, Wilberforce, Ohio", "dab_title": "Ohio", "title": "Central State University"}, {"text": "Cities, towns, and villages", "dab_title": "Ohio", "title": "List of lists of settlements in the United States"}, {"text": "Champaign", "dab_title": "Ohio", "title": "Champaign County, Ohio"}, {"text": "^ \"Senators of the 111th Congress\". United States Senate. http://www.senate.gov/general/contact_information/senators_cfm.cfm?State=OH. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "v", "dab_title": "Ohio", "title": "Template:United States political divisions"}, {"text": "United States Reports", "dab_title": "Ohio", "title": "United States Reports"}, {"text": "Cincinnati", "dab_title": "Ohio", "title": "Cincinnati"}, {"text": "^ \"Site Selection Rankings\". Greyhill Advisors. http://greyhill.com/site-selection-rankings/. Retrieved October 17, 2011.", "dab_title": "Ohio", "title": null}, {"text": "Postal", "dab_title": "Ohio", "title": "Postage stamps and postal history of the United States"}, {"text": "Canton", "dab_title": "Ohio", "title": "Canton, Ohio"}, {"text": "Cleveland Rebels (BAA) (1946\u20131947)", "dab_title": "Ohio", "title": "Cleveland Rebels"}, {"text": "Preble", "dab_title": "Ohio", "title": "Preble County, Ohio"}, {"text": "Marine Corps", "dab_title": "Ohio", "title": "United States Marine Corps"}, {"text": "^ \"Strickland: Mature leader needed, rival Kasich is too radical\", Dayton Daily News. 22 june 2010. Retrieved 25 june 2010.", "dab_title": "Ohio", "title": null}, {"text": "USGS real-time, geographic, and other scientific resources of Ohio", "dab_title": "Ohio", "title": null}, {"text": "Federal Reserve System", "dab_title": "Ohio", "title": "Federal Reserve System"}, {"text": "Personal income", "dab_title": "Ohio", "title": "Personal income in the United States"}, {"text": "Akron", "dab_title": "Ohio", "title": "Akron, Ohio"}, {"text": "Virginia", "dab_title": "Ohio", "title": "Virginia"}, {"text": "Law enforcement", "dab_title": "Ohio", "title": "Federal law enforcement in the United States"}, {"text": "New England", "dab_title": "Ohio", "title": "New England"}, {"text": "Extreme Northwest Ohio", "dab_title": "Ohio", "title": "Extreme Northwest Ohio"}, {"text": "Colonial era (Thirteen Colonies, Colonial American military history)", "dab_title": "Ohio", "title": "Colonial history of the United States"}, {"text": "University of Cincinnati, Cincinnati, Ohio", "dab_title": "Ohio", "title": "University of Cincinnati"}, {"text": "Hawaii", "dab_title": "Ohio", "title": "Hawaii"}, {"text": "Darke", "dab_title": "Ohio", "title": "Darke County, Ohio"}, {"text": "^ \"Ohio District Courts of Appeal\". Ohio Judiciary System. http://www.supremecourt.ohio.gov/JudSystem/districtCourts/. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Book", "dab_title": "Ohio", "title": "Book:The United States"}, {"text": "^ \"Ohio Selected Social Characteristics in the United States: 2007\". United States Census Bureau. 2007. http://factfinder.census.gov/servlet/ADPTable?_bm=y&-geo_id=04000US39&-qr_name=ACS_2007_1YR_G00_DP2&-context=adp&-ds_name=ACS_2007_1YR_G00_&-tree_id=306&-_lang=en&-redoLog=false&-format=. Retrieved 2009-03-26.", "dab_title": "Ohio", "title": null}, {"text": "Dept. of Homeland Security\n Coast Guard", "dab_title": "Ohio", "title": "United States Department of Homeland Security"}, {"text": "Brown", "dab_title": "Ohio", "title": "Brown County, Ohio"}, {"text": "Terrorism", "dab_title": "Ohio", "title": "Terrorism in the United States"}, {"text": "t", "dab_title": "Ohio", "title": "Template talk:Ohio cities and mayors of 100,000 population"}, {"text": "Courts of appeal", "dab_title": "Ohio", "title": "United States courts of appeals"}, {"text": "^ Cayton (2002), pp. 128\u2013129.", "dab_title": "Ohio", "title": null}, {"text": "^ a b Stockwell, Mary (2006). \"ohio\"+\"march+17+1803\"#PPA88,M1 The Ohio Adventure. Layton, UT: Gibbs Smith. p.\u00a088. ISBN\u00a01-58685-361-9. http://books.google.com/?id=VJKroULBUpgC&printsec=copyright&dq=\"ohio\"+\"march+17+1803\"#PPA88,M1.", "dab_title": "Ohio", "title": null}, {"text": "Demographics", "dab_title": "Ohio", "title": "Demographics of the United States"}, {"text": "Scioto", "dab_title": "Ohio", "title": "Scioto County, Ohio"}, {"text": "^ \"Ohio Quick Facts\". Ohio Historical Society. http://www.ohiohistorycentral.org/ohio_quick_facts.php. Retrieved 2009-03-26.", "dab_title": "Ohio", "title": null}, {"text": "Navy", "dab_title": "Ohio", "title": "United States Navy"}, {"text": "^ \"Constitution Online\". Ohio General Assembly. http://www.legislature.state.oh.us/constitution.cfm?Part=4&Section=01. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Glacial till plains", "dab_title": "Ohio", "title": "Glacial till plains (Ohio)"}, {"text": "Architecture", "dab_title": "Ohio", "title": "Architecture of the United States"}, {"text": "Western Reserve", "dab_title": "Ohio", "title": "Connecticut Western Reserve"}, {"text": "Western", "dab_title": "Ohio", "title": "Western United States"}, {"text": "Meigs", "dab_title": "Ohio", "title": "Meigs County, Ohio"}, {"text": "Defiance (home of Defiance College)", "dab_title": "Ohio", "title": "Defiance, Ohio"}, {"text": "^ \"Ohio Coastal Counties\", Ohio Department of Natural Resources. Retrieved September 3, 2008.", "dab_title": "Ohio", "title": null}, {"text": "^ \"The Best States for Business\", Directorship. Retrieved December 2, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Public Health Service Corps", "dab_title": "Ohio", "title": "United States Public Health Service Commissioned Corps"}, {"text": "Fayette", "dab_title": "Ohio", "title": "Fayette County, Ohio"}, {"text": "Portal", "dab_title": "Ohio", "title": "Portal:United States"}, {"text": "Obesity", "dab_title": "Ohio", "title": "Obesity in the United States"}, {"text": "^ \"American FactFinder2 Custom Tables:Table 1\". http://2010.census.gov/news/releases/operations/cb11-cn72.html. Retrieved 2010-03-20.", "dab_title": "Ohio", "title": null}, {"text": "Foreign relations", "dab_title": "Ohio", "title": "Foreign relations of the United States"}, {"text": "Adams", "dab_title": "Ohio", "title": "Adams County, Ohio"}, {"text": "^ Historic Earthquakes: Near Portsmouth, Ohio, U.S. Geological Survey.", "dab_title": "Ohio", "title": null}, {"text": "^ \"Lake County Captains\". Minor League Baseball. http://lakecounty.captains.milb.com/index.jsp?sid=t437. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "Warren", "dab_title": "Ohio", "title": "Warren County, Ohio"}, {"text": "Discoveries", "dab_title": "Ohio", "title": "Timeline of United States discoveries"}, {"text": "^ \"Government\". Congressman Michael Turner. http://turner.house.gov/District/Government.htm. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "World War I", "dab_title": "Ohio", "title": "History of the United States (1865\u20131918)"}, {"text": "^ Hershey, William (November 8, 2006). \"Strickland becomes first Dem governor since '91\". Middletown Journal. http://www.middletownjournal.com/hp/content/oh/story/news/local/2006/11/08/ddn110806gov.html. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Incarceration", "dab_title": "Ohio", "title": "Incarceration in the United States"}, {"text": "Trumbull", "dab_title": "Ohio", "title": "Trumbull County, Ohio"}, {"text": "^ \"About Lee\". Office of the Governor. 2009. http://www.governor.ohio.gov/AboutUs/AboutLee/tabid/57/Default.aspx. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "^ \"Transportation delivers for Ohio\", Ohio Department of Transportation. Retrieved December 22, 2005.", "dab_title": "Ohio", "title": null}, {"text": "^ a b c \"Constitution Online\". Ohio General Assembly. http://www.legislature.state.oh.us/constitution.cfm?Part=4&Section=04. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Cincinnati", "dab_title": "Ohio", "title": "Cincinnati/Northern Kentucky metropolitan area"}, {"text": "Dayton (home of University of Dayton, Dayton Ballet, Wright State University, Premier Health Partners, and National Museum of the United States Air Force)", "dab_title": "Ohio", "title": "Dayton, Ohio"}, {"text": "Bajo Nuevo Bank", "dab_title": "Ohio", "title": "Bajo Nuevo Bank"}, {"text": "Italian (6.4%).", "dab_title": "Ohio", "title": "Italian American"}, {"text": "Constitution\n Federalism\n Preemption\n Separation of powers", "dab_title": "Ohio", "title": "United States Constitution"}, {"text": "Missouri", "dab_title": "Ohio", "title": "Missouri River"}, {"text": "Mahoning", "dab_title": "Ohio", "title": "Mahoning County, Ohio"}, {"text": "^ \"History of the Appalachian Regional Commission\", Appalachian Regional Commission. Retrieved January 3, 2006.", "dab_title": "Ohio", "title": null}, {"text": "6 free-standing state-assisted medical schools\n University of Toledo College of Medicine (formerly Medical University of Ohio)\n Northeastern Ohio Universities College of Medicine\n The Ohio State University College of Medicine and Public Health\n Ohio University College of Osteopathic Medicine\n University of Cincinnati College of Medicine\n Boonshoft School of Medicine (formerly known as The Wright State University School of Medicine)", "dab_title": "Ohio", "title": "Medical school"}, {"text": "NOAA Corps", "dab_title": "Ohio", "title": "National Oceanic and Atmospheric Administration Commissioned Corps"}, {"text": "Illinois", "dab_title": "Ohio", "title": "Illinois"}, {"text": "Greene", "dab_title": "Ohio", "title": "Greene County, Ohio"}, {"text": "^ Leip, David. \"Presidential General Election Results Comparison \u2013 Ohio\". US Election Atlas. http://uselectionatlas.org/RESULTS/compare.php?year=2008&fips=39&f=1&off=0&elect=0&type=state. Retrieved December 31, 2009.", "dab_title": "Ohio", "title": null}, {"text": "American Dream", "dab_title": "Ohio", "title": "American Dream"}, {"text": "^ \"American FactFinder2\". http://factfinder2.census.gov/faces/nav/jsf/pages/index.xhtml. Retrieved 2010-03-20.", "dab_title": "Ohio", "title": null}, {"text": "^ \"NBA.com Team Index\". National Basketball Association. http://www.nba.com/teams/index.html. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "Democratic Party", "dab_title": "Ohio", "title": "Democratic Party (United States)"}, {"text": "State insect: Ladybug (1975)[132]", "dab_title": "Ohio", "title": "Ladybug"}, {"text": "^ a b c d e f g h i j k \"Ohio's State Symbols\". Ohio Governor's Residence and State Garden. http://www.governorsresidence.ohio.gov/children/symbols.aspx. Retrieved 2009-03-26.", "dab_title": "Ohio", "title": null}, {"text": "Monroe", "dab_title": "Ohio", "title": "Monroe County, Ohio"}, {"text": "Speaker", "dab_title": "Ohio", "title": "Speaker of the United States House of Representatives"}, {"text": "Columbus Metropolitan Library (First)", "dab_title": "Ohio", "title": "Columbus Metropolitan Library"}, {"text": "Civil liberties", "dab_title": "Ohio", "title": "Civil liberties in the United States"}, {"text": "Cleveland Crusaders (WHA)(1972\u20131976)", "dab_title": "Ohio", "title": "Cleveland Crusaders"}, {"text": "Mexican\u2013American War", "dab_title": "Ohio", "title": "Mexican\u2013American War"}, {"text": "Toledo (home of The University of Toledo, The Toledo Museum of Art, Owens Corning, and Owens-Illinois)", "dab_title": "Ohio", "title": "Toledo, Ohio"}, {"text": "Tourism", "dab_title": "Ohio", "title": "Tourism in the United States"}, {"text": "Steubenville (home of Franciscan University of Steubenville)", "dab_title": "Ohio", "title": "Weirton-Steubenville Metropolitan Statistical Area"}, {"text": "Midway Atoll", "dab_title": "Ohio", "title": "Midway Atoll"}, {"text": "Youngstown State University, Youngstown, Ohio", "dab_title": "Ohio", "title": "Youngstown State University"}, {"text": "Agriculture", "dab_title": "Ohio", "title": "Agriculture in the United States"}, {"text": "Lake", "dab_title": "Ohio", "title": "Lake County, Ohio"}, {"text": "Affirmative action", "dab_title": "Ohio", "title": "Affirmative action in the United States"}, {"text": "Zanesville (home of Zane State College).", "dab_title": "Ohio", "title": "Zanesville, Ohio"}, {"text": "^ \"Counties in Appalachia\", Appalachian Regional Commission. Retrieved January 3, 2006.", "dab_title": "Ohio", "title": null}, {"text": "Boonshoft School of Medicine (formerly known as The Wright State University School of Medicine)", "dab_title": "Ohio", "title": "Boonshoft School of Medicine"}, {"text": "Public policy", "dab_title": "Ohio", "title": "Public policy of the United States"}, {"text": "Indiana", "dab_title": "Ohio", "title": "Indiana"}, {"text": "Harrison", "dab_title": "Ohio", "title": "Harrison County, Ohio"}, {"text": "^ Hallett, Joe; Mark Niquette, Jonathan Riskind (November 6, 2008). \"Total-state Approach Aided Obama\". Columbus Dispatch. http://www.dispatchpolitics.com/live/content/local_news/stories/2008/11/06/copy/howwin.ART_ART_11-06-08_A1_4KBQDF8.html?adsec=politics&sid=101. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "^ Roseboom (1967), p. 20.", "dab_title": "Ohio", "title": null}, {"text": "Cleveland", "dab_title": "Ohio", "title": "Cleveland"}, {"text": "Scandals", "dab_title": "Ohio", "title": "List of federal political scandals in the United States"}, {"text": "State song: \"Beautiful Ohio\" (1969)[132]", "dab_title": "Ohio", "title": "Beautiful Ohio"}, {"text": "Noble", "dab_title": "Ohio", "title": "Noble County, Ohio"}, {"text": "Cold War", "dab_title": "Ohio", "title": "Cold War"}, {"text": "Cayton, Andrew R. L. (2002). Ohio: The History of a People. Columbus, OH: The Ohio State University Press. ISBN 0-8142-0899-1", "dab_title": "Ohio", "title": null}, {"text": "Ohio Department of Natural Resources", "dab_title": "Ohio", "title": null}, {"text": "Federalism", "dab_title": "Ohio", "title": "Federalism in the United States"}, {"text": "Affluence", "dab_title": "Ohio", "title": "Affluence in the United States"}, {"text": "Delaware", "dab_title": "Ohio", "title": "Delaware County, Ohio"}, {"text": "Baker Island", "dab_title": "Ohio", "title": "Baker Island"}, {"text": "^ According to the U.S. Census July 2007 Annual Estimate, Greater Cleveland is the largest Metropolitan Statistical Area (MSA) that is entirely within Ohio, with a population of 2,096,471; and Greater Cincinnati is the largest MSA that is at least partially within Ohio, with a a population of 2,133,678, approximately 25% of which is in Indiana or Kentucky. Which MSA is the largest in Ohio depends on the context.", "dab_title": "Ohio", "title": null}, {"text": "Appalachian", "dab_title": "Ohio", "title": "Appalachian Mountains"}, {"text": "Southwestern", "dab_title": "Ohio", "title": "Southwestern United States"}, {"text": "v", "dab_title": "Ohio", "title": "Template:United States topics"}, {"text": "List of Ohio rivers", "dab_title": "Ohio", "title": "List of Ohio rivers"}, {"text": "Dayton Triangles (NFL) (1920\u20131929)", "dab_title": "Ohio", "title": "Dayton Triangles"}, {"text": "Energy", "dab_title": "Ohio", "title": "Energy in the United States"}, {"text": "Jackson", "dab_title": "Ohio", "title": "Jackson County, Ohio"}, {"text": "Wapakoneta (birthplace of Apollo 11 astronaut Neil Armstrong)", "dab_title": "Ohio", "title": "Wapakoneta, Ohio"}, {"text": "^ \"The History of the MCD: The Conservancy Act\". Miami Conservancy District. http://www.miamiconservancy.org/about/conservancy.asp. Retrieved 2007-01-13.", "dab_title": "Ohio", "title": null}, {"text": "New Mexico", "dab_title": "Ohio", "title": "New Mexico"}, {"text": "Cleveland Blues (NL) (1879\u20131884)", "dab_title": "Ohio", "title": "Cleveland Blues (NL)"}, {"text": "Akron (home of University of Akron and Goodyear Tire and Rubber Company)", "dab_title": "Ohio", "title": "Akron, Ohio"}, {"text": "Iowa", "dab_title": "Ohio", "title": "Iowa"}, {"text": "^ Brady, Jessica (November 6, 2008). \"Democrats Gain in Michigan and Ohio\". Roll Call. http://www.rollcall.com/issues/54_54/politics/29901-1.html. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "Frank G. Jackson (D) (Cleveland)", "dab_title": "Ohio", "title": "Frank G. Jackson"}, {"text": "^ Clearing up the Confusion surrounding OHIO's Admission to Statehood", "dab_title": "Ohio", "title": null}, {"text": "Youngstown-Warren", "dab_title": "Ohio", "title": "Youngstown-Warren-Boardman, OH-PA Metropolitan Area"}, {"text": "Fashion", "dab_title": "Ohio", "title": "Fashion in the United States"}, {"text": "Auglaize", "dab_title": "Ohio", "title": "Auglaize County, Ohio"}, {"text": "Pike", "dab_title": "Ohio", "title": "Pike County, Ohio"}, {"text": "President pro tem", "dab_title": "Ohio", "title": "President pro tempore of the United States Senate"}, {"text": "^ Bls.gov; Local Area Unemployment Statistics", "dab_title": "Ohio", "title": null}, {"text": "State of Ohio wiki", "dab_title": "Ohio", "title": null}, {"text": "Inventions (before 1890, 1890\u20131945, 1946\u20131991, after 1991)", "dab_title": "Ohio", "title": "Timeline of United States inventions"}, {"text": "Senate\n Vice President\n President pro tem", "dab_title": "Ohio", "title": "United States Senate"}, {"text": "Income inequality", "dab_title": "Ohio", "title": "Income inequality in the United States"}, {"text": "Utah", "dab_title": "Ohio", "title": "Utah"}, {"text": "^ a b \"Annual Estimates of the Resident Population for the United States, Regions, States, and Puerto Rico: April 1, 2010 to July 1, 2011\" (CSV). 2011 Population Estimates. United States Census Bureau, Population Division. December 2011. http://www.census.gov/popest/data/state/totals/2011/tables/NST-EST2011-01.csv. Retrieved December 21, 2011.", "dab_title": "Ohio", "title": null}, {"text": "History", "dab_title": "Ohio", "title": "History of Ohio"}, {"text": "Elections", "dab_title": "Ohio", "title": "Elections in Ohio"}, {"text": "Mid-Atlantic", "dab_title": "Ohio", "title": "Mid-Atlantic states"}, {"text": "Athens (home of Ohio University)", "dab_title": "Ohio", "title": "Athens, Ohio"}, {"text": "Territorial evolution", "dab_title": "Ohio", "title": "Territorial evolution of the United States"}, {"text": "Bowling Green State University, Bowling Green, Ohio", "dab_title": "Ohio", "title": "Bowling Green State University"}, {"text": "^ \"Population and Population Centers by State: 2000\". United States Census Bureau. http://www.census.gov/geo/www/cenpop/statecenters.txt. Retrieved 2008-12-06.", "dab_title": "Ohio", "title": null}, {"text": "Mining", "dab_title": "Ohio", "title": "Mining in the United States"}, {"text": "^ ODNR Updates Ohio Earthquake Map to Reflect Statewide Seismic Activity Since 2002 (news release), Ohio Department of Natural Resources, Division of Geological Survey (September 18, 2007)", "dab_title": "Ohio", "title": null}, {"text": "North Carolina", "dab_title": "Ohio", "title": "North Carolina"}, {"text": "Ashtabula", "dab_title": "Ohio", "title": "Ashtabula County, Ohio"}, {"text": "Carroll", "dab_title": "Ohio", "title": "Carroll County, Ohio"}, {"text": "Kansas", "dab_title": "Ohio", "title": "Kansas"}, {"text": "^ a b Thomas J. Hennen's American Public Library Ratings for 2006", "dab_title": "Ohio", "title": null}, {"text": "Michael P. Bell (I) (Toledo)", "dab_title": "Ohio", "title": "Michael Bell (mayor)"}, {"text": "WikiProject", "dab_title": "Ohio", "title": "Wikipedia:WikiProject United States"}, {"text": "^ Cayton (2002), p. 129.", "dab_title": "Ohio", "title": null}, {"text": "American Samoa", "dab_title": "Ohio", "title": "American Samoa"}, {"text": "Columbus", "dab_title": "Ohio", "title": "Columbus, Ohio"}, {"text": "Flag", "dab_title": "Ohio", "title": "Flag of the United States"}, {"text": "Ross", "dab_title": "Ohio", "title": "Ross County, Ohio"}, {"text": "African-American Civil Rights Movement (1896\u20131954)", "dab_title": "Ohio", "title": "African-American Civil Rights Movement (1896\u20131954)"}, {"text": "^ \"Economic Overview\", Ohio Department of Development, p. 1. Retrieved November 19, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Appalachian Ohio", "dab_title": "Ohio", "title": "Appalachian Ohio"}, {"text": "Preemption", "dab_title": "Ohio", "title": "Federal preemption"}, {"text": "Standard of living", "dab_title": "Ohio", "title": "Standard of living in the United States"}, {"text": "Foreign policy", "dab_title": "Ohio", "title": "Foreign policy of the United States"}, {"text": "Wisconsin", "dab_title": "Ohio", "title": "Wisconsin"}, {"text": "Colleges and universities", "dab_title": "Ohio", "title": "List of colleges and universities in Ohio"}, {"text": "^ a b \"The Governors of Ohio\". Ohio Historical Society. January 8, 2007. http://www.ohiohistory.org/onlinedoc/ohgovernment/governors/. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Chillicothe (home of Ohio University-Chillicothe)", "dab_title": "Ohio", "title": "Chillicothe, Ohio"}, {"text": "^ \"Native Ohio\". American Indian Studies. Ohio State University. Archived from the original on February 2, 2007. http://web.archive.org/web/20070202230727/http://americanindianstudies.osu.edu/ohio.cfm. Retrieved 2007-02-25.", "dab_title": "Ohio", "title": null}, {"text": "Miami University, Oxford, Ohio", "dab_title": "Ohio", "title": "Miami University"}, {"text": "Counties", "dab_title": "Ohio", "title": "County (United States)"}, {"text": "Northeastern Ohio Universities College of Medicine", "dab_title": "Ohio", "title": "Northeastern Ohio Universities College of Medicine"}, {"text": "Erie", "dab_title": "Ohio", "title": "Erie County, Ohio"}, {"text": "^ \"Constitution Online\". Ohio General Assembly. http://www.legislature.state.oh.us/constitution.cfm?Part=3&Section=15. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "^ Magnitude 4.0 - YOUNGSTOWN-WARREN URBAN AREA, OHIO, U.S. Geological Survey. Retrieved 2011-12-31.", "dab_title": "Ohio", "title": null}, {"text": "t", "dab_title": "Ohio", "title": "Template talk:United States political divisions"}, {"text": "Red states and blue states", "dab_title": "Ohio", "title": "Red states and blue states"}, {"text": "Ashland", "dab_title": "Ohio", "title": "Ashland County, Ohio"}, {"text": "Kentucky", "dab_title": "Ohio", "title": "Kentucky"}, {"text": "Wayne", "dab_title": "Ohio", "title": "Wayne County, Ohio"}, {"text": "^ Resident Population Data. \"Resident Population Data - 2010 Census\". 2010.census.gov. http://2010.census.gov/2010census/data/apportionment-pop-text.php. Retrieved 2012-02-18.", "dab_title": "Ohio", "title": null}, {"text": "Springfield (home of Wittenberg University)", "dab_title": "Ohio", "title": "Springfield, Ohio"}, {"text": "Hamilton", "dab_title": "Ohio", "title": "Hamilton, Ohio"}, {"text": "Health care", "dab_title": "Ohio", "title": "Health care in the United States"}, {"text": "Stark", "dab_title": "Ohio", "title": "Stark County, Ohio"}, {"text": "Spanish\u2013American War", "dab_title": "Ohio", "title": "Spanish\u2013American War"}, {"text": "Bill of Rights\n Civil liberties", "dab_title": "Ohio", "title": "United States Bill of Rights"}, {"text": "^ Knepper (1989), pp. 233\u2013234.", "dab_title": "Ohio", "title": null}, {"text": "Separation of powers", "dab_title": "Ohio", "title": "Separation of powers under the United States Constitution"}, {"text": "Cuisine", "dab_title": "Ohio", "title": "American cuisine"}, {"text": "State animal: White-tailed Deer (1987)[132]", "dab_title": "Ohio", "title": "White-tailed Deer"}, {"text": "Puerto Rico", "dab_title": "Ohio", "title": "Puerto Rico"}, {"text": "^ \"Creation of the Board of Elections\". Mahoning County Board of Elections. http://www.mahoningcountyoh.gov/DepartmentsAgencies/Departments/BoardofElections/CreationofBOE/tabid/821/Default.aspx. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Connecticut", "dab_title": "Ohio", "title": "Connecticut"}, {"text": "Columbia", "dab_title": "Ohio", "title": "Columbia River"}, {"text": "Medina", "dab_title": "Ohio", "title": "Medina County, Ohio"}, {"text": "^ Mithun (1999), p. 312", "dab_title": "Ohio", "title": null}, {"text": "Wright State University, Dayton, Ohio (Fairborn, Ohio)", "dab_title": "Ohio", "title": "Wright State University"}, {"text": "Extreme points", "dab_title": "Ohio", "title": "Extreme points of the United States"}, {"text": "Gallia", "dab_title": "Ohio", "title": "Gallia County, Ohio"}, {"text": "^ a b c d e f \"Graphic: Donkey Stampede\". Columbus Dispatch. August 22, 2008. http://www.dispatchpolitics.com/live/content/local_news/stories/2008/08/22/demgraphic.html?adsec=politics&sid=101. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "^ a b c Knepper (1989), p. 10.", "dab_title": "Ohio", "title": null}, {"text": "Local governments", "dab_title": "Ohio", "title": "Local government in the United States"}, {"text": "Youngstown", "dab_title": "Ohio", "title": "Youngstown, Ohio"}, {"text": "^ \"ERS/USDA Data\". Economic Research Service, United States Department of Agriculture. December 15, 2008. http://www.ers.usda.gov/Data/Unemployment/RDList2.asp?ST=OH. Retrieved 2009-03-31.", "dab_title": "Ohio", "title": null}, {"text": "Louisiana", "dab_title": "Ohio", "title": "Louisiana"}, {"text": "^ \"The Toledo Mud Hens\". Toledo Mud Hens. http://www.mudhens.com/. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "Vinton", "dab_title": "Ohio", "title": "Vinton County, Ohio"}, {"text": "Canton (home of Pro Football Hall of Fame, Malone University, and The Timken Company)", "dab_title": "Ohio", "title": "Canton, Ohio"}, {"text": "Norwalk (home of the NHRA venue Summit Motorsports Park, headquarters of the International Hot Rod Association, and pioneer automobile company Fisher Body)", "dab_title": "Ohio", "title": "Norwalk, Ohio"}, {"text": "Reconstruction era", "dab_title": "Ohio", "title": "Reconstruction Era of the United States"}, {"text": "Imperialism", "dab_title": "Ohio", "title": "American imperialism"}, {"text": "Miami Valley", "dab_title": "Ohio", "title": "Miami Valley"}, {"text": "Transportation", "dab_title": "Ohio", "title": "Transportation in the United States"}, {"text": "Fremont", "dab_title": "Ohio", "title": "Fremont, Ohio"}, {"text": "State beverage: Tomato juice (1965)[132]", "dab_title": "Ohio", "title": "Tomato juice"}, {"text": "Lima (home of University of Northwestern Ohio)", "dab_title": "Ohio", "title": "Lima, Ohio"}, {"text": "Johnston Atoll", "dab_title": "Ohio", "title": "Johnston Atoll"}, {"text": "2.3% Hispanic, a category that includes people of many races;", "dab_title": "Ohio", "title": "Hispanic"}, {"text": "States", "dab_title": "Ohio", "title": "U.S. state"}, {"text": "Licking", "dab_title": "Ohio", "title": "Licking County, Ohio"}, {"text": "Portsmouth (home of Shawnee State University)", "dab_title": "Ohio", "title": "Portsmouth, Ohio"}, {"text": "^ Berg-Andersson, Richard E. (2000). \"The Math Behind the 2000 Census Apportionment of Representatives\". The Green Papers. http://www.thegreenpapers.com/Census00/ApportionMath.html. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "Independent agencies", "dab_title": "Ohio", "title": "Independent agencies of the United States government"}, {"text": "Hancock", "dab_title": "Ohio", "title": "Hancock County, Ohio"}, {"text": "Anti-Americanism", "dab_title": "Ohio", "title": "Anti-Americanism"}, {"text": "^ Knepper (1989), p. 14.", "dab_title": "Ohio", "title": null}, {"text": "e", "dab_title": "Ohio", "title": null}, {"text": "Third parties", "dab_title": "Ohio", "title": "Third party (United States)"}, {"text": "State rock song: \"Hang On Sloopy\" (1985)[136]", "dab_title": "Ohio", "title": "Hang On Sloopy"}, {"text": "^ \"The Official Site of the Cleveland Indians\". Major League Baseball. http://cleveland.indians.mlb.com/index.jsp?c_id=cle. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "Morris, Roy, Jr. (1992). Sheridan: The Life and Wars of General Phil Sheridan. New York: Crown Publishing. ISBN 0-517-58070-5.", "dab_title": "Ohio", "title": null}, {"text": "Morrow", "dab_title": "Ohio", "title": "Morrow County, Ohio"}, {"text": "Canton", "dab_title": "Ohio", "title": "Canton\u2013Massillon, Ohio metropolitan area"}, {"text": "^ a b c d e f \"Religious Composition of Ohio\". The Pew Forum on Religion & Public Life. 2008. http://pewforum.org/religion08/state.php?StateID=10. Retrieved 2009-03-27.\u00a0[dead link]", "dab_title": "Ohio", "title": null}, {"text": "Roseboom, Eugene H.; Weisenburger, Francis P. (1967). A History of Ohio. Columbus: The Ohio Historical Society.", "dab_title": "Ohio", "title": "Ohio Historical Society"}, {"text": "Ohio University College of Osteopathic Medicine", "dab_title": "Ohio", "title": "Ohio University"}, {"text": "Civil War", "dab_title": "Ohio", "title": "American Civil War"}, {"text": "Lakewood", "dab_title": "Ohio", "title": "Lakewood, Ohio"}, {"text": "t", "dab_title": "Ohio", "title": "Template talk:Ohio"}, {"text": "Peaks", "dab_title": "Ohio", "title": "Mountain peaks of the United States"}, {"text": "United States Code", "dab_title": "Ohio", "title": "United States Code"}, {"text": "State capital: Columbus[3] (1816)[133]", "dab_title": "Ohio", "title": "Columbus, Ohio"}, {"text": "Sandusky (home of Cedar Point, and Kalahari Resort and Convention Center)", "dab_title": "Ohio", "title": "Sandusky, Ohio"}, {"text": "Serranilla Bank", "dab_title": "Ohio", "title": "Serranilla Bank"}, {"text": "List of Ohio train stations", "dab_title": "Ohio", "title": "List of Ohio train stations"}, {"text": "^ a b \"Elevations and Distances in the United States\". United States Geological Survey. 2001. http://egsc.usgs.gov/isb/pubs/booklets/elvadist/elvadist.html. Retrieved October 24, 2011.", "dab_title": "Ohio", "title": null}, {"text": "Companies", "dab_title": "Ohio", "title": "List of companies of the United States"}, {"text": "Knox", "dab_title": "Ohio", "title": "Knox County, Ohio"}, {"text": "List of Ohio railroads", "dab_title": "Ohio", "title": "List of Ohio railroads"}, {"text": "Urbana (home of Urbana University)", "dab_title": "Ohio", "title": "Urbana, Ohio"}, {"text": "^ \"GCT-T1 Ohio County Population Estimates\u20142005\", The United States Census Bureau, retrieved January 3, 2006. True summation of Ohio Appalachia counties population (1,476,384) obtained by adding the 29 individual county populations together (July 1, 2005 data). Percentage obtained by dividing that number into that table's estimate of Ohio population as of July 1, 2005 (11,464,042)", "dab_title": "Ohio", "title": null}, {"text": "Canton Bulldogs (NFL) (1920\u20131923 and 1925\u20131926)", "dab_title": "Ohio", "title": "Canton Bulldogs"}, {"text": "National Security Agency", "dab_title": "Ohio", "title": "National Security Agency"}, {"text": "Hocking", "dab_title": "Ohio", "title": "Hocking County, Ohio"}, {"text": "v", "dab_title": "Ohio", "title": "Template:Ohio"}, {"text": "Maine", "dab_title": "Ohio", "title": "Maine"}, {"text": "Pennsylvania", "dab_title": "Ohio", "title": "Pennsylvania"}, {"text": "State wildflower: Large white trillium (Trillium grandiflorum) (1986)[132]", "dab_title": "Ohio", "title": "Trillium grandiflorum"}, {"text": "Folklore", "dab_title": "Ohio", "title": "Folklore of the United States"}, {"text": "Maryland", "dab_title": "Ohio", "title": "Maryland"}, {"text": "Perry", "dab_title": "Ohio", "title": "Perry County, Ohio"}, {"text": "Demographic", "dab_title": "Ohio", "title": "Demographic history of the United States"}, {"text": "State of Ohio Official Website", "dab_title": "Ohio", "title": null}, {"text": "Homeownership", "dab_title": "Ohio", "title": "Homeownership in the United States"}, {"text": "Tennessee", "dab_title": "Ohio", "title": "Tennessee"}, {"text": "Roaring Twenties", "dab_title": "Ohio", "title": "Roaring Twenties"}, {"text": "People", "dab_title": "Ohio", "title": "List of people from Ohio"}, {"text": "Great Plains", "dab_title": "Ohio", "title": "Great Plains"}, {"text": "Code of Federal Regulations", "dab_title": "Ohio", "title": "Code of Federal Regulations"}, {"text": "Government", "dab_title": "Ohio", "title": "Government of Ohio"}, {"text": "Ashland (home of Ashland University)", "dab_title": "Ohio", "title": "Ashland, Ohio"}, {"text": "e", "dab_title": "Ohio", "title": null}, {"text": "Cuyahoga County Public Library (Second)", "dab_title": "Ohio", "title": "Cuyahoga County Public Library"}, {"text": "Ideologies", "dab_title": "Ohio", "title": "Political ideologies in the United States"}, {"text": "Financial position", "dab_title": "Ohio", "title": "Financial position of the United States"}, {"text": "Columbiana", "dab_title": "Ohio", "title": "Columbiana County, Ohio"}, {"text": "Cleveland Barons (NHL) (1976\u20131978)", "dab_title": "Ohio", "title": "Cleveland Barons (NHL)"}, {"text": "Irish (14.8%);", "dab_title": "Ohio", "title": "Irish American"}, {"text": "^ \n\"All-Time Temperature Maximums By State (2003)\" (PDF). National Climatic Data Center. http://www.ncdc.noaa.gov/oa/pub/data/special/maxtemps.pdf. Retrieved November 7, 2006.", "dab_title": "Ohio", "title": null}, {"text": "Army", "dab_title": "Ohio", "title": "United States Army"}, {"text": "Cleveland Spiders (AA-NL) (1887\u20131899)", "dab_title": "Ohio", "title": "Cleveland Spiders"}, {"text": "^ Statewide Library Scoring", "dab_title": "Ohio", "title": null}, {"text": "Michael B. Coleman (D) (Columbus)", "dab_title": "Ohio", "title": "Michael B. Coleman"}, {"text": "Alabama", "dab_title": "Ohio", "title": "Alabama"}, {"text": "List of people from Ohio", "dab_title": "Ohio", "title": "List of people from Ohio"}, {"text": "Philosophy", "dab_title": "Ohio", "title": "American philosophy"}, {"text": "Massachusetts", "dab_title": "Ohio", "title": "Massachusetts"}, {"text": "Putnam", "dab_title": "Ohio", "title": "Putnam County, Ohio"}, {"text": "Technological and industrial", "dab_title": "Ohio", "title": "Technological and industrial history of the United States"}, {"text": "Ohio at the Open Directory Project", "dab_title": "Ohio", "title": null}, {"text": "Poverty", "dab_title": "Ohio", "title": "Poverty in the United States"}, {"text": "Washington", "dab_title": "Ohio", "title": "Washington (state)"}, {"text": "Great Depression", "dab_title": "Ohio", "title": "Great Depression"}, {"text": "Mansfield", "dab_title": "Ohio", "title": "Mansfield, Ohio"}, {"text": "Northwestern", "dab_title": "Ohio", "title": "Northwestern United States"}, {"text": "Cambridge", "dab_title": "Ohio", "title": "Cambridge, Ohio"}, {"text": "Colorado", "dab_title": "Ohio", "title": "Colorado"}, {"text": "^ a b c \"Ohio ACS Demographic and Housing Estimates: 2005\u20132007\". United States Census Bureau. 2007. http://factfinder.census.gov/servlet/ADPTable?_bm=y&-context=adp&-qr_name=ACS_2007_3YR_G00_DP3YR5&-ds_name=ACS_2007_3YR_G00_&-tree_id=3307&-redoLog=true&-_caller=geoselect&-geo_id=04000US39&-format=&-_lang=en. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "Electoral College", "dab_title": "Ohio", "title": "Electoral College (United States)"}, {"text": "Defiance", "dab_title": "Ohio", "title": "Defiance County, Ohio"}, {"text": "^ \"Ohio General Assembly\". Ohio History Central. July 1, 2005. http://www.ohiohistorycentral.org/entry.php?rec=2126. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "^ \"Herb Capital of Ohio\". Ohio Historical Society. July 1, 2005. http://www.ohiohistorycentral.org/entry.php?rec=1871. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "^ Historic Earthquakes: Northeast Ohio, U.S. Geological Survey.", "dab_title": "Ohio", "title": null}, {"text": "State governments", "dab_title": "Ohio", "title": "State governments of the United States"}, {"text": "Athens", "dab_title": "Ohio", "title": "Athens County, Ohio"}, {"text": "^ Griffith, Grant (2007). \"Legend of the Cincinnati Red Stockings\". Cincinnati Vintage Base Ball Club. http://www.1869reds.com/history/. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "Wood", "dab_title": "Ohio", "title": "Wood County, Ohio"}, {"text": "^ \"State Nicknames \u2013 Nicknames of U.S. States\". Geography.about.com. http://geography.about.com/od/specificplacesofinterest/a/statenicknames.htm. Retrieved 2010-07-02.", "dab_title": "Ohio", "title": null}, {"text": "Elyria", "dab_title": "Ohio", "title": "Elyria, Ohio"}, {"text": "Education", "dab_title": "Ohio", "title": "Education in the United States"}, {"text": "Michigan", "dab_title": "Ohio", "title": "Michigan"}, {"text": "^ Balistreri, Kelly (2001-02). \"Ohio Population News: Why did Ohio lose a seat in the U.S. House of Representatives?\" (PDF). Center for Family and Demographic Research at Bowling Green State University. http://www.bgsu.edu/downloads/cas/file36222.pdf. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "Seneca", "dab_title": "Ohio", "title": "Seneca County, Ohio"}, {"text": "^ a b \"Ohio QuickFacts\". United States Census Bureau. February 20, 2009. http://quickfacts.census.gov/qfd/states/39000.html. Retrieved 2009-03-31.", "dab_title": "Ohio", "title": null}, {"text": "Lake Erie Islands", "dab_title": "Ohio", "title": "Lake Erie Islands"}, {"text": "Art", "dab_title": "Ohio", "title": "Visual art of the United States"}, {"text": "Parma", "dab_title": "Ohio", "title": "Parma, Ohio"}, {"text": "Steubenville", "dab_title": "Ohio", "title": "Weirton-Steubenville Metropolitan Statistical Area"}, {"text": "Guam", "dab_title": "Ohio", "title": "Guam"}, {"text": "World War II (Home front)", "dab_title": "Ohio", "title": "Military history of the United States during World War II"}, {"text": "Rivers\n Colorado\n Columbia\n Mississippi\n Missouri\n Ohio\n Rio Grande", "dab_title": "Ohio", "title": "List of rivers of the United States"}, {"text": "Mercer", "dab_title": "Ohio", "title": "Mercer County, Ohio"}, {"text": "Dayton", "dab_title": "Ohio", "title": "Dayton, Ohio"}, {"text": "Mount Vernon (home of Mount Vernon Nazarene University)", "dab_title": "Ohio", "title": "Mount Vernon, Ohio"}, {"text": "Oklahoma", "dab_title": "Ohio", "title": "Oklahoma"}, {"text": "Shawnee State University, Portsmouth, Ohio", "dab_title": "Ohio", "title": "Shawnee State University"}, {"text": "Islands", "dab_title": "Ohio", "title": "List of islands of the United States"}, {"text": "Delaware", "dab_title": "Ohio", "title": "Delaware"}, {"text": "Franklin", "dab_title": "Ohio", "title": "Franklin County, Ohio"}, {"text": "^ \"Constitution Online\". Ohio General Assembly. 2009. http://www.legislature.state.oh.us/constitution.cfm?Part=4&Section=02. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "^ Catalog of Ohio Earthquakes, at the Ohio Department of Natural Resources web site", "dab_title": "Ohio", "title": null}, {"text": "Divisions", "dab_title": "Ohio", "title": "Political divisions of the United States"}, {"text": "Allen", "dab_title": "Ohio", "title": "Allen County, Ohio"}, {"text": "^ \"Mahoning Valley Scrappers\". Minor League Baseball. http://web.minorleaguebaseball.com/index.jsp?sid=t545. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "Washington", "dab_title": "Ohio", "title": "Washington County, Ohio"}, {"text": "^ a b Knepper (1989), p. 9.", "dab_title": "Ohio", "title": null}, {"text": "Alaska", "dab_title": "Ohio", "title": "Alaska"}, {"text": "Lorain", "dab_title": "Ohio", "title": "Lorain, Ohio"}, {"text": "Languages\n American English\n Spanish\n French", "dab_title": "Ohio", "title": "Languages of the United States"}, {"text": "Minnesota", "dab_title": "Ohio", "title": "Minnesota"}, {"text": "Tuscarawas", "dab_title": "Ohio", "title": "Tuscarawas County, Ohio"}, {"text": "State fossil: Isotelus maximus, a trilobite (1985)[132]", "dab_title": "Ohio", "title": "Isotelus"}, {"text": "Executive Office", "dab_title": "Ohio", "title": "Executive Office of the President of the United States"}, {"text": "Akron", "dab_title": "Ohio", "title": "Akron metropolitan area"}, {"text": "Crime", "dab_title": "Ohio", "title": "Crime in the United States"}, {"text": "Cleveland (home of Cleveland State University, Playhouse Square Center, The Cleveland Museum of Art, The Cleveland Orchestra, Case Western Reserve University, The Cleveland Clinic, Rock and Roll Hall of Fame, Forest City Enterprises, and University Hospitals)", "dab_title": "Ohio", "title": "Cleveland"}, {"text": "Springfield", "dab_title": "Ohio", "title": "Springfield, Ohio"}, {"text": "Bellefontaine", "dab_title": "Ohio", "title": "Bellefontaine, Ohio"}, {"text": "Howland Island", "dab_title": "Ohio", "title": "Howland Island"}, {"text": "82.8% White (non-Hispanic);", "dab_title": "Ohio", "title": "White (people)"}, {"text": "Newark", "dab_title": "Ohio", "title": "Newark, Ohio"}, {"text": "Ohio", "dab_title": "Ohio", "title": "Ohio River"}, {"text": "Lorain", "dab_title": "Ohio", "title": "Lorain County, Ohio"}, {"text": "Van Wert", "dab_title": "Ohio", "title": "Van Wert, Ohio"}, {"text": "^ \"About\". Salamanca Cigarette Outlet. http://salamancaoutlet.com/?page=shop/about. Retrieved 2007-02-25.", "dab_title": "Ohio", "title": null}, {"text": "Oregon", "dab_title": "Ohio", "title": "Oregon"}, {"text": "Cabinet / Executive departments", "dab_title": "Ohio", "title": "Cabinet of the United States"}, {"text": "Guernsey", "dab_title": "Ohio", "title": "Guernsey County, Ohio"}, {"text": "^ a b \"How the Senate Works\". Ohio Senate. http://www.senate.state.oh.us/how/. Retrieved 2009-03-25.\u00a0[dead link]", "dab_title": "Ohio", "title": null}, {"text": "^ a b Knepper (1989), p. 11.", "dab_title": "Ohio", "title": null}, {"text": "Uncle Sam", "dab_title": "Ohio", "title": "Uncle Sam"}, {"text": "Cleveland", "dab_title": "Ohio", "title": "Greater Cleveland"}, {"text": "Montgomery", "dab_title": "Ohio", "title": "Montgomery County, Ohio"}, {"text": "0.2% Native American/Alaskan Native", "dab_title": "Ohio", "title": "Alaskan Native"}, {"text": "Arizona", "dab_title": "Ohio", "title": "Arizona"}, {"text": "Media", "dab_title": "Ohio", "title": "Media of the United States"}, {"text": "Mississippi", "dab_title": "Ohio", "title": "Mississippi"}, {"text": "Economy", "dab_title": "Ohio", "title": "Economy of Ohio"}, {"text": "Indian Wars", "dab_title": "Ohio", "title": "American Indian Wars"}, {"text": "Black Swamp", "dab_title": "Ohio", "title": "Great Black Swamp"}, {"text": "Regions\n Great Plains\n Mid-Atlantic\n Midwestern\n New England\n Northwestern\n Southern\n Southwestern\n Pacific\n Western", "dab_title": "Ohio", "title": "List of regions of the United States"}, {"text": "Navassa Island", "dab_title": "Ohio", "title": "Navassa Island"}, {"text": "Korean War", "dab_title": "Ohio", "title": "Korean War"}, {"text": "Banking", "dab_title": "Ohio", "title": "Banking in the United States"}, {"text": "Lawrence", "dab_title": "Ohio", "title": "Lawrence County, Ohio"}, {"text": "State herb capital: Gahanna (1972)[134]", "dab_title": "Ohio", "title": "Gahanna, Ohio"}, {"text": "^ a b Pollard, Kelvin (2008). \"Swing, Bellwether, and Red and Blue States\". Population Reference Bureau. http://www.prb.org/Articles/2008/electiondemographics.aspx. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "^ Historic United States Earthquakes: Ohio, U.S. Geological Survey.", "dab_title": "Ohio", "title": null}, {"text": "Central Intelligence Agency", "dab_title": "Ohio", "title": "Central Intelligence Agency"}, {"text": "Henry", "dab_title": "Ohio", "title": "Henry County, Ohio"}, {"text": "Knepper, George W. (1989). Ohio and Its People. Kent, OH: Kent State University Press. ISBN 978-0-87338-791-0", "dab_title": "Ohio", "title": null}, {"text": "^ \"Pontiac's Rebellion\", Ohio History Central, July 1, 2005.", "dab_title": "Ohio", "title": null}, {"text": "German (28.9%);", "dab_title": "Ohio", "title": "German American"}, {"text": "Lima", "dab_title": "Ohio", "title": "Lima-Van Wert-Wapakoneta, OH Combined Statistical Area"}, {"text": "Music", "dab_title": "Ohio", "title": "Music of the United States"}, {"text": "Ottawa", "dab_title": "Ohio", "title": "Ottawa County, Ohio"}, {"text": "French", "dab_title": "Ohio", "title": "French in the United States"}, {"text": "^ \"Business Tax Index 2009\", SMALL BUSINESS & ENTREPRENEURSHIP COUNCIL. Retrieved December 2, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Ohio Earthquake Information", "dab_title": "Ohio", "title": null}, {"text": "Educational attainment", "dab_title": "Ohio", "title": "Educational attainment in the United States"}, {"text": "South Carolina", "dab_title": "Ohio", "title": "South Carolina"}, {"text": "Portal", "dab_title": "Ohio", "title": "Portal:Ohio"}, {"text": "Rocky", "dab_title": "Ohio", "title": "Rocky Mountains"}, {"text": "Coshocton", "dab_title": "Ohio", "title": "Coshocton, Ohio"}, {"text": "^ Knepper (1989), pp. 14\u201317.", "dab_title": "Ohio", "title": null}, {"text": "American Revolution (War)", "dab_title": "Ohio", "title": "American Revolution"}, {"text": "Historic Ohio Canals", "dab_title": "Ohio", "title": "Historic Ohio Canals"}, {"text": "Federal Budget", "dab_title": "Ohio", "title": "United States federal budget"}, {"text": "Clermont", "dab_title": "Ohio", "title": "Clermont County, Ohio"}, {"text": "Space Race", "dab_title": "Ohio", "title": "Space Race"}, {"text": "Wooster (home of The College of Wooster)", "dab_title": "Ohio", "title": "Wooster, Ohio"}, {"text": "^ Historic Earthquakes: Near Lima, Ohio, U.S. Geological Survey.", "dab_title": "Ohio", "title": null}, {"text": "^ \"Ohio Attorney General\". Ohio Attorney General. http://ohioattorneygeneral.gov/citizen/kids/ohio.asp. Retrieved 2009-07-06.", "dab_title": "Ohio", "title": null}, {"text": "Air Force", "dab_title": "Ohio", "title": "United States Air Force"}, {"text": "Republican Party", "dab_title": "Ohio", "title": "Republican Party (United States)"}, {"text": "^ Nash, James (December 7, 2008). \"Kilroy is Headed to Congress\". Columbus Dispatch. http://www.columbusdispatch.com/live/content/local_news/stories/2008/12/07/election.html?sid=101. Retrieved 2009-03-29.", "dab_title": "Ohio", "title": null}, {"text": "Mark Mallory (D) (Cincinnati)", "dab_title": "Ohio", "title": "Mark Mallory"}, {"text": "Northeast Ohio", "dab_title": "Ohio", "title": "Northeast Ohio"}, {"text": "^ \"The Date of Ohio Statehood\", Frederick J. Blue, PhD, Ohio Academy of History Newsletter, Volume 23, Autumn 2002", "dab_title": "Ohio", "title": null}, {"text": "^ a b \"Why is Ohio known as the Buckeye State and why are Ohioans known as Buckeyes?\" (PDF). http://www.dnr.state.oh.us/Portals/18/education/pdf/buckeyestate.pdf. Retrieved 2008-04-21.", "dab_title": "Ohio", "title": null}, {"text": "Morgan", "dab_title": "Ohio", "title": "Morgan County, Ohio"}, {"text": "Portage", "dab_title": "Ohio", "title": "Portage County, Ohio"}, {"text": "^ \"Jobless rates fall again in southeastern Ohio\", Zanesville Times-Recorder. 23 june 2010. Retrieved 25 june 2010.", "dab_title": "Ohio", "title": null}, {"text": "U.S. Census Bureau (Ohio Quick Facts)", "dab_title": "Ohio", "title": null}, {"text": "Middle class", "dab_title": "Ohio", "title": "American middle class"}, {"text": "Montana", "dab_title": "Ohio", "title": "Montana"}, {"text": "Vermont", "dab_title": "Ohio", "title": "Vermont"}, {"text": "Delegations", "dab_title": "Ohio", "title": "United States congressional delegations from Ohio"}, {"text": "Midwestern", "dab_title": "Ohio", "title": "Midwestern United States"}, {"text": "Findlay (home of The University of Findlay)", "dab_title": "Ohio", "title": "Findlay, Ohio"}, {"text": "Dayton", "dab_title": "Ohio", "title": "Greater Dayton"}, {"text": "War of 1812", "dab_title": "Ohio", "title": "War of 1812"}, {"text": "^ \"Ohio American Community Survey Demographic and Housing Estimates: 2006\". United States Census Bureau. 2006. http://factfinder.census.gov/servlet/ADPTable?_bm=y&-context=adp&-qr_name=ACS_2006_EST_G00_DP5&-ds_name=ACS_2006_EST_G00_&-tree_id=306&-redoLog=true&-_caller=geoselect&-geo_id=04000US39&-format=&-_lang=en. Retrieved 2009-03-26.", "dab_title": "Ohio", "title": null}, {"text": "African-American Civil Rights Movement (1955\u20131968)", "dab_title": "Ohio", "title": "African-American Civil Rights Movement (1955\u20131968)"}, {"text": "Cuyahoga", "dab_title": "Ohio", "title": "Cuyahoga County, Ohio"}, {"text": "State motto: \"With God all things are possible.\" (1959)[135]", "dab_title": "Ohio", "title": null}, {"text": "Idaho", "dab_title": "Ohio", "title": "Idaho"}, {"text": "^ a b c \"Constitution Online\". Ohio General Assembly. http://www.legislature.state.oh.us/constitution.cfm?Part=3&Section=01. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "National Guard", "dab_title": "Ohio", "title": "National Guard of the United States"}, {"text": "Cincinnati Stingers (WHA) (1975\u20131979).", "dab_title": "Ohio", "title": "Cincinnati Stingers"}, {"text": "Interpretation of \"Separation of church and state\"", "dab_title": "Ohio", "title": "Separation of church and state in the United States"}, {"text": "v", "dab_title": "Ohio", "title": "Template:Ohio cities and mayors of 100,000 population"}, {"text": "^ Morris (1992), pp. 10\u201311.", "dab_title": "Ohio", "title": null}, {"text": "Cuyahoga Falls", "dab_title": "Ohio", "title": "Cuyahoga Falls, Ohio"}, {"text": "Dance", "dab_title": "Ohio", "title": "Dance in the United States"}, {"text": "Sandusky", "dab_title": "Ohio", "title": "Sandusky County, Ohio"}, {"text": "Bucyrus", "dab_title": "Ohio", "title": "Bucyrus, Ohio"}, {"text": "^ \"Lottery Results\" (SHTML). Office of Citizen Services and Communications, General Services Administration. http://www.usa.gov/Topics/Lottery_Results.shtml. Retrieved 2009-03-31.", "dab_title": "Ohio", "title": null}, {"text": "The Bluegrass", "dab_title": "Ohio", "title": "Bluegrass region"}, {"text": "Wealth", "dab_title": "Ohio", "title": "Wealth in the United States"}, {"text": "Wyoming", "dab_title": "Ohio", "title": "Wyoming"}, {"text": "State flower: Red carnation (1904)[132]", "dab_title": "Ohio", "title": "Carnation"}, {"text": "Visitor Attractions", "dab_title": "Ohio", "title": "Category:Visitor attractions in Ohio"}, {"text": "Pacific", "dab_title": "Ohio", "title": "Pacific States"}, {"text": "East Liverpool-Salem", "dab_title": "Ohio", "title": "East Liverpool, Ohio"}, {"text": "^ \"Quick Facts About the State of Ohio\". Ohio History Central. http://www.ohiohistorycentral.org/ohio_quick_facts.php. Retrieved 2010-07-02.", "dab_title": "Ohio", "title": null}, {"text": "Ohio University, Athens, Ohio", "dab_title": "Ohio", "title": "Ohio University"}, {"text": "Feminist Movement", "dab_title": "Ohio", "title": "Second-wave feminism"}, {"text": "Fairfield", "dab_title": "Ohio", "title": "Fairfield County, Ohio"}, {"text": "^ \"Constitution Online\". Ohio General Assembly. http://www.legislature.state.oh.us/constitution.cfm?Part=3&Section=01b. Retrieved 2009-03-25.", "dab_title": "Ohio", "title": null}, {"text": "^ The Ohio Seismic Network", "dab_title": "Ohio", "title": null}, {"text": "Dept. of Health & Human Services\n Public Health Service Corps", "dab_title": "Ohio", "title": "United States Department of Health and Human Services"}, {"text": "Cleveland Rockers (WNBA) (1997\u20132003)", "dab_title": "Ohio", "title": "Cleveland Rockers"}, {"text": "^ \"Major League Soccer Teams\". Major League Soccer. http://www.mlsnet.com/teams/. Retrieved 2009-03-28.\u00a0[dead link]", "dab_title": "Ohio", "title": null}, {"text": "Williams", "dab_title": "Ohio", "title": "Williams County, Ohio"}, {"text": "^ \"Census of Population: 1970, Part 37 \u2013 Ohio, Section 1\" (PDF). United States Census Bureau. 1970. http://www2.census.gov/prod2/decennial/documents/1970a_oh1-01.pdf. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "Middletown", "dab_title": "Ohio", "title": "Middletown, Ohio"}, {"text": "Kettering", "dab_title": "Ohio", "title": "Kettering, Ohio"}, {"text": "Health insurance", "dab_title": "Ohio", "title": "Health insurance in the United States"}, {"text": "Summit", "dab_title": "Ohio", "title": "Summit County, Ohio"}, {"text": "Religion", "dab_title": "Ohio", "title": "Religion in the United States"}, {"text": "^ \"About the Ohio Lottery\". Ohio Lottery Commission. 2008. http://www.ohiolottery.com/about/about_us.html. Retrieved 2009-03-31.", "dab_title": "Ohio", "title": null}, {"text": "Demographics", "dab_title": "Ohio", "title": "Ohio"}, {"text": "Environmental movement", "dab_title": "Ohio", "title": "Environmental movement in the United States"}, {"text": "Nevada", "dab_title": "Ohio", "title": "Nevada"}, {"text": "U.S. Virgin Islands", "dab_title": "Ohio", "title": "United States Virgin Islands"}, {"text": "Polish (8.4%);", "dab_title": "Ohio", "title": "Polish American"}, {"text": "^ a b \"Percent of People Who Are Foreign Born: 2007\". United States Census Bureau. 2007. http://factfinder.census.gov/servlet/ThematicMapFramesetServlet?_bm=y&-geo_id=01000US&-tm_name=ACS_2007_3YR_G00_M00615&-ds_name=ACS_2007_3YR_G00_&-_MapEvent=displayBy&-_dBy=040#?426,247. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "Mississippi", "dab_title": "Ohio", "title": "Mississippi River"}, {"text": "Madison", "dab_title": "Ohio", "title": "Madison County, Ohio"}, {"text": "Greenville", "dab_title": "Ohio", "title": "Greenville, Ohio"}, {"text": "^ Harvey, Christopher. \"Seneca\". Languagegeek. http://www.languagegeek.com/rotinonhsonni/seneca.html. Retrieved 2007-02-25.", "dab_title": "Ohio", "title": null}, {"text": "University of Toledo College of Medicine (formerly Medical University of Ohio)", "dab_title": "Ohio", "title": "University of Toledo Medical Center"}, {"text": "Vietnam War", "dab_title": "Ohio", "title": "Vietnam War"}, {"text": "Geauga", "dab_title": "Ohio", "title": "Geauga County, Ohio"}, {"text": "^ \" A grain of sand for your thoughts\", The Economist, December 20, 2005. Retrieved December 23, 2005.", "dab_title": "Ohio", "title": null}, {"text": "^ Knepper (1989), pp. 43\u201344.", "dab_title": "Ohio", "title": null}, {"text": "^ \"SMALL BUSINESS SURVIVAL INDEX 2009\", SMALL BUSINESS & ENTREPRENEURSHIP COUNCIL. Retrieved December 2, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Parties\n Democratic Party\n Republican Party\n Third parties", "dab_title": "Ohio", "title": "Political parties in the United States"}, {"text": "State reptile: Black racer snake (1995)[132]", "dab_title": "Ohio", "title": "Coluber constrictor"}, {"text": "^ \"Ohio's State Rock Song\". Ohio Historical Society. July 1, 2005. http://www.ohiohistorycentral.org/entry.php?rec=1878. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "Miami", "dab_title": "Ohio", "title": "Miami County, Ohio"}, {"text": "Abortion", "dab_title": "Ohio", "title": "Abortion in the United States"}, {"text": "^ a b c \"United States ACS Demographic and Housing Estimates: 2005-200\". United States Census Bureau. 2007. http://factfinder.census.gov/servlet/ADPTable?_bm=y&-qr_name=ACS_2007_3YR_G00_DP3YR5&-geo_id=01000US&-ds_name=&-_lang=en&-redoLog=false&-format=. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "^ \"NHL Teams\". National Hockey League. http://www.nhl.com/ice/teams.htm. Retrieved 2009-03-28.", "dab_title": "Ohio", "title": null}, {"text": "^ a b \"Sherrod Brown\". Washington Post. http://projects.washingtonpost.com/congress/members/b000944/. Retrieved 2009-03-27.", "dab_title": "Ohio", "title": null}, {"text": "Spanish", "dab_title": "Ohio", "title": "Spanish language in the United States"}, {"text": "Drug policy", "dab_title": "Ohio", "title": "Drug policy of the United States"}, {"text": "Gilded Age", "dab_title": "Ohio", "title": "Gilded Age"}, {"text": "Cincinnati Red Stockings (NL) (1876\u20131880)", "dab_title": "Ohio", "title": "Cincinnati Red Stockings"}, {"text": "Trade", "dab_title": "Ohio", "title": "Foreign trade of the United States"}, {"text": "Exceptionalism", "dab_title": "Ohio", "title": "American exceptionalism"}, {"text": "Mansfield (home of North Central State College and Mansfield Motorsports Park)", "dab_title": "Ohio", "title": "Mansfield, Ohio"}, {"text": "New Hampshire", "dab_title": "Ohio", "title": "New Hampshire"}, {"text": "Kingman Reef", "dab_title": "Ohio", "title": "Kingman Reef"}, {"text": "1.5% Asian/Pacific Islander", "dab_title": "Ohio", "title": "Asian people"}, {"text": "Water supply and sanitation", "dab_title": "Ohio", "title": "Water supply and sanitation in the United States"}, {"text": "Logan", "dab_title": "Ohio", "title": "Logan County, Ohio"}, {"text": "Oxford (home of Miami University)", "dab_title": "Ohio", "title": "Oxford, Ohio"}, {"text": "Arkansas", "dab_title": "Ohio", "title": "Arkansas"}, {"text": "University of Cincinnati College of Medicine", "dab_title": "Ohio", "title": "University of Cincinnati"}, {"text": "Post-Cold War (1991\u2013present)", "dab_title": "Ohio", "title": "History of the United States (1991\u2013present)"}, {"text": "Crawford", "dab_title": "Ohio", "title": "Crawford County, Ohio"}, {"text": "Ironton", "dab_title": "Ohio", "title": "Huntington\u2013Ashland, WV\u2013KY\u2013OH, Metropolitan Statistical Area"}, {"text": "Hardin", "dab_title": "Ohio", "title": "Hardin County, Ohio"}, {"text": "^ a b Heinrichs, Ann (2003). Ohio. Minneapolis, M.N.: Compass Point Books. p.\u00a042. ISBN\u00a00-7565-0316-7. http://books.google.com/?id=VTnyaU2WkmUC&pg=PT43&lpg=PT43&dq=ohio+seven+presidents.", "dab_title": "Ohio", "title": null}, {"text": "Nebraska", "dab_title": "Ohio", "title": "Nebraska"}, {"text": "Political status of Puerto Rico", "dab_title": "Ohio", "title": "Political status of Puerto Rico"}, {"text": "Outline of Ohio", "dab_title": "Ohio", "title": "Outline of Ohio"}, {"text": "Muskingum", "dab_title": "Ohio", "title": "Muskingum County, Ohio"}, {"text": "^ \"The Best States For Business\", Forbes. Retrieved December 2, 2009.", "dab_title": "Ohio", "title": null}, {"text": "Geographic data related to Ohio at OpenStreetMap", "dab_title": "Ohio", "title": null}, {"text": "Sports", "dab_title": "Ohio", "title": "Sports in the United States"}, {"text": "Federalist Era", "dab_title": "Ohio", "title": "Federalist Era"}, {"text": "e", "dab_title": "Ohio", "title": null}], "context": "<tr class=\"dab-context\"><td> 201 </td>\n<td style=\"text-align:center;\"> Blown Job (a.k.a. Blown Away) </td>\n<td style=\"text-align:center;\"> August 11, 2007 </td>\n<td style=\"text-align:center;\"> <a href=\"/wiki/Miami,_Ohio\" title=\"Miami, Ohio\">Miami</a>, <a href=\"/wiki/Ohio\" title=\"Ohio\" class=\"dab-link\">OH</a><sup class=\"plainlinks noprint Inline-Template\" style=\"vertical-align:text-top;white-space:nowrap;\">[<i><a rel=\"nofollow\" class=\"external text\" href=\"//toolserver.org/%7Edispenser/cgi-bin/dab_solver.py?page=1000_Ways_to_Die_(season_1)&amp;editintro=Template:Disambiguation_needed/editintro&amp;client=Template:Dn\"><span title=\"Link needs disambiguation from June 2011\">disambiguation needed</span>\u00a0<img alt=\"\" src=\"//upload.wikimedia.org/wikipedia/commons/d/d1/InterlanguageLinks-Asset-Pencil-Hover.gif\" width=\"10\" height=\"10\"></a></i>]</sup></td>\n<td style=\"text-align:center;\"> A disgruntled, <a href=\"/wiki/Alcoholism\" title=\"Alcoholism\">alcoholic</a> clown, who ironically was <a href=\"/wiki/Coulrophobia\" title=\"Coulrophobia\">coulrophobic</a> as a child, drives to a birthday party for his next job. When he stops short in front of the party, a canister of <a href=\"/wiki/Carbon_dioxide\" title=\"Carbon dioxide\">CO<sub>2</sub></a> rolls up against his seat, inflating a giant balloon while he is still in the car. He is too drunk to sense the danger until it is too late, and dies when the balloon presses him against the windshield and he <a href=\"/wiki/Asphyxia\" title=\"Asphyxia\">suffocates</a>.\n</td></tr>", "title": "Ohio"}]}
-    return dabs
+    "The sample dabs, read from FAKE_DABS_PATH the first time they're needed."
+    if 'dabs' not in _fake_dabs:
+        _fake_dabs['dabs'] = json.loads(_fake_dabs_json())
+    return _fake_dabs['dabs']
+
+@route('/fake/')
+def serve_fake_dabs():
+    return bottle_jsonp.RawJSON(_fake_dabs_json())
 
 @route('/prepare/')
 def preapre_dabs():
-    dabs = dabnabbit.get_random_dabblets(count=5)
-    return {'dabs': [d._asdict() for d in dabs]}
+    payloads = dabase.get_random_payloads(count=5)
+    dabase.record_served(len(payloads))
+    return bottle_jsonp.RawJSON('{"dabs": [%s]}' % ', '.join(payloads))
+
+@route('/solve/', method='POST')
+def solve_dab():
+    "Queues a dabblet_id and choice_id for write_solutions() to commit."
+    try:
+        dabblet_id = int(request.forms.get('dabblet_id'))
+        choice_id = int(request.forms.get('choice_id'))
+    except (TypeError, ValueError):
+        abort(400, 'dabblet_id and choice_id are required')
+    solution_q.put(dabase.DabbletSolution(dabblet     = dabblet_id,
+                                          choice      = choice_id,
+                                          solver_ip   = request.remote_addr or '',
+                                          date_solved = datetime.now()))
+    return {'queued': True}
+
+@route('/stats/')
+def get_stats():
+    return dabase.get_stats()
+
+@route('/metrics/')
+def get_metrics():
+    return dabmetrics.snapshot()
+
+
+def refill_pool():
+    """
+    Harvests unharvested category members whenever the pool drops below
+    POOL_LOW_WATER, so /prepare/ never waits on Wikipedia.
+    """
+    crawled.wait()
+    while True:
+        try:
+            if dabase.count_unsolved() < POOL_LOW_WATER:
+                page_ids = dabnabbit.get_dab_page_ids(count=POOL_CRAWL, unharvested=True,
+                                                      crawl=False)
+                page_ids = random.sample(page_ids, min(POOL_REFILL, len(page_ids)))
+                if page_ids:
+                    dabnabbit.harvest(page_ids=page_ids)
+        except Exception as e:
+            print 'pool refill failed:', repr(e)
+        dabase.flush_stats()
+        gevent.sleep(POOL_CHECK_SECS)
+
+
+def crawl_categories():
+    "Brings the stored dab category members up to date every CRAWL_SECS."
+    while True:
+        try:
+            dabnabbit.update_category_tree(dabnabbit.DAB_CATEGORY)
+        except Exception as e:
+            print 'category crawl failed:', repr(e)
+        finally:
+            crawled.set()
+        gevent.sleep(CRAWL_SECS)
+
+
+def validate_pool():
+    "Drops dabblets whose source page has changed, see dabnabbit.check_sources()."
+    while True:
+        gevent.sleep(VALIDATE_SECS)
+        try:
+            dabnabbit.check_sources()
+        except Exception as e:
+            print 'pool validation failed:', repr(e)
+
+
+def write_solutions():
+    "Group-commits queued solutions, SOLUTION_BATCH at a time at most."
+    while True:
+        batch = [solution_q.get()]
+        gevent.sleep(SOLUTION_WAIT)
+        while len(batch) < SOLUTION_BATCH:
+            try:
+                batch.append(solution_q.get_nowait())
+            except Empty:
+                break
+        try:
+            with dabmetrics.timed('solution_commit'):
+                solved = dabase.save_solutions(batch)
+            if write_back_q is not None:
+                queue_write_back(solved)
+        except Exception as e:
+            print 'saving', len(batch), 'solutions failed:', repr(e)
+
+
+def queue_write_back(solved):
+    "Takes save_solutions()'s {dabblet id: choice id} to write_back_q."
+    if not solved:
+        return
+    dabblets = dabase.Dabblet.select().where(id__in=solved.keys())
+    choices = dict([ (c.id, c.title) for c in
+                     dabase.DabChoice.select(['id', 'title'])
+                                     .where(id__in=solved.values()) ])
+    for d in dabblets:
+        write_back_q.add(d, choices[solved[d.id]])
+
+
+def write_back():
+    """
+    Edits the solved dab links into their articles every
+    WRITE_BACK_SECS, one edit per page however many were solved.
+    """
+    while True:
+        gevent.sleep(WRITE_BACK_SECS)
+        done = write_back_q.flush()
+        try:
+            dabase.mark_written([ d.id for solutions, applied, resp in done.values()
+                                  for d, guess in solutions ])
+        except Exception as e:
+            print 'marking solutions written failed:', repr(e)
+        dabmetrics.incr('solutions_written', sum([ len(applied) for solutions, applied, resp
+                                                   in done.values() ]))
+        dabmetrics.incr('solution_edits', len([ 1 for solutions, applied, resp in done.values()
+                                                if applied ]))
+
+
+def init(db_name=DB_NAME, edit_token=EDIT_TOKEN):
+    """
+    Starts the background greenlets. Consensus solutions are only
+    written back to Wikipedia with an edit_token.
+    """
+    global write_back_q
+    dabase.init(db_name)
+    dabcache.init()
+    dabmetrics.gauge('payload_cache_size', lambda: len(dabase._payloads))
+    dabmetrics.gauge('solutions_queued', solution_q.qsize)
+    greenlets = [gevent.spawn(crawl_categories),
+                 gevent.spawn(refill_pool),
+                 gevent.spawn(validate_pool),
+                 gevent.spawn(write_solutions)]
+    if edit_token:
+        write_back_q = dabnabbit.SolutionQueue(edit_token)
+        for dabblet, guess in dabase.get_unwritten_solutions():
+            write_back_q.add(dabblet, guess)
+        dabmetrics.gauge('write_back_pages', lambda: len(write_back_q.pending))
+        greenlets.append(gevent.spawn(write_back))
+    return greenlets
+
+
+def with_timeout(app, seconds):
+    "WSGI middleware answering 503 to requests that take over seconds."
+    def timed_app(environ, start_response):
+        timeout = gevent.Timeout(seconds)
+        timeout.start()
+        try:
+            return list(app(environ, start_response))
+        except gevent.Timeout as t:
+            if t is not timeout:
+                raise
+            dabmetrics.incr('route.timeouts', path=environ.get('PATH_INFO'))
+            start_response('503 Service Unavailable',
+                           [('Content-Type', 'text/plain')], sys.exc_info())
+            return ['Timed out']
+        finally:
+            timeout.cancel()
+    return timed_app
+
+
+def serve(host=HOST, port=PORT, max_clients=MAX_CLIENTS, request_timeout=REQUEST_TIMEOUT):
+    """
+    Serves on gevent's WSGI server, a greenlet per request, at most
+    max_clients at once.
+    """
+    from gevent.pywsgi import WSGIServer
+    from gevent.pool import Pool
+    app = with_timeout(bottle.default_app(), request_timeout)
+    server = WSGIServer((host, port), app, spawn=Pool(max_clients))
+    print 'Serving on http://%s:%d/' % (host, port)
+    server.serve_forever()
+
 
-run(host='localhost', port=8080)
\ No newline at end of file
+if __name__ == '__main__':
+    init()
+    if '--dev' in sys.argv[1:]:
+        bottle.debug(True)
+        run(host=HOST, port=PORT, reloader=False)
+    else:
+        serve()
@@ -0,0 +1,267 @@
+"""
+A stand-in for the bits of the MediaWiki API that dabnabbit uses,
+seeded from the sample dabs behind dabserver's /fake/ route, so
+harvests can be run (and timed) without touching Wikipedia.
+
+    python fakewiki.py [port] [copies] [latency_ms] [error_rate]
+
+then point dabnabbit.API_URL at the URL it prints.
+"""
+import re
+import json
+import time
+import random
+import urlparse
+from cgi import escape
+
+import gevent
+from gevent.pywsgi import WSGIServer
+
+ROOT_CATEGORY = 'Category:Articles with links needing disambiguation'
+SUB_CATEGORY  = ROOT_CATEGORY + ' from June 2011'
+CATEGORY_START = 1306886400 # 2011-06-01, first member timestamp
+DAB_PAGE_IDS = 10**6
+REVID_OFFSET = 10**7
+MAX_IDS = 50 # pageids/titles per query, as for a logged out user
+# MediaWiki's is 8 MB; this is small enough that batches of sample
+# pages get cut off and continued
+MAX_RESULT_SIZE = 512 * 1024
+
+
+def article_html(dab):
+    # the fixture contexts were marked up by the extractor, undo that
+    return re.sub(r'\bdab-(link|context)\b\s*', '', dab['context'])
+
+
+def dab_page_html(options):
+    items = [ '<li><a href="/wiki/x" title="%s">%s</a></li>'
+              % (escape(o['title'], True), escape(o['text']))
+              for o in options ]
+    return ('<table id="toc"><tr><td><ul><li><a href="#x">Contents</a></li></ul></td></tr></table>'
+            '<table id="disambigbox"><tr><td>disambiguation</td></tr></table>'
+            '<ul>%s</ul>' % ''.join(items))
+
+
+def _timestamp(secs):
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(secs))
+
+
+class FakeWiki(object):
+    """
+    copies is how many times the sample articles are repeated (under
+    new titles and ids) to make a bigger category. Each request waits
+    latency seconds, give or take jitter, and then error_rate of them
+    get a 503 and maxlag_rate a maxlag error, both saying to retry
+    straight away.
+
+    Unparsed revisions come from wikitext (pageid -> text), falling
+    back to the HTML. Edits replace the wikitext, and are refused as
+    conflicts if their basetimestamp isn't the current revision's.
+
+    As on a real wiki, only the first MAX_IDS ids or titles of a query
+    are looked up, with a warning, and revisions stop at
+    max_result_size bytes of text, with an rvcontinue for the rest.
+    """
+    def __init__(self, copies=1, latency=0, jitter=0, error_rate=0,
+                 maxlag_rate=0, seed=0, max_result_size=MAX_RESULT_SIZE):
+        from dabserver import fake_dabs
+        self.max_result_size = max_result_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.maxlag_rate = maxlag_rate
+        self.random = random.Random(seed)
+        self.requests = {}
+        self.wikitext = {}
+        self.rev_times = {}
+        self.clock = CATEGORY_START + REVID_OFFSET # for edit timestamps
+
+        dabs = fake_dabs()['dabs']
+        self.pages = {}    # pageid -> (title, revid, html)
+        self.titles = {}   # title -> pageid
+        self.members = {ROOT_CATEGORY: [], SUB_CATEGORY: []}
+        self._add_page(DAB_PAGE_IDS - 2, ROOT_CATEGORY, '')
+        self._add_page(DAB_PAGE_IDS - 1, SUB_CATEGORY, '', ROOT_CATEGORY)
+
+        pageid = 1
+        for copy in range(copies):
+            for dab in dabs:
+                title = dab['page_title']
+                if copy:
+                    title = '%s (%d)' % (title, copy)
+                self._add_page(pageid, title, article_html(dab), SUB_CATEGORY)
+                pageid += 1
+        self.article_count = pageid - 1
+
+        options = {}
+        for dab in dabs:
+            options.setdefault(dab['title'], dab['options'])
+        for i, (title, opts) in enumerate(sorted(options.items())):
+            self._add_page(DAB_PAGE_IDS + i, title, dab_page_html(opts))
+
+    def _add_page(self, pageid, title, html, category=None):
+        self.pages[pageid] = (title, pageid + REVID_OFFSET, html)
+        self.titles[title] = pageid
+        self.rev_times[pageid] = _timestamp(CATEGORY_START + pageid)
+        if category:
+            added = _timestamp(CATEGORY_START + pageid)
+            self.members[category].append({'pageid':    pageid,
+                                           'ns':        14 if title.startswith('Category:') else 0,
+                                           'title':     title,
+                                           'timestamp': added})
+
+    def _lookup(self, params):
+        "(pages, normalized, warnings) for the pageids or titles asked for."
+        pages, normalized, warnings = {}, [], {}
+        for name in ('pageids', 'titles'):
+            values = params.get(name, '').split('|')
+            if len(values) > MAX_IDS:
+                warnings['query'] = {'*': 'Too many values supplied for parameter \'%s\': '
+                                          'the limit is %d' % (name, MAX_IDS)}
+                params[name] = '|'.join(values[:MAX_IDS])
+        if params.get('pageids'):
+            for pageid in params['pageids'].split('|'):
+                if int(pageid) in self.pages:
+                    pages[int(pageid)] = self.pages[int(pageid)]
+                else:
+                    pages[pageid] = None
+        else:
+            for i, title in enumerate(params.get('titles', '').split('|')):
+                norm = title.replace('_', ' ')
+                if norm != title:
+                    normalized.append({'from': title, 'to': norm})
+                if norm in self.titles:
+                    pages[self.titles[norm]] = self.pages[self.titles[norm]]
+                else:
+                    pages[-1 - i] = (norm, None, None)
+        return pages, normalized, warnings
+
+    def query(self, params):
+        if params.get('list') == 'categorymembers':
+            return self.category_members(params)
+        pages, normalized, warnings = self._lookup(params)
+        prop = params.get('prop')
+        ret = {}
+        result_size, cont = 0, None
+        start = int(params.get('rvcontinue') or 0)
+        for key, page in sorted(pages.items()):
+            if page is None or page[1] is None:
+                ret[str(key)] = {'missing': ''}
+                if page:
+                    ret[str(key)]['title'] = page[0]
+                continue
+            title, revid, html = page
+            res = {'pageid': key, 'ns': 14 if title.startswith('Category:') else 0,
+                   'title': title}
+            if prop == 'info':
+                res['lastrevid'] = revid
+            elif prop == 'revisions' and key >= start and cont is None:
+                if not params.get('rvparse'):
+                    html = self.wikitext.get(key, html)
+                if result_size and result_size + len(html) > self.max_result_size:
+                    cont = key
+                else:
+                    result_size += len(html)
+                    res['revisions'] = [{'revid':     revid,
+                                         'timestamp': self.rev_times[key],
+                                         '*':         html}]
+            elif prop == 'categoryinfo':
+                res['categoryinfo'] = {'size': len(self.members.get(title, []))}
+            ret[str(key)] = res
+        query = {'pages': ret}
+        if normalized:
+            query['normalized'] = normalized
+        resp = {'query': query}
+        if warnings:
+            resp['warnings'] = warnings
+        if cont is not None:
+            resp['query-continue'] = {'revisions': {'rvcontinue': str(cont)}}
+        return resp
+
+    def category_members(self, params):
+        start = params.get('cmstart', '')
+        members = [ m for m in self.members.get(params['cmtitle'], [])
+                    if m['timestamp'] >= start ]
+        offset = int(params.get('cmcontinue') or 0)
+        limit = int(params.get('cmlimit', 10))
+        ret = {'query': {'categorymembers': members[offset:offset+limit]}}
+        if offset + limit < len(members):
+            ret['query-continue'] = {'categorymembers': {'cmcontinue': str(offset + limit)}}
+        return ret
+
+    def parse(self, params):
+        pageid = self.titles.get(params.get('page', '').replace('_', ' '))
+        if pageid is None:
+            return {'error': {'code': 'missingtitle', 'info': 'The page you specified doesn\'t exist'}}
+        title, revid, html = self.pages[pageid]
+        return {'parse': {'title': title, 'revid': revid, 'text': {'*': html}}}
+
+    def edit(self, params):
+        pageid = self.titles.get(params.get('title', '').replace('_', ' '))
+        if pageid is None:
+            return {'error': {'code': 'missingtitle', 'info': 'The page you specified doesn\'t exist'}}
+        base = params.get('basetimestamp')
+        if base and base != self.rev_times[pageid]:
+            return {'error': {'code': 'editconflict', 'info': 'Edit conflict detected'}}
+        title, old_revid, html = self.pages[pageid]
+        new_revid = max([ p[1] for p in self.pages.values() ]) + 1
+        self.pages[pageid] = (title, new_revid, html)
+        self.wikitext[pageid] = params.get('text', '')
+        self.clock += 1
+        self.rev_times[pageid] = _timestamp(self.clock)
+        return {'edit': {'result':   'Success',
+                         'pageid':   pageid,
+                         'title':    title,
+                         'oldrevid': old_revid,
+                         'newrevid': new_revid}}
+
+    def app(self, environ, start_response):
+        params = dict(urlparse.parse_qsl(environ.get('QUERY_STRING', '')))
+        if environ.get('REQUEST_METHOD') == 'POST':
+            params.update(urlparse.parse_qsl(environ['wsgi.input'].read()))
+        action = params.get('action')
+        self.requests[action] = self.requests.get(action, 0) + 1
+
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            gevent.sleep(delay)
+
+        headers = [('Content-Type', 'application/json; charset=utf-8')]
+        roll = self.random.random()
+        if roll < self.error_rate:
+            start_response('503 Service Unavailable', headers + [('Retry-After', '0')])
+            return ['']
+        if roll < self.error_rate + self.maxlag_rate:
+            headers.append(('Retry-After', '0'))
+            res = {'error': {'code': 'maxlag', 'info': 'Waiting for a database server'}}
+        elif action == 'query':
+            res = self.query(params)
+        elif action == 'parse':
+            res = self.parse(params)
+        elif action == 'edit':
+            res = self.edit(params)
+        else:
+            res = {'error': {'code': 'unknown_action', 'info': 'Unrecognized value for parameter \'action\''}}
+        if 'error' in res:
+            headers.append(('MediaWiki-API-Error', res['error']['code']))
+        if params.get('servedby'):
+            res['servedby'] = 'fakewiki'
+        start_response('200 OK', headers)
+        return [json.dumps(res)]
+
+    def serve(self, host='127.0.0.1', port=0):
+        "Starts serving in the background, returns the API URL."
+        self.server = WSGIServer((host, port), self.app, log=None)
+        self.server.start()
+        return 'http://%s:%d/w/api.php' % (host, self.server.server_port)
+
+
+if __name__ == '__main__':
+    import sys
+    args = sys.argv[1:]
+    port = int(args[0]) if args else 8081
+    wiki = FakeWiki(copies=int(args[1]) if len(args) > 1 else 1,
+                    latency=float(args[2]) / 1000 if len(args) > 2 else 0,
+                    error_rate=float(args[3]) if len(args) > 3 else 0)
+    print wiki.article_count, 'articles at', wiki.serve(port=port)
+    wiki.server.serve_forever()